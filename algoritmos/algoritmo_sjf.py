@@ -17,25 +17,25 @@ class AlgoritmoSJF:
         return 0
 
     def seleccionar(self, candidatos, planificador=None):
-        # mantener si sigue siendo el más corto entre los elegibles
+        # Una sola pasada O(n) sobre la lista que recibe (sin ordenarla).
+        # Planificador no usa esta clase: su SJF es EstrategiaSJF (heap,
+        # O(log n) por selección) en algoritmos/estrategias.py.
+        elegibles = [p for p in candidatos if not p.esta_terminado()]
+        if not elegibles:
+            self._current = None
+            return None
+
+        # menor duración total; empate: llegada y luego orden dado (min se queda con el primero)
+        mejor = min(elegibles, key=lambda p: (self._dur(p), p.instante_llegada))
+
+        # mantener el actual si sigue siendo el más corto entre los elegibles
         if self._current is not None:
-            cur = None
-            for p in candidatos:
-                if p.pid == self._current and not p.esta_terminado():
-                    cur = p
+            min_d = self._dur(mejor)
+            for p in elegibles:
+                if p.pid == self._current:
+                    if self._dur(p) <= min_d:
+                        return p
                     break
-            if cur is not None:
-                min_d = min(self._dur(x) for x in candidatos if not x.esta_terminado())
-                if self._dur(cur) <= min_d:
-                    return cur
 
-        # Elegir por menor duración total; empate: llegada y luego orden dado
-        mejores = sorted(
-            [p for p in candidatos if not p.esta_terminado()],
-            key=lambda p: (self._dur(p), p.instante_llegada)
-        )
-        if not mejores:
-            self._current = None
-            return None
-        self._current = mejores[0].pid
-        return mejores[0]
\ No newline at end of file
+        self._current = mejor.pid
+        return mejor
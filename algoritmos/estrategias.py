@@ -0,0 +1,542 @@
+# algoritmos/estrategias.py
+"""
+Registro de estrategias de planificación para Planificador.
+
+Cada estrategia es la cola de listos de su algoritmo (una ColaListos
+indexada) más los ganchos que usa Planificador._tick:
+  on_arrival(p)        entra un proceso (llegada o alta)
+  select()             saca el próximo a ejecutar
+  on_preempt(p)        vuelve a la cola el expropiado
+  on_quantum_expired(p) vuelve a la cola el que agotó su quantum
+  on_exit(p)           p terminó (o migró a otro núcleo): no vuelve a esta cola
+  debe_expropiar(r)    ¿el mejor listo desaloja al running r? (mira el tope)
+  quantum(p, q)        ticks del turno de p cuando usa_quantum es True
+                       (quantum_propio: el turno no depende de q, p. ej. CFS)
+  on_tick(t, r)        con usa_reloj: cambios por tiempo; proximo_evento(t)
+                       le dice al modo por eventos cuándo toca el siguiente
+  estado()             estado propio serializable (RNG, pases...) para snapshot
+Con heap, deque o bitmap todos son O(1) u O(log n).
+Los parámetros propios (p. ej. niveles de MLFQ) llegan al constructor desde
+Planificador.configurar_estrategia().
+
+Las estrategias se registran por nombre con @registrar; set_algoritmo() y el
+selector de la UI usan ESTRATEGIAS, así que una clase nueva registrada aquí
+queda disponible en todos lados.
+"""
+from __future__ import annotations
+import itertools
+import operator
+import random
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Tuple, Type
+
+from logica.colas import ColaFIFO, ColaHeap, ColaListos
+
+ESTRATEGIAS: Dict[str, Type["Estrategia"]] = {}
+
+
+def registrar(cls: Type["Estrategia"]) -> Type["Estrategia"]:
+    """Decorador: registra la estrategia bajo cls.nombre."""
+    ESTRATEGIAS[cls.nombre] = cls
+    return cls
+
+
+def nombres_estrategias() -> List[str]:
+    """Nombres registrados, en orden de registro."""
+    return list(ESTRATEGIAS)
+
+
+def crear_estrategia(nombre: str, pares: Optional[List[Tuple[int, object]]] = None,
+                     estado: Optional[dict] = None, **parametros) -> "Estrategia":
+    """
+    Instancia la estrategia 'nombre', le devuelve su estado() si viene de un
+    snapshot y la carga con pares (seq, pcb) en el orden dado.
+    """
+    cola = ESTRATEGIAS[nombre](**parametros)
+    if estado:
+        cola.cargar_estado(estado)
+    ultimo = -1
+    for seq, p in pares or []:
+        cola.push(p, seq)
+        ultimo = max(ultimo, seq)
+    cola._seq = itertools.count(ultimo + 1)
+    return cola
+
+
+class Estrategia:
+    """
+    Ganchos por defecto. Cada estrategia concreta hereda además de la
+    ColaListos que le sirve de estructura de listos (ColaHeap, ColaFIFO...).
+    """
+    nombre = ""
+    usa_quantum = False
+    quantum_propio = False   # con usa_quantum: quantum(p, q) no usa q
+    usa_reloj = False
+    campo_grupo: Optional[str] = None   # campo del PCB para Planificador.promedios_por_grupo()
+
+    def on_arrival(self, p):
+        self.push(p)
+
+    def select(self):
+        return self.pop()
+
+    def on_preempt(self, p):
+        self.push(p)
+
+    def on_quantum_expired(self, p):
+        self.on_preempt(p)
+
+    def on_exit(self, p):
+        pass
+
+    def debe_expropiar(self, running) -> bool:
+        return False
+
+    def quantum(self, p, q: int) -> int:
+        return q
+
+    def on_tick(self, t: int, running):
+        pass
+
+    def proximo_evento(self, t: int) -> Optional[int]:
+        """Primer instante >= t en que on_tick cambia algo (None: nunca)."""
+        return None
+
+    def estado(self) -> dict:
+        """Estado propio (además de los procesos encolados), solo listas/números."""
+        return {}
+
+    def cargar_estado(self, estado: dict):
+        pass
+
+
+@registrar
+class EstrategiaFCFS(Estrategia, ColaHeap):
+    nombre = "FCFS"
+
+    def __init__(self):
+        super().__init__(operator.attrgetter("instante_llegada", "pid"))
+
+
+@registrar
+class EstrategiaSJF(Estrategia, ColaHeap):
+    nombre = "SJF"
+
+    def __init__(self):
+        super().__init__(operator.attrgetter("cpu_total", "instante_llegada", "pid"))
+
+
+@registrar
+class EstrategiaSRTF(Estrategia, ColaHeap):
+    nombre = "SRTF"
+
+    def __init__(self):
+        super().__init__(operator.attrgetter("cpu_restante", "instante_llegada", "pid"))
+
+    def debe_expropiar(self, running) -> bool:
+        return bool(self._h) and self.peek().cpu_restante < running.cpu_restante
+
+
+@registrar
+class EstrategiaRR(Estrategia, ColaFIFO):
+    nombre = "RR"
+    usa_quantum = True
+
+
+@registrar
+class EstrategiaMLFQ(Estrategia, ColaListos):
+    """
+    Colas multinivel con realimentación; el nivel 0 es el de más prioridad.
+    Cada nivel es un deque y un bitmap marca los niveles no vacíos, así que
+    select/peek y debe_expropiar son O(1) con cualquier cantidad de procesos.
+      - Llegada: entra al nivel 0.
+      - Agotó quantum: baja un nivel (hasta el último) y va al final.
+      - Expropiado por un nivel más alto: vuelve al frente de su nivel.
+      - Cada periodo_boost ticks (0 = nunca) todos vuelven al nivel 0.
+    El quantum del nivel i es quantums[i] o, si no se dan, q * 2**i con q
+    el quantum del planificador. El nivel vive en PCB.nivel.
+    """
+    nombre = "MLFQ"
+    usa_quantum = True
+    usa_reloj = True
+    campo_grupo = "nivel"
+
+    def __init__(self, niveles: int = 3, quantums: Optional[List[int]] = None, periodo_boost: int = 100):
+        super().__init__()
+        self.niveles = max(1, int(niveles))
+        self.quantums = [max(1, int(q)) for q in quantums] if quantums else None
+        if self.quantums:
+            # si faltan niveles se repite el último quantum
+            self.quantums += [self.quantums[-1]] * (self.niveles - len(self.quantums))
+        self.periodo_boost = max(0, int(periodo_boost))
+        self._colas: List[deque] = [deque() for _ in range(self.niveles)]
+        self._mapa = 0   # bit i encendido <=> nivel i no vacío
+        self._n = 0
+
+    def _nivel(self, p) -> int:
+        return min(p.nivel or 0, self.niveles - 1)
+
+    def _agregar(self, p, seq, al_frente: bool):
+        i = p.nivel = self._nivel(p)
+        e = (next(self._seq) if seq is None else seq, p)
+        self._colas[i].appendleft(e) if al_frente else self._colas[i].append(e)
+        self._mapa |= 1 << i
+        self._n += 1
+
+    def push(self, p, seq: Optional[int] = None):
+        self._agregar(p, seq, False)
+
+    def on_preempt(self, p):
+        self._agregar(p, None, True)
+
+    def on_quantum_expired(self, p):
+        p.nivel = self._nivel(p) + 1
+        self._agregar(p, None, False)
+
+    def pop(self):
+        i = (self._mapa & -self._mapa).bit_length() - 1
+        cola = self._colas[i]
+        p = cola.popleft()[1]
+        if not cola:
+            self._mapa &= ~(1 << i)
+        self._n -= 1
+        return p
+
+    def peek(self):
+        i = (self._mapa & -self._mapa).bit_length() - 1
+        return self._colas[i][0][1]
+
+    def debe_expropiar(self, running) -> bool:
+        # algún nivel no vacío por encima del nivel del running
+        return bool(self._mapa & ((1 << self._nivel(running)) - 1))
+
+    def quantum(self, p, q: int) -> int:
+        i = self._nivel(p)
+        return self.quantums[i] if self.quantums else q << i
+
+    def on_tick(self, t: int, running):
+        if not self.periodo_boost or t == 0 or t % self.periodo_boost:
+            return
+        # boost: todo al nivel 0 manteniendo el orden de servicio
+        base = self._colas[0]
+        for cola in self._colas[1:]:
+            for _, p in cola:
+                p.nivel = 0
+            base.extend(cola)
+            cola.clear()
+        self._mapa = 1 if self._n else 0
+        if running is not None:
+            running.nivel = 0
+
+    def proximo_evento(self, t: int) -> Optional[int]:
+        if not self.periodo_boost:
+            return None
+        return max(self.periodo_boost, -(-t // self.periodo_boost) * self.periodo_boost)
+
+    def pares(self) -> List[Tuple[int, object]]:
+        # en orden de servicio (nivel y posición): así crear_estrategia la rearma igual
+        return [e for cola in self._colas for e in cola]
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __iter__(self) -> Iterator:
+        return (p for cola in self._colas for _, p in cola)
+
+
+class _Fenwick:
+    """Árbol de Fenwick de sumas (índices 0..n-1): actualizar y buscar por suma en O(log n)."""
+    def __init__(self, pesos: List[int]):
+        n = len(pesos)
+        self.n = n
+        self.t = [0] + list(pesos)
+        for i in range(1, n + 1):
+            j = i + (i & -i)
+            if j <= n:
+                self.t[j] += self.t[i]
+        self._alto = 1 << (n.bit_length() - 1) if n else 0
+
+    def sumar(self, i: int, delta: int):
+        i += 1
+        while i <= self.n:
+            self.t[i] += delta
+            i += i & -i
+
+    def buscar(self, r: int) -> int:
+        """Menor índice cuya suma acumulada supera r (0 <= r < total)."""
+        pos, paso = 0, self._alto
+        while paso:
+            k = pos + paso
+            if k <= self.n and self.t[k] <= r:
+                pos = k
+                r -= self.t[k]
+            paso >>= 1
+        return pos
+
+
+@registrar
+class EstrategiaLoteria(Estrategia, ColaListos):
+    """
+    Planificación por lotería: en cada selección gana un proceso al azar con
+    probabilidad proporcional a sus boletos (PCB.peso, mínimo 1) y corre un
+    quantum. Los listos ocupan posiciones en orden de encolado sobre un árbol
+    de Fenwick de boletos, así que cada sorteo y cada alta cuestan O(log n).
+    El azar sale de random.Random(semilla) y su estado entra al snapshot:
+    misma semilla y misma carga => misma corrida.
+    """
+    nombre = "LOTERIA"
+    usa_quantum = True
+
+    def __init__(self, semilla: int = 0):
+        super().__init__()
+        self._rng = random.Random(semilla)
+        self._entradas: List[Optional[tuple]] = []   # (seq, pcb, boletos) o None si salió
+        self._arbol = _Fenwick([0] * 64)
+        self._total = 0
+        self._n = 0
+
+    def push(self, p, seq: Optional[int] = None):
+        if len(self._entradas) == self._arbol.n:
+            self._compactar()
+        w = max(1, p.peso)
+        self._arbol.sumar(len(self._entradas), w)
+        self._entradas.append((next(self._seq) if seq is None else seq, p, w))
+        self._total += w
+        self._n += 1
+
+    def _compactar(self):
+        """Sin lugar al final: se quitan los huecos (y se duplica si hace falta) en O(n)."""
+        vivas = [e for e in self._entradas if e is not None]
+        cap = max(64, self._arbol.n)
+        if 2 * len(vivas) > cap:
+            cap *= 2
+        self._entradas = vivas
+        self._arbol = _Fenwick([e[2] for e in vivas] + [0] * (cap - len(vivas)))
+
+    def pop(self):
+        i = self._arbol.buscar(self._rng.randrange(self._total))
+        _, p, w = self._entradas[i]
+        self._entradas[i] = None
+        self._arbol.sumar(i, -w)
+        self._total -= w
+        self._n -= 1
+        return p
+
+    def pares(self) -> List[Tuple[int, object]]:
+        return [e[:2] for e in self._entradas if e is not None]
+
+    def __len__(self) -> int:
+        return self._n
+
+    def estado(self) -> dict:
+        version, interno, gauss = self._rng.getstate()
+        return {"rng": [version, list(interno), gauss]}
+
+    def cargar_estado(self, estado: dict):
+        version, interno, gauss = estado["rng"]
+        self._rng.setstate((version, tuple(interno), gauss))
+
+
+@registrar
+class EstrategiaStride(Estrategia, ColaHeap):
+    """
+    Stride scheduling: reparto proporcional determinista. Cada proceso tiene
+    un paso = STRIDE1 // boletos (PCB.peso) y un pase; se elige el menor pase
+    (heap, O(log n)) y al agotar su quantum el pase avanza un paso. Un proceso
+    nuevo entra con el pase global (el del último elegido) más su paso, para
+    no adelantarse a los que ya venían esperando. El pase se descarta en
+    on_exit, así que _pase solo guarda los procesos vivos de esta cola.
+    """
+    nombre = "STRIDE"
+    usa_quantum = True
+    STRIDE1 = 1 << 20
+
+    def __init__(self):
+        self._pase: Dict[int, int] = {}
+        self._pase_global = 0
+        super().__init__(lambda p: (self._pase[p.pid], p.pid))
+
+    def _paso(self, p) -> int:
+        return self.STRIDE1 // max(1, p.peso)
+
+    def push(self, p, seq: Optional[int] = None):
+        if p.pid not in self._pase:
+            self._pase[p.pid] = self._pase_global + self._paso(p)
+        super().push(p, seq)
+
+    def extend(self, ps):
+        ps = list(ps)
+        for p in ps:
+            if p.pid not in self._pase:
+                self._pase[p.pid] = self._pase_global + self._paso(p)
+        super().extend(ps)
+
+    def pop(self):
+        p = super().pop()
+        self._pase_global = self._pase[p.pid]
+        return p
+
+    def on_quantum_expired(self, p):
+        # sin pase: turno asignado por otra estrategia (cambio en caliente)
+        self._pase[p.pid] = self._pase.get(p.pid, self._pase_global) + self._paso(p)
+        self.push(p)
+
+    def on_exit(self, p):
+        self._pase.pop(p.pid, None)
+
+    def estado(self) -> dict:
+        return {"pase": [[pid, v] for pid, v in self._pase.items()], "pase_global": self._pase_global}
+
+    def cargar_estado(self, estado: dict):
+        self._pase = {pid: v for pid, v in estado["pase"]}
+        self._pase_global = estado["pase_global"]
+
+
+# Pesos de Linux por nice (-20..19): cada nivel es ~1.25x; nice 0 pesa 1024
+_PESO_NICE = (
+    88761, 71755, 56483, 46273, 36291,
+    29154, 23254, 18705, 14949, 11916,
+    9548, 7620, 6100, 4904, 3906,
+    3121, 2501, 1991, 1586, 1277,
+    1024, 820, 655, 526, 423,
+    335, 272, 215, 172, 137,
+    110, 87, 70, 56, 45,
+    36, 29, 23, 18, 15,
+)
+
+
+def _peso_nice(p) -> int:
+    return _PESO_NICE[max(-20, min(19, p.nice)) + 20]
+
+
+@registrar
+class EstrategiaCFS(Estrategia, ColaHeap):
+    """
+    Parecido al CFS de Linux: cada proceso acumula vruntime (PCB.vruntime,
+    en 1/1024 de tick a nice 0) inversamente a su peso por nice, y siempre se
+    ejecuta el de menor vruntime (heap, O(log n)). El turno no es el quantum
+    fijo de RR sino su parte del período de latencia según su peso, nunca
+    menor que granularidad_min. Un proceso que entra no baja de min_vruntime,
+    para que no acapare la CPU por el tiempo que no estuvo. A diferencia de
+    Linux no hay expropiación al despertar: el turno en curso se respeta.
+    """
+    nombre = "CFS"
+    usa_quantum = True
+    quantum_propio = True
+    campo_grupo = "nice"
+    NICE_0 = 1024
+
+    def __init__(self, latencia: int = 24, granularidad_min: int = 3):
+        self.latencia = max(1, int(latencia))
+        self.granularidad_min = max(1, int(granularidad_min))
+        self._min_vruntime = 0
+        self._peso_total = 0
+        self._tramo = (-1, 0)   # (pid, ticks) del último turno asignado
+        super().__init__(operator.attrgetter("vruntime", "pid"))
+
+    def push(self, p, seq: Optional[int] = None):
+        self._peso_total += _peso_nice(p)
+        super().push(p, seq)
+
+    def extend(self, ps):
+        # alta masiva: cada uno entra como en on_arrival
+        ps = list(ps)
+        for p in ps:
+            p.vruntime = max(p.vruntime, self._min_vruntime)
+        self._peso_total += sum(map(_peso_nice, ps))
+        super().extend(ps)
+
+    def pop(self):
+        p = super().pop()
+        self._peso_total -= _peso_nice(p)
+        self._min_vruntime = max(self._min_vruntime, p.vruntime)
+        return p
+
+    def on_arrival(self, p):
+        p.vruntime = max(p.vruntime, self._min_vruntime)
+        self.push(p)
+
+    def quantum(self, p, q: int) -> int:
+        # p ya salió de la cola: el período se reparte entre él y los listos
+        w = _peso_nice(p)
+        periodo = max(self.latencia, (len(self) + 1) * self.granularidad_min)
+        tramo = max(self.granularidad_min, periodo * w // (self._peso_total + w))
+        self._tramo = (p.pid, tramo)
+        return tramo
+
+    def on_quantum_expired(self, p):
+        pid, tramo = self._tramo
+        if pid != p.pid:
+            tramo = 0   # turno asignado por otra estrategia (cambio en caliente)
+        p.vruntime += tramo * self.NICE_0 * self.NICE_0 // _peso_nice(p)
+        self.push(p)
+
+    def estado(self) -> dict:
+        return {"min_vruntime": self._min_vruntime,
+                "tramo": list(self._tramo)}
+
+    def cargar_estado(self, estado: dict):
+        self._min_vruntime = estado["min_vruntime"]
+        self._tramo = tuple(estado["tramo"])
+
+
+def _clave_plazo(p) -> tuple:
+    # sin deadline: al final, en orden de pid
+    return (_SIN_PLAZO if p.deadline is None else p.deadline, p.pid)
+
+
+_SIN_PLAZO = float("inf")
+
+
+@registrar
+class EstrategiaEDF(Estrategia, ColaHeap):
+    """
+    Earliest deadline first expropiativo: heap por (deadline, pid), así que
+    elegir es O(log n) y ver si un recién llegado desaloja al running es
+    mirar el tope, O(1). Solo expropia un plazo estrictamente anterior.
+    """
+    nombre = "EDF"
+
+    def __init__(self):
+        super().__init__(_clave_plazo)
+
+    def debe_expropiar(self, running) -> bool:
+        return bool(self._h) and self._h[0][0][0] < _clave_plazo(running)[0]
+
+
+@registrar
+class EstrategiaPrioridad(Estrategia, ColaHeap):
+    """
+    Prioridad (menor número = más prioridad) con envejecimiento perezoso:
+    cada 'envejecimiento' ticks desde su llegada un proceso gana un punto,
+    prioridad efectiva = prioridad - (t - llegada) / envejecimiento.
+    Como todos envejecen al mismo ritmo, el orden entre dos procesos no
+    cambia con el tiempo y alcanza con una clave fija
+    llegada + prioridad * envejecimiento: nada se recorre por tick y
+    push/pop siguen en O(log n). Nadie espera para siempre, porque la clave
+    de los que llegan después crece con t. envejecimiento=0 desactiva el
+    envejecimiento (prioridad pura, desempate por llegada).
+    """
+    nombre = "PRIORIDAD"
+    campo_grupo = "prioridad"
+    expropiativo = False
+
+    def __init__(self, envejecimiento: int = 10):
+        a = max(0, int(envejecimiento))
+        if a:
+            clave = lambda p: (p.instante_llegada + p.prioridad * a, p.pid)  # noqa: E731
+        else:
+            clave = operator.attrgetter("prioridad", "instante_llegada", "pid")
+        super().__init__(clave)
+
+    def debe_expropiar(self, running) -> bool:
+        # el running también envejece desde su llegada: basta comparar claves
+        return (self.expropiativo and bool(self._h)
+                and self._h[0][0][0] < self._clave(running)[0])
+
+
+@registrar
+class EstrategiaPrioridadExp(EstrategiaPrioridad):
+    """Como PRIORIDAD, pero un proceso con mejor prioridad efectiva desaloja al running."""
+    nombre = "PRIORIDAD_EXP"
+    expropiativo = True
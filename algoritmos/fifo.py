@@ -9,20 +9,28 @@ class AlgoritmoFIFO:
       - on_context_switch(t, prev, nxt)
       - on_tick(t, running)
       - on_finish(t, proceso)
+      - on_segment(inicio, fin, proceso)   (modo por tramos; proceso None = CPU ociosa)
     El 'proceso' debe tener: id, nombre, llegada, duracion, restante.
+
+    Dos modos, que se pueden mezclar: tick() avanza una unidad y llama a
+    on_tick en cada una; correr_tramo() corre al proceso de turno hasta el
+    final (FIFO no expropia) y llama una sola vez a on_segment con el tramo
+    [inicio, fin). on_finish recibe el mismo t en los dos modos: el del
+    último tick ejecutado (fin - 1).
     """
 
-    def __init__(self, on_context_switch=None, on_tick=None, on_finish=None):
+    def __init__(self, on_context_switch=None, on_tick=None, on_finish=None, on_segment=None):
         self.ready = deque()
         self._running = None
         self.on_context_switch = on_context_switch or (lambda *_: None)
         self.on_tick = on_tick or (lambda *_: None)
         self.on_finish = on_finish or (lambda *_: None)
+        self.on_segment = on_segment or (lambda *_: None)
         self.finished_ids = set()
 
     def push_arrivals(self, t, nuevos):
-        # 'nuevos' viene de la lógica de tu planificador, ya con llegada==t.
-        for p in sorted(nuevos, key=lambda x: (p.llegada, p.id)):
+        # 'nuevos' viene de la lógica de tu planificador, ya con llegada<=t.
+        for p in sorted(nuevos, key=lambda x: (x.llegada, x.id)):
             self.ready.append(p)
 
     def _dispatch_if_idle(self, t):
@@ -50,5 +58,30 @@ class AlgoritmoFIFO:
 
         return self._running
 
+    def correr_tramo(self, t):
+        """
+        Corre al proceso de turno (el que está en CPU o el primero de la cola)
+        desde t hasta que termina, con un solo on_segment. Devuelve el
+        instante en que queda libre la CPU; t si no había a quién correr.
+        """
+        self._dispatch_if_idle(t)
+        p = self._running
+        if p is None:
+            return t
+
+        # como tick(): al menos una unidad, aunque 'restante' ya sea <= 0
+        fin = t + max(1, p.restante)
+        p.restante -= fin - t
+        self._running = None
+        self.finished_ids.add(p.id)
+        self.on_segment(t, fin, p)
+        self.on_finish(fin - 1, p)
+        return fin
+
+    def ocioso(self, inicio, fin):
+        """Hueco sin procesos [inicio, fin) en modo por tramos: un solo on_segment."""
+        if fin > inicio:
+            self.on_segment(inicio, fin, None)
+
     def running(self):
         return self._running
@@ -1,4 +1,3 @@
-import time
 import copy
 from collections import deque
 
@@ -7,17 +6,27 @@ class AlgoritmoRoundRobin:
         # Quantum mínimo = 1
         self.quantum = max(1, int(quantum))
 
-    def ejecutar(self, procesos, on_tick=None):
+    def ejecutar(self, procesos, on_tick=None, copiar=True):
         """
         Ejecuta los procesos según el algoritmo Round Robin,
         respetando los instantes de llegada y generando las métricas
         y datos del gráfico para el simulador.
+        Calcula todo de una vez, sin esperas: para mostrar los tramos de
+        'grafico' a ritmo de reloj, ver logica/reproduccion.py.
+
+        Ningún modo modifica los procesos recibidos. Por defecto trabaja
+        sobre copias y devuelve esas copias con las métricas cargadas;
+        copiar=False no copia: devuelve los originales sin tocar y el estado
+        de la corrida va aparte, en "tiempos" (ver _ejecutar_sin_copia).
         """
+        if not copiar:
+            return self._ejecutar_sin_copia(procesos, on_tick)
+
         # Copiar procesos y ordenar por instante de llegada
-        pendientes = sorted(
+        pendientes = deque(sorted(
             (copy.deepcopy(p) for p in procesos),
             key=lambda x: int(x.instante_llegada)
-        )
+        ))
         listos = deque()
         tiempo_actual = 0
         resultados = []
@@ -27,7 +36,7 @@ class AlgoritmoRoundRobin:
         def mover_llegados():
             nonlocal pendientes, listos, tiempo_actual
             while pendientes and int(pendientes[0].instante_llegada) <= tiempo_actual:
-                p = pendientes.pop(0)
+                p = pendientes.popleft()
                 p.estado = "Listo"
                 listos.append(p)
 
@@ -72,11 +81,10 @@ class AlgoritmoRoundRobin:
                 "Fin": fin
             })
 
-            # Callback visual (para interfaz)
+            # Callback por tramo (inmediato; el ritmo lo pone Reproduccion)
             if on_tick:
                 try:
                     on_tick(tiempo_actual, proceso, [p.nombre for p in listos])
-                    time.sleep(3)
                 except Exception:
                     pass
 
@@ -107,3 +115,82 @@ class AlgoritmoRoundRobin:
             "procesos": resultados,
             "grafico": grafico
         }
+
+    def _ejecutar_sin_copia(self, procesos, on_tick=None):
+        """
+        Mismo plan que ejecutar(), sin deepcopy: los procesos del llamador
+        quedan intactos y lo que cambia en la corrida (CPU restante, inicio,
+        fin) vive en dicts por pid. Las llegadas salen de un índice sobre la
+        lista ordenada, así que tiempo y memoria crecen linealmente con n
+        (más el ordenamiento inicial).
+
+        Devuelve {"procesos": los originales en orden de finalización,
+        "grafico": tramos como en ejecutar(), "tiempos": {pid: (t_inicio, t_fin)}};
+        retorno = t_fin - llegada, espera = retorno - cpu_total y
+        respuesta = t_inicio - llegada. on_tick recibe el proceso original
+        (su cpu_restante no cambia: el restante está en la corrida).
+        """
+        # Solo referencias, ordenadas por llegada (sort estable: empates por orden de entrada)
+        orden = sorted(procesos, key=lambda x: int(x.instante_llegada))
+        n = len(orden)
+        sig = 0                                   # próximo de 'orden' por llegar
+        restante = {p.pid: int(p.cpu_restante) for p in orden}
+        t_inicio = {}
+        tiempos = {}
+        listos = deque()
+        quantum = self.quantum
+        tiempo_actual = 0
+        resultados = []
+        grafico = []
+
+        while sig < n or listos:
+            if not listos:
+                # No hay procesos listos → saltar al siguiente arribo
+                tiempo_actual = max(tiempo_actual, int(orden[sig].instante_llegada))
+            while sig < n and int(orden[sig].instante_llegada) <= tiempo_actual:
+                listos.append(orden[sig])
+                sig += 1
+            if not listos:
+                continue
+
+            proceso = listos.popleft()
+            pid = proceso.pid
+            r = restante[pid]
+            if pid not in t_inicio:
+                t_inicio[pid] = tiempo_actual
+
+            tiempo_ejec = min(quantum, r)
+            inicio = tiempo_actual
+            tiempo_actual += tiempo_ejec
+            r -= tiempo_ejec
+            restante[pid] = r
+
+            grafico.append({
+                "Proceso": proceso.nombre,
+                "Inicio": inicio,
+                "Fin": tiempo_actual
+            })
+
+            if on_tick:
+                try:
+                    on_tick(tiempo_actual, proceso, [p.nombre for p in listos])
+                except Exception:
+                    pass
+
+            # Los que llegaron durante el tramo van antes que el re-encolado
+            while sig < n and int(orden[sig].instante_llegada) <= tiempo_actual:
+                listos.append(orden[sig])
+                sig += 1
+
+            if r <= 0:
+                tiempos[pid] = (t_inicio.pop(pid), tiempo_actual)
+                del restante[pid]
+                resultados.append(proceso)
+            else:
+                listos.append(proceso)
+
+        return {
+            "procesos": resultados,
+            "grafico": grafico,
+            "tiempos": tiempos
+        }
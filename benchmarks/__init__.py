@@ -0,0 +1,2 @@
+# benchmarks/__init__.py
+"""Benchmarks del simulador (ver benchmarks/suite.py)."""
@@ -0,0 +1,242 @@
+# benchmarks/suite.py
+"""
+Benchmarks del camino caliente del planificador, con salida JSON para
+comparar entre commits.
+
+Mide el tiempo total de simulación y los ticks simulados por segundo de:
+  - Planificador, cada estrategia registrada, por eventos (ejecutar_hasta_fin)
+    y tick a tick (tick())
+  - AlgoritmoRoundRobin.ejecutar (copiar=False, sin on_tick: solo el cálculo)
+  - PlanificadorFIFO.run_all (por tramos)
+para N = 10^2, 10^4, 10^6 procesos y varias densidades de llegada. Las
+cargas salen de logica/generador.py con semilla fija: todas las corridas
+(y todos los commits) miden exactamente la misma carga.
+
+Uso:
+    python -m benchmarks.suite --salida base.json                # suite completa
+    python -m benchmarks.suite --rapido --salida nuevo.json      # solo N <= 10^4
+    python -m benchmarks.suite --rapido --comparar base.json     # marca regresiones
+Con --comparar el código de salida es 1 si algún caso tardó más que
+(1 + umbral) veces lo del archivo base.
+"""
+from __future__ import annotations
+import argparse
+import gc
+import json
+import platform
+import subprocess
+import sys
+import time
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from algoritmos.estrategias import nombres_estrategias
+from algoritmos.round_robin import AlgoritmoRoundRobin
+from logica.generador import generar
+from logica.gestor_memoria import GestorMemoria
+from logica.planificador import Planificador
+from logica.planificador_fifo import PlanificadorFIFO
+from logica.proceso import Proceso
+
+VERSION = 1
+TAMANOS = (10 ** 2, 10 ** 4, 10 ** 6)
+# procesos por tick; con ráfagas de media 8, la CPU queda al ~40%, ~100% y saturada
+DENSIDADES = {"baja": 0.05, "media": 0.12, "saturada": 1.0}
+SEMILLA = 2024
+# topes de N por objetivo: tick a tick no termina en tiempo razonable con 10^6
+LIMITES = {"evento": 10 ** 6, "tick": 10 ** 4, "rr": 10 ** 6, "fifo": 10 ** 6}
+UMBRAL = 0.10
+# por debajo de esto el ruido del reloj pesa más que el código: no se marca
+MINIMO_S = 0.005
+
+
+# ---------------- cargas ----------------
+def carga(n: int, densidad: str) -> Tuple[np.ndarray, np.ndarray]:
+    """(cpu, llegada) reproducibles para N procesos con la densidad dada."""
+    cpu, llegada = [], []
+    for b in generar(n, semilla=SEMILLA, tasa=DENSIDADES[densidad]):
+        cpu.append(b["cpu"])
+        llegada.append(b["llegada"])
+    return np.concatenate(cpu), np.concatenate(llegada)
+
+
+# ---------------- objetivos ----------------
+# cada uno prepara su entrada (fuera de la medición) y devuelve la función a
+# medir; esa función devuelve los ticks simulados
+def _planificador(alg: str, por_tick: bool):
+    def preparar(cpu, llegada) -> Callable[[], int]:
+        plan = Planificador(GestorMemoria())
+        plan.set_algoritmo(alg)
+        plan.agregar_procesos_bulk({"cpu": cpu, "llegada": llegada})
+        if not por_tick:
+            return plan.ejecutar_hasta_fin
+
+        def correr():
+            tick, terminado = plan.tick, plan.esta_terminado
+            ticks = 0
+            while not terminado():
+                tick()
+                ticks += 1
+            return ticks
+        return correr
+    return preparar
+
+
+def _rr(cpu, llegada) -> Callable[[], int]:
+    procs = [Proceso(f"P{i}", duracion=c, llegada=ll, pid=i + 1)
+             for i, (c, ll) in enumerate(zip(cpu.tolist(), llegada.tolist()))]
+    rr = AlgoritmoRoundRobin(quantum=2)
+
+    def correr():
+        grafico = rr.ejecutar(procs, copiar=False)["grafico"]
+        return grafico[-1]["Fin"] if grafico else 0
+    return correr
+
+
+def _fifo(cpu, llegada) -> Callable[[], int]:
+    datos = list(zip(cpu.tolist(), llegada.tolist()))
+
+    def correr():
+        # PlanificadorFIFO modifica los procesos: se arman dentro de la medición
+        plan = PlanificadorFIFO()
+        plan.cargar_procesos([SimpleNamespace(id=i + 1, nombre=f"P{i}", llegada=ll, duracion=c)
+                              for i, (c, ll) in enumerate(datos)])
+        return plan.run_all()
+    return correr
+
+
+def casos(tamanos: Iterable[int] = TAMANOS, densidades: Iterable[str] = tuple(DENSIDADES),
+          algoritmos: Optional[Iterable[str]] = None, objetivos: Optional[Iterable[str]] = None):
+    """(clave, objetivo, alg, n, densidad, preparar) en orden estable."""
+    algoritmos = list(algoritmos or nombres_estrategias())
+    objetivos = set(objetivos or LIMITES)
+    for n in tamanos:
+        for dens in densidades:
+            for modo in ("evento", "tick"):
+                if modo in objetivos and n <= LIMITES[modo]:
+                    for alg in algoritmos:
+                        yield (f"planificador/{modo}/{alg}/n={n}/{dens}", modo, alg, n, dens,
+                               _planificador(alg, modo == "tick"))
+            if "rr" in objetivos and n <= LIMITES["rr"]:
+                yield (f"round_robin/n={n}/{dens}", "rr", "RR", n, dens, _rr)
+            if "fifo" in objetivos and n <= LIMITES["fifo"]:
+                yield (f"fifo/n={n}/{dens}", "fifo", "FCFS", n, dens, _fifo)
+
+
+# ---------------- medición ----------------
+def repeticiones(n: int) -> int:
+    """Más repeticiones con N chico (menos ruido), una sola con 10^6."""
+    return max(1, min(5, 10 ** 5 // max(1, n)))
+
+
+def medir(preparar, cpu, llegada, reps: int) -> Tuple[float, int]:
+    """Mejor tiempo de 'reps' corridas (cada una con entrada nueva) y ticks simulados."""
+    mejor, ticks = float("inf"), 0
+    for _ in range(reps):
+        correr = preparar(cpu, llegada)
+        gc.collect()
+        t0 = time.perf_counter()
+        ticks = correr()
+        mejor = min(mejor, time.perf_counter() - t0)
+    return mejor, int(ticks)
+
+
+def correr_suite(tamanos=TAMANOS, densidades=tuple(DENSIDADES), algoritmos=None, objetivos=None,
+                 progreso: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+    cargas: Dict[Tuple[int, str], Tuple[np.ndarray, np.ndarray]] = {}
+    resultados = []
+    for clave, objetivo, alg, n, dens, preparar in casos(tamanos, densidades, algoritmos, objetivos):
+        if (n, dens) not in cargas:
+            cargas.clear()   # una carga a la vez: con 10^6 no conviene guardarlas todas
+            cargas[(n, dens)] = carga(n, dens)
+        cpu, llegada = cargas[(n, dens)]
+        reps = repeticiones(n)
+        seg, ticks = medir(preparar, cpu, llegada, reps)
+        fila = {
+            "caso": clave, "objetivo": objetivo, "algoritmo": alg, "n": n, "densidad": dens,
+            "repeticiones": reps, "segundos": round(seg, 6), "ticks": ticks,
+            "ticks_por_s": round(ticks / seg, 1) if seg > 0 else None,
+        }
+        resultados.append(fila)
+        if progreso:
+            progreso(f"{clave:<48} {seg:>10.4f} s  {fila['ticks_por_s'] or 0:>14,.0f} ticks/s")
+    return {"version": VERSION, "entorno": _entorno(), "resultados": resultados}
+
+
+def _entorno() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, timeout=10).stdout.strip() or None
+    except Exception:
+        commit = None
+    return {
+        "commit": commit,
+        "fecha": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "numpy": np.__version__,
+    }
+
+
+# ---------------- comparación ----------------
+def comparar(base: Dict[str, Any], nuevo: Dict[str, Any], umbral: float = UMBRAL,
+             minimo_s: float = MINIMO_S) -> List[Dict[str, Any]]:
+    """
+    Casos presentes en ambos, con razón = segundos nuevos / segundos base y
+    'regresion' True si la razón supera 1 + umbral (salvo casos que tardan
+    menos de minimo_s, donde manda el ruido).
+    """
+    previos = {r["caso"]: r for r in base["resultados"]}
+    filas = []
+    for r in nuevo["resultados"]:
+        b = previos.get(r["caso"])
+        if b is None or not b["segundos"]:
+            continue
+        razon = r["segundos"] / b["segundos"]
+        filas.append({"caso": r["caso"], "base": b["segundos"], "nuevo": r["segundos"],
+                      "razon": round(razon, 3),
+                      "regresion": razon > 1 + umbral and r["segundos"] >= minimo_s})
+    return filas
+
+
+def formatear_comparacion(filas: List[Dict[str, Any]]) -> str:
+    lineas = [f"{'caso':<48} {'base (s)':>10} {'nuevo (s)':>10} {'razón':>7}\n"]
+    for f in filas:
+        marca = "  <-- REGRESIÓN" if f["regresion"] else ""
+        lineas.append(f"{f['caso']:<48} {f['base']:>10.4f} {f['nuevo']:>10.4f} {f['razon']:>7.3f}{marca}\n")
+    return "".join(lineas)
+
+
+# ---------------- CLI ----------------
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmarks del planificador (salida JSON comparable).")
+    ap.add_argument("--n", nargs="+", type=int, default=None, help=f"tamaños (por defecto {TAMANOS})")
+    ap.add_argument("--rapido", action="store_true", help="solo N <= 10^4")
+    ap.add_argument("--densidad", nargs="+", choices=tuple(DENSIDADES), default=tuple(DENSIDADES))
+    ap.add_argument("--alg", nargs="+", default=None, type=lambda s: s.strip().upper(),
+                    choices=nombres_estrategias(), help="por defecto, todas las estrategias registradas")
+    ap.add_argument("--objetivo", nargs="+", choices=tuple(LIMITES), default=None)
+    ap.add_argument("--salida", help="guardar los resultados como JSON")
+    ap.add_argument("--comparar", help="JSON base contra el que buscar regresiones")
+    ap.add_argument("--umbral", type=float, default=UMBRAL, help="regresión si tarda más de (1+umbral)x")
+    args = ap.parse_args(argv)
+
+    tamanos = args.n or [n for n in TAMANOS if not args.rapido or n <= 10 ** 4]
+    res = correr_suite(tamanos, args.densidad, args.alg, args.objetivo, progreso=print)
+
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as f:
+            json.dump(res, f, indent=1)
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as f:
+            filas = comparar(json.load(f), res, args.umbral)
+        print(formatear_comparacion(filas), end="")
+        if any(f["regresion"] for f in filas):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
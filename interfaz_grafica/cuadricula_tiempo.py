@@ -82,6 +82,17 @@ class CuadriculaTiempo(ttk.Frame):
             if t is not None and t not in self._marcas[nombre]:
                 self._marcas[nombre].append(t)
 
+    def cargar_segmentos(self, segmentos, char: str = "X"):
+        """
+        Marca los tramos [{"t": ini, "nombre": p, "duracion": d}, ...], p. ej.
+        planificador.segmentos_gantt(0, num_cols): solo se recorren los que
+        caen en las columnas visibles.
+        """
+        for s in segmentos:
+            ini = max(0, s["t"])
+            for t in range(ini, min(self.num_cols, s["t"] + s["duracion"])):
+                self.marcar(t, s["nombre"], char)
+
     def get_marcas(self) -> Dict[str, List[int]]:
         """Devuelve dict nombre -> lista de tiempos marcados (sin duplicados, no ordenado)."""
         return {k: sorted(v) for k, v in self._marcas.items()}
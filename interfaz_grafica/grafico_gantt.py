@@ -10,6 +10,7 @@ def generar_grafico_gantt(segmentos, nombre="Algoritmo", show=False):
     segmentos: [{"t": inicio, "nombre": proceso, "duracion": ancho}, ...]
     Devuelve (fig, ax). En el panel_ejecucion ya no se usa crear/ destruir,
     se llama a un canvas persistente; este helper queda por si lo necesitas.
+    Con un Planificador, ver gantt_planificador().
     """
     fig, ax = plt.subplots(figsize=(6.5, 3.2), dpi=100)
     if not segmentos:
@@ -43,3 +44,9 @@ def generar_grafico_gantt(segmentos, nombre="Algoritmo", show=False):
         except Exception:
             pass
     return fig, ax
+
+
+def gantt_planificador(planificador, nombre=None, desde=None, hasta=None, show=False):
+    """Gantt del historial por tramos del planificador (opcionalmente la ventana [desde, hasta))."""
+    segmentos = planificador.segmentos_gantt(desde, hasta)
+    return generar_grafico_gantt(segmentos, nombre or planificador.estado_cpu()["alg"], show=show)
@@ -1,13 +1,23 @@
 # interfaz_grafica/panel_control.py
 from __future__ import annotations
+import os
+import queue
+import threading
+from tkinter import filedialog
+
 import customtkinter as ctk
 
+from algoritmos.estrategias import nombres_estrategias
+from logica.carga import carga_con_extras
+
 
 class PanelControl(ctk.CTkFrame):
     """
     Panel de control (versión estable):
       - Lee CPU de 'CPU (ticks)' y llegada de 'Llegada'.
       - Llama planificador.agregar_proceso(nombre, cpu, llegada).
+      - "Importar carga" lee un .csv/.jsonl en segundo plano y usa
+        planificador.agregar_procesos_bulk().
       - Dispara iniciar/pausar/reiniciar de VentanaPrincipal.
     """
     def __init__(self, master, gestor_memoria, planificador,
@@ -31,7 +41,7 @@ class PanelControl(ctk.CTkFrame):
         r = 1
         # Algoritmo
         ctk.CTkLabel(self, text="Algoritmo:").grid(row=r, column=0, sticky="w", padx=8)
-        self.cbo_alg = ctk.CTkOptionMenu(self, values=["FCFS", "SJF", "SRTF", "RR"])
+        self.cbo_alg = ctk.CTkOptionMenu(self, values=nombres_estrategias())
         self.cbo_alg.set("FCFS")
         self.cbo_alg.grid(row=r, column=0, sticky="ew", padx=(90, 8), pady=4)
 
@@ -48,7 +58,7 @@ class PanelControl(ctk.CTkFrame):
         self.entry_nombre = ctk.CTkEntry(self)
         self.entry_nombre.grid(row=r, column=0, sticky="ew", padx=(80, 8), pady=4)
 
-        # RAM (decorativo)
+        # RAM (MB) que pide el proceso
         r += 1
         ctk.CTkLabel(self, text="RAM (MB):").grid(row=r, column=0, sticky="w", padx=8)
         self.entry_ram = ctk.CTkEntry(self, width=90)
@@ -69,6 +79,33 @@ class PanelControl(ctk.CTkFrame):
         self.entry_llegada.insert(0, "0")
         self.entry_llegada.grid(row=r, column=0, sticky="e", padx=8, pady=4)
 
+        # Peso / boletos (LOTERIA, STRIDE)
+        r += 1
+        ctk.CTkLabel(self, text="Peso (boletos):").grid(row=r, column=0, sticky="w", padx=8)
+        self.entry_peso = ctk.CTkEntry(self, width=90)
+        self.entry_peso.insert(0, "1")
+        self.entry_peso.grid(row=r, column=0, sticky="e", padx=8, pady=4)
+
+        # Nice (CFS): -20 (más CPU) .. 19 (menos CPU)
+        r += 1
+        ctk.CTkLabel(self, text="Nice (CFS):").grid(row=r, column=0, sticky="w", padx=8)
+        self.entry_nice = ctk.CTkEntry(self, width=90)
+        self.entry_nice.insert(0, "0")
+        self.entry_nice.grid(row=r, column=0, sticky="e", padx=8, pady=4)
+
+        # Prioridad (PRIORIDAD / PRIORIDAD_EXP): menor número = más prioridad
+        r += 1
+        ctk.CTkLabel(self, text="Prioridad:").grid(row=r, column=0, sticky="w", padx=8)
+        self.entry_prioridad = ctk.CTkEntry(self, width=90)
+        self.entry_prioridad.insert(0, "0")
+        self.entry_prioridad.grid(row=r, column=0, sticky="e", padx=8, pady=4)
+
+        # Deadline (EDF): plazo relativo a la llegada; vacío = sin plazo
+        r += 1
+        ctk.CTkLabel(self, text="Deadline (EDF):").grid(row=r, column=0, sticky="w", padx=8)
+        self.entry_deadline = ctk.CTkEntry(self, width=90)
+        self.entry_deadline.grid(row=r, column=0, sticky="e", padx=8, pady=4)
+
         # Quantum “decorativo” (lo dejas si lo usas para mostrar algo)
         r += 1
         ctk.CTkLabel(self, text="Quantum:").grid(row=r, column=0, sticky="w", padx=8)
@@ -79,7 +116,10 @@ class PanelControl(ctk.CTkFrame):
         # Botones
         r += 1
         ctk.CTkButton(self, text="Agregar Proceso", command=self._agregar_proceso).grid(
-            row=r, column=0, padx=8, pady=(6, 10), sticky="ew")
+            row=r, column=0, padx=8, pady=(6, 4), sticky="ew")
+        r += 1
+        self.btn_importar = ctk.CTkButton(self, text="📂 Importar carga", command=self._importar_carga)
+        self.btn_importar.grid(row=r, column=0, padx=8, pady=(0, 10), sticky="ew")
 
         r += 1
         ctk.CTkButton(self, text="► Iniciar", command=self._iniciar).grid(
@@ -126,14 +166,67 @@ class PanelControl(ctk.CTkFrame):
 
         cpu      = _i(self.entry_cpu, 1)          # <-- CPU correcto
         llegada  = _i(self.entry_llegada, 0)      # <-- Llegada correcta
+        peso     = max(1, _i(self.entry_peso, 1))
+        nice     = max(-20, min(19, _i(self.entry_nice, 0)))
+        prioridad = _i(self.entry_prioridad, 0)
+        memoria  = max(0, _i(self.entry_ram, 0))
+        deadline = _i(self.entry_deadline, None)
 
         # si el usuario cambió quantum, actualízalo en el planificador (para RR)
         if hasattr(self, "entry_quantum") and hasattr(self.planificador, "set_quantum"):
             self.planificador.set_quantum(_i(self.entry_quantum, 2))
 
         # Alta en el planificador
-        self.planificador.agregar_proceso(nombre=nombre, cpu=cpu, llegada=llegada)
+        self.planificador.agregar_proceso(nombre=nombre, cpu=cpu, llegada=llegada, peso=peso, nice=nice,
+                                          prioridad=prioridad, memoria=memoria,
+                                          deadline=deadline)
+
+        self._refrescar_vistas()
+        self.lbl_estado.configure(text=f"Proceso agregado: {nombre}")
+
+    def _importar_carga(self):
+        ruta = filedialog.askopenfilename(
+            title="Importar carga",
+            filetypes=[("Cargas (CSV / JSONL)", "*.csv *.jsonl"), ("Todos", "*.*")])
+        if not ruta:
+            return
+        self.btn_importar.configure(state="disabled")
+        self.lbl_estado.configure(text=f"Leyendo {os.path.basename(ruta)}...")
+
+        # parsear/validar fuera del hilo de Tk; el alta se hace en el hilo de la UI
+        resultado: queue.Queue = queue.Queue(maxsize=1)
+
+        def _leer():
+            try:
+                resultado.put(("ok", carga_con_extras(ruta)))
+            except Exception as e:
+                resultado.put(("error", e))
+
+        threading.Thread(target=_leer, daemon=True).start()
+        self._esperar_carga(resultado, ruta)
 
+    def _esperar_carga(self, resultado: queue.Queue, ruta: str):
+        try:
+            tipo, valor = resultado.get_nowait()
+        except queue.Empty:
+            self.after(100, self._esperar_carga, resultado, ruta)
+            return
+        self.btn_importar.configure(state="normal")
+        if tipo == "error":
+            self.lbl_estado.configure(text=f"Error al importar: {valor}")
+            return
+
+        # peso/nice/prioridad/deadline/memoria del archivo pasan tal cual
+        nombres, cpu, llegada, extras = valor
+        columnas = {"cpu": cpu, "llegada": llegada, **extras}
+        if nombres is not None:
+            columnas["nombre"] = nombres
+        n = self.planificador.agregar_procesos_bulk(columnas)
+
+        self._refrescar_vistas()
+        self.lbl_estado.configure(text=f"Importados {n} procesos de {os.path.basename(ruta)}")
+
+    def _refrescar_vistas(self):
         # Refrescos UI
         if getattr(self.master, "panel_estado", None) and hasattr(self.master.panel_estado, "refrescar_tabla"):
             self.master.panel_estado.refrescar_tabla()
@@ -147,9 +240,6 @@ class PanelControl(ctk.CTkFrame):
         except Exception:
             pass
 
-        self.lbl_estado.configure(text=f"Proceso agregado: {nombre}")
-
-    
 
     def _iniciar(self):
         alg = self.cbo_alg.get().strip()
@@ -1,7 +1,22 @@
 # interfaz_grafica/panel_ejecucion.py
 from __future__ import annotations
+import math
 import customtkinter as ctk
 
+from logica.linea_tiempo import LineaTiempo
+
+# colores de las barras (zoom alejado), por fila
+_COLORES = ("#4e79a7", "#f28e2b", "#e15759", "#76b7b2", "#59a14f",
+            "#edc948", "#b07aa1", "#ff9da7", "#9c755f", "#bab0ac")
+
+
+def _paso_etiquetas(ancho_celda: float, minimo_px: int = 36) -> int:
+    """Cada cuántos ticks va un número en el eje: 1, 2, 5, 10, 20, 50... (>= minimo_px entre números)."""
+    paso = 1
+    while paso * ancho_celda < minimo_px:
+        paso = paso * 5 // 2 if str(paso)[0] == "2" else paso * 2
+    return paso
+
 
 class PanelEjecucion(ctk.CTkFrame):
     """
@@ -14,7 +29,18 @@ class PanelEjecucion(ctk.CTkFrame):
       - pintar_tick(nombre_o_pid, t, simbolo="X")
       - marcar(...), pintar(...)  (alias)
       - limpiar()
+
+    El canvas está virtualizado: solo existen los ítems de las filas y
+    columnas a la vista (rueda: filas, Shift+rueda: tiempo, Ctrl+rueda o
+    los botones -/+: zoom). Las 'X' salen del historial por tramos del
+    planificador (linea_tiempo()); con celdas más angostas que _ANCHO_LOD
+    se dibuja una barra por tramo en lugar de una marca por tick, así cada
+    cuadro cuesta lo mismo sea cual sea el largo de la corrida.
     """
+    _ANCHO_MIN = 0.01   # px por tick con el zoom más alejado
+    _ANCHO_MAX = 60
+    _ANCHO_LOD = 10     # por debajo: barras por tramo, sin grilla ni marcas por tick
+
     def __init__(self, master, *args):
         super().__init__(master)
         self.gestor = None
@@ -28,23 +54,41 @@ class PanelEjecucion(ctk.CTkFrame):
             raise TypeError("PanelEjecucion requiere al menos 'planificador'")
 
         self._titulo = "Tabla de Ejecucion de procesos"
-        self._max_t = 30  # columnas (0..19)
+        self._max_t = 30  # largo del eje (crece con la simulación, no se redibuja por eso)
         self._row_names = []  # nombres de procesos
         self._row_index = {}  # nombre -> índice de fila
+        self._row_por_pid = {}  # pid -> índice de fila (para leer el historial del planificador)
+        # 'o' de llegada y '○' de fin: columna -> {fila: símbolo}
+        self._simbolos = {}
+        # 'X' pintadas a mano si el planificador no tiene historial (la fila hace de pid)
+        self._linea_propia = LineaTiempo()
+
+        # vista: primer tick y primera fila visibles; seguir = acompañar al tick actual
+        self._x0 = 0.0
+        self._y0 = 0
+        self._seguir = True
+        self._pendiente = None
 
         # Encabezado
         self.frame_head = ctk.CTkFrame(self)
-        self.frame_head.grid(row=0, column=0, sticky="ew", padx=8, pady=(8, 4))
+        self.frame_head.grid(row=0, column=0, columnspan=2, sticky="ew", padx=8, pady=(8, 4))
         self.lbl_titulo = ctk.CTkLabel(self.frame_head, text=self._titulo + " - FCFS",
                                        font=ctk.CTkFont(size=16, weight="bold"))
         self.lbl_titulo.pack(side="left", padx=8)
 
+        ctk.CTkButton(self.frame_head, text="+", width=28, command=lambda: self._zoom(1.5)).pack(side="right", padx=(2, 8))
+        ctk.CTkButton(self.frame_head, text="-", width=28, command=lambda: self._zoom(1 / 1.5)).pack(side="right", padx=2)
+
        # self.lbl_info = ctk.CTkLabel(self.frame_head, text="Tiempo: 0 ticks     CPU: IDLE | Alg: -")
        # self.lbl_info.pack(side="right", padx=8)
 
-        # Canvas
+        # Canvas + scroll (manejados a mano: el canvas no tiene scrollregion)
         self.canvas = ctk.CTkCanvas(self, width=780, height=360, bg="#111111", highlightthickness=0)
-        self.canvas.grid(row=1, column=0, sticky="nsew", padx=8, pady=8)
+        self.canvas.grid(row=1, column=0, sticky="nsew", padx=(8, 0), pady=(8, 0))
+        self.yscroll = ctk.CTkScrollbar(self, orientation="vertical", command=self._yview)
+        self.yscroll.grid(row=1, column=1, sticky="ns", padx=(0, 8), pady=(8, 0))
+        self.xscroll = ctk.CTkScrollbar(self, orientation="horizontal", command=self._xview)
+        self.xscroll.grid(row=2, column=0, sticky="ew", padx=(8, 0), pady=(0, 8))
 
         self.grid_rowconfigure(1, weight=1)
         self.grid_columnconfigure(0, weight=1)
@@ -54,6 +98,10 @@ class PanelEjecucion(ctk.CTkFrame):
         self._top_pad = 26
         self._left_pad = 60
 
+        self.canvas.bind("<Configure>", lambda _e: self._programar_redibujo())
+        for evento in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.canvas.bind(evento, self._rueda)
+
         self._dibujar_grid()
 
     # ---------- API ----------
@@ -65,18 +113,28 @@ class PanelEjecucion(ctk.CTkFrame):
     def set_procesos_base(self, procesos):
         # Establece nombres de filas según lista de procesos
         names = []
+        por_pid = {}
         for p in procesos or []:
             nombre = getattr(p, "nombre", None)
             pid = getattr(p, "pid", getattr(p, "id", None))
+            if pid is not None:
+                por_pid[pid] = len(names)
             names.append(str(nombre or pid or "?"))
         if not names:
             names = ["A", "B", "C"]
         self._row_names = names
         self._row_index = {n: i for i, n in enumerate(self._row_names)}
+        self._row_por_pid = por_pid
+        self._y0 = 0
         self._dibujar_grid()
 
     def limpiar(self):
-        self.canvas.delete("all")
+        self._simbolos = {}
+        self._linea_propia = LineaTiempo()
+        self._max_t = 30
+        self._x0 = 0.0
+        self._y0 = 0
+        self._seguir = True
         self._dibujar_grid()
 
     def pintar_tick(self, nombre_o_pid, t, simbolo="X"):
@@ -84,30 +142,39 @@ class PanelEjecucion(ctk.CTkFrame):
         if t is None:
             return
         col = int(t)  # 0..N
-        if col < 0 or col >= self._max_t:
-            # Auto-expandir un poco si nos pasamos
-            self._max_t = max(self._max_t, col + 5)
-            self._dibujar_grid()
+        if col < 0:
+            return
 
         name = str(nombre_o_pid)
         # si no existe la fila, la agregamos al final
-        if name not in self._row_index:
+        nueva_fila = name not in self._row_index
+        if nueva_fila:
             self._row_index[name] = len(self._row_names)
             self._row_names.append(name)
-            self._dibujar_grid()
-
         row = self._row_index[name]
-        x0 = self._left_pad + col * self._cell_w + 4
-        y0 = self._top_pad + row * self._cell_h + 4
-        x1 = x0 + self._cell_w - 8
-        y1 = y0 + self._cell_h - 8
 
-        if simbolo.upper() == "O":
-            self.canvas.create_oval(x0, y0, x1, y1, outline="#ffaa00")
+        if simbolo.upper() == "X":
+            historial, del_planificador = self._historial()
+            if not del_planificador and col >= historial.fin():
+                historial.registrar(row, col)
         else:
-            # 'X' por defecto
-            self.canvas.create_line(x0, y0, x1, y1, fill="#ffffff")
-            self.canvas.create_line(x0, y1, x1, y0, fill="#ffffff")
+            self._simbolos.setdefault(col, {})[row] = simbolo
+        self._max_t = max(self._max_t, col + 1)
+
+        # el tick actual se salió por la derecha: la vista avanza de a 3/4 de pantalla
+        cols = self._columnas_visibles()
+        if self._seguir and col >= self._x0 + cols:
+            self._x0 = max(0.0, col - 0.25 * cols)
+            self._programar_redibujo()
+        elif nueva_fila and self._y0 <= row < self._y0 + self._filas_visibles():
+            self._programar_redibujo()
+        elif self._x0 <= col < self._x0 + cols and self._y0 <= row < self._y0 + self._filas_visibles():
+            if self._cell_w >= self._ANCHO_LOD:
+                # incremental: solo la marca nueva
+                self._dibujar_marca(row, col, simbolo)
+            else:
+                self._programar_redibujo()
+        self._actualizar_scroll()
 
     # alias compatibles
     def marcar(self, nombre_o_pid, t, simbolo="X"):
@@ -117,41 +184,223 @@ class PanelEjecucion(ctk.CTkFrame):
         self.pintar_tick(nombre_o_pid, t, simbolo)
 
     def pintar_fin(self, nombre: str, t: int):
-        """Marca fin de un proceso en el tick 't' (no en t+1).Debe usar el mismo mecanismo de coordenadas que 'pintar_tick'."""
+        """Marca fin de un proceso en el tick 't' (no en t+1), con las mismas coordenadas que 'pintar_tick'."""
+        self.pintar_tick(nombre, t, "○")
+
+    # ---------- vista: scroll y zoom ----------
+
+    def _tam(self):
+        w, h = self.canvas.winfo_width(), self.canvas.winfo_height()
+        if w <= 1 or h <= 1:
+            # todavía sin mapear: tamaño pedido
+            w, h = int(self.canvas.cget("width")), int(self.canvas.cget("height"))
+        return w, h
+
+    def _columnas_visibles(self) -> float:
+        return max(1.0, (self._tam()[0] - self._left_pad) / self._cell_w)
+
+    def _filas_visibles(self) -> int:
+        return max(1, int((self._tam()[1] - self._top_pad) // self._cell_h))
+
+    def _largo_t(self) -> int:
+        """Ticks que abarca el contenido (para el scroll horizontal)."""
+        return max(self._max_t, self._historial()[0].fin())
+
+    def _fijar_x0(self, x0: float):
+        cols = self._columnas_visibles()
+        largo = self._largo_t()
+        self._x0 = min(max(0.0, x0), max(0.0, largo - cols + 1))
+        # se sigue al tick actual solo si el final queda a la vista
+        self._seguir = self._x0 + cols >= largo
+
+    def _xview(self, *args):
+        cols = self._columnas_visibles()
+        if args[0] == "moveto":
+            self._fijar_x0(float(args[1]) * (self._largo_t() + 1))
+        elif args[0] == "scroll":
+            paso = cols * 0.9 if args[2] == "pages" else max(1.0, cols / 10)
+            self._fijar_x0(self._x0 + int(args[1]) * paso)
+        self._dibujar_grid()
+
+    def _yview(self, *args):
+        n = len(self._row_names)
+        filas = self._filas_visibles()
+        if args[0] == "moveto":
+            y0 = int(float(args[1]) * n)
+        elif args[0] == "scroll":
+            y0 = self._y0 + int(args[1]) * (max(1, filas - 1) if args[2] == "pages" else 1)
+        else:
+            return
+        self._y0 = min(max(0, y0), max(0, n - filas))
+        self._dibujar_grid()
+
+    def _zoom(self, factor: float, x_px=None):
+        """Cambia el ancho de celda dejando quieto el tick bajo x_px (por defecto, el centro)."""
+        w = self._tam()[0]
+        if x_px is None:
+            x_px = (w + self._left_pad) / 2
+        x_px = max(self._left_pad, x_px)
+        ancla = self._x0 + (x_px - self._left_pad) / self._cell_w
+        self._cell_w = min(self._ANCHO_MAX, max(self._ANCHO_MIN, self._cell_w * factor))
+        self._fijar_x0(ancla - (x_px - self._left_pad) / self._cell_w)
+        self._dibujar_grid()
+
+    def _rueda(self, event):
+        arriba = getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0
+        if event.state & 0x0004:        # Ctrl
+            self._zoom(1.25 if arriba else 0.8, event.x)
+        elif event.state & 0x0001:      # Shift
+            self._xview("scroll", -1 if arriba else 1, "units")
+        else:
+            self._yview("scroll", -1 if arriba else 1, "units")
+
+    def _actualizar_scroll(self):
+        largo = self._largo_t() + 1
+        cols = self._columnas_visibles()
+        self.xscroll.set(self._x0 / largo, min(1.0, (self._x0 + cols) / largo))
+        n = max(1, len(self._row_names))
+        self.yscroll.set(self._y0 / n, min(1.0, (self._y0 + self._filas_visibles()) / n))
+
+    # ---------- helpers de dibujo ----------
+
+    def _historial(self):
+        """(LineaTiempo, True) del planificador si lleva historial; si no, (la propia, False)."""
         try:
-            # Si usas una tabla: self._set_cell(nombre, t, "○")
-            # Si usas canvas, reemplaza por create_text en la celda (nombre, t):
-            self._pintar_simbolo(nombre, t, "○")  # reutiliza tu helper interno si lo tienes
+            return self.planificador.linea_tiempo(), True
         except Exception:
-            pass
+            return self._linea_propia, False
 
+    def _x(self, t) -> float:
+        return self._left_pad + (t - self._x0) * self._cell_w
 
-    # ---------- helpers de dibujo ----------
+    def _y(self, row) -> float:
+        return self._top_pad + (row - self._y0) * self._cell_h
+
+    def _programar_redibujo(self):
+        """Junta varios pedidos de redibujo en uno solo, cuando Tk quede libre."""
+        if self._pendiente is None:
+            self._pendiente = self.after_idle(self._dibujar_grid)
+
+    def _dibujar_marca(self, row, col, simbolo="X"):
+        pad = min(4, self._cell_w * 0.15)
+        x0 = self._x(col) + pad
+        y0 = self._y(row) + 4
+        x1 = x0 + self._cell_w - 2 * pad
+        y1 = y0 + self._cell_h - 8
+
+        if simbolo == "○":
+            self.canvas.create_oval(x0, y0, x1, y1, outline="#ff9f1a", width=2)
+        elif simbolo.upper() == "O":
+            self.canvas.create_oval(x0, y0, x1, y1, outline="#ffaa00")
+        else:
+            # 'X' por defecto
+            self.canvas.create_line(x0, y0, x1, y1, fill="#ffffff")
+            self.canvas.create_line(x0, y1, x1, y0, fill="#ffffff")
+
+    def _tramos_visibles(self, historial, t0: int, t1: int, ancho_px: int):
+        """
+        (pid, inicio, fin) de la ventana [t0, t1). Si hay más ticks que píxeles,
+        se muestrea un tick por píxel con quien_en() (búsqueda binaria): el
+        costo depende del ancho del canvas y no de cuántos tramos hay.
+        """
+        if t1 - t0 <= 2 * ancho_px:
+            yield from historial.segmentos(t0, t1)
+            return
+        actual, desde = None, t0
+        for px in range(ancho_px + 1):
+            t = int(self._x0 + px / self._cell_w)
+            if t >= t1:
+                break
+            pid = historial.quien_en(t)
+            if pid != actual:
+                if actual is not None:
+                    yield actual, desde, t
+                actual, desde = pid, t
+        if actual is not None:
+            yield actual, desde, t1
+
+    def _dibujar_marcas(self, t0: int, t1: int, r0: int, r1: int):
+        historial, del_planificador = self._historial()
+        fila_de = self._row_por_pid.get if del_planificador else (lambda pid: pid)
+
+        if self._cell_w >= self._ANCHO_LOD:
+            for pid, a, b in historial.segmentos(t0, t1):
+                row = fila_de(pid)
+                if row is not None and r0 <= row < r1:
+                    for col in range(a, b):
+                        self._dibujar_marca(row, col, "X")
+            for col in range(t0, t1):
+                for row, simbolo in self._simbolos.get(col, {}).items():
+                    if r0 <= row < r1:
+                        self._dibujar_marca(row, col, simbolo)
+            return
+
+        # zoom alejado: una barra por tramo; tramos que caen en el mismo píxel se funden
+        ancho_px = max(1, int(self._tam()[0] - self._left_pad))
+        abiertas = {}   # fila -> [x0, x1] de la barra que se está armando
+        for pid, a, b in self._tramos_visibles(historial, t0, t1, ancho_px):
+            row = fila_de(pid)
+            if row is None or not r0 <= row < r1:
+                continue
+            xa, xb = self._x(a), max(self._x(b), self._x(a) + 1)
+            barra = abiertas.get(row)
+            if barra is not None and xa <= barra[1] + 1:
+                barra[1] = max(barra[1], xb)
+                continue
+            if barra is not None:
+                self._dibujar_barra(row, *barra)
+            abiertas[row] = [xa, xb]
+        for row, barra in abiertas.items():
+            self._dibujar_barra(row, *barra)
+
+    def _dibujar_barra(self, row, x0, x1):
+        y0 = self._y(row) + 4
+        self.canvas.create_rectangle(max(x0, self._left_pad), y0, x1, y0 + self._cell_h - 8,
+                                     fill=_COLORES[row % len(_COLORES)], width=0)
 
     def _dibujar_grid(self):
+        """Redibuja solo la vista actual: su costo no depende del largo de la corrida."""
+        if self._pendiente is not None:
+            try:
+                self.after_cancel(self._pendiente)
+            except Exception:
+                pass
+            self._pendiente = None
         self.canvas.delete("all")
 
-        # Ejes de tiempo (encabezado)
-        for c in range(self._max_t):
-            x = self._left_pad + c * self._cell_w + self._cell_w / 2
+        w, h = self._tam()
+        t0 = int(self._x0)
+        t1 = int(math.ceil(self._x0 + self._columnas_visibles()))
+        n_rows = max(1, len(self._row_names))
+        r0 = self._y0
+        r1 = min(n_rows, r0 + self._filas_visibles())
+        detalle = self._cell_w >= self._ANCHO_LOD
+        x_fin = min(w, self._x(t1))
+        y_fin = self._y(r1)
+
+        # Ejes de tiempo (encabezado): un número cada 'paso' ticks
+        paso = _paso_etiquetas(self._cell_w)
+        for c in range((t0 + paso - 1) // paso * paso, t1, paso):
+            x = self._x(c) + (self._cell_w / 2 if detalle else 0)
             self.canvas.create_text(x, 12, text=str(c), fill="#cccccc", font=("Arial", 10))
 
-        # Líneas verticales y horizontales
-        # filas (procesos)
-        n_rows = max(1, len(self._row_names))
-        for r in range(n_rows + 1):
-            y = self._top_pad + r * self._cell_h
-            self.canvas.create_line(self._left_pad, y,
-                                    self._left_pad + self._max_t * self._cell_w, y,
-                                    fill="#2a2a2a")
-
-        for c in range(self._max_t + 1):
-            x = self._left_pad + c * self._cell_w
-            self.canvas.create_line(x, self._top_pad,
-                                    x, self._top_pad + n_rows * self._cell_h,
-                                    fill="#2a2a2a")
-
-        # Nombres de las filas
-        for i, name in enumerate(self._row_names or ["A", "B", "C"]):
-            y = self._top_pad + i * self._cell_h + self._cell_h / 2
-            self.canvas.create_text(self._left_pad - 20, y, text=name, fill="#dddddd", anchor="e")
+        # Líneas horizontales (filas) y, con zoom cercano, verticales (ticks)
+        for r in range(r0, r1 + 1):
+            y = self._y(r)
+            self.canvas.create_line(self._left_pad, y, x_fin, y, fill="#2a2a2a")
+        if detalle:
+            for c in range(t0, t1 + 1):
+                x = self._x(c)
+                if x >= self._left_pad:
+                    self.canvas.create_line(x, self._top_pad, x, y_fin, fill="#2a2a2a")
+
+        self._dibujar_marcas(t0, t1, r0, r1)
+
+        # Nombres de las filas (encima de lo que asome por la izquierda)
+        self.canvas.create_rectangle(0, 0, self._left_pad - 1, h, fill="#111111", width=0)
+        nombres = self._row_names or ["A", "B", "C"]
+        for i in range(r0, min(r1, len(nombres))):
+            y = self._y(i) + self._cell_h / 2
+            self.canvas.create_text(self._left_pad - 20, y, text=nombres[i], fill="#dddddd", anchor="e")
+
+        self._actualizar_scroll()
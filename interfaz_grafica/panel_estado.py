@@ -4,6 +4,7 @@ import customtkinter as ctk
 from typing import List, Dict, Any, Optional
 
 MONO = ("Consolas", 12)
+FILAS_POR_PAGINA = 500
 
 class PanelEstado(ctk.CTkFrame):
     def __init__(self, master, planificador):
@@ -49,11 +50,16 @@ class PanelEstado(ctk.CTkFrame):
     # ========== API esperada por VentanaPrincipal ==========
 
     def refrescar_tabla(self):
-        """Repinta la tabla de memoria usando planificador.obtener_procesos()."""
+        """
+        Repinta la tabla de memoria con las primeras FILAS_POR_PAGINA de
+        planificador.iter_procesos(): con cargas grandes (importadas, o en el
+        almacén compacto) no se arma la lista de todos los procesos.
+        """
         try:
-            procs = self.planificador.obtener_procesos()
+            total = self.planificador.cantidad_procesos()
+            procs = self.planificador.iter_procesos(0, FILAS_POR_PAGINA)
         except Exception:
-            procs = []
+            total, procs = 0, []
 
         header = " PID  NOMBRE   ESTADO        LLEGADA  CPU\n" + "-" * 52 + "\n"
         lineas = [header]
@@ -64,8 +70,10 @@ class PanelEstado(ctk.CTkFrame):
             leg = getattr(p, "instante_llegada", getattr(p, "llegada", ""))
             cpu = getattr(p, "cpu_total", getattr(p, "cpu", ""))
             lineas.append(f"{pid:>4}  {str(nom)[:10]:<10} {est:<12} {leg:>7}  {cpu:>3}\n")
+        if total > FILAS_POR_PAGINA:
+            lineas.append(f"... y {total - FILAS_POR_PAGINA} procesos más\n")
 
-        texto = "".join(lineas) if len(procs) else "Sin procesos cargados.\n"
+        texto = "".join(lineas) if total else "Sin procesos cargados.\n"
 
         self.txt_mem.configure(state="normal")
         self.txt_mem.delete("1.0", "end")
@@ -77,11 +85,20 @@ class PanelEstado(ctk.CTkFrame):
         self.lbl_peq.configure(text=f"t={t} | CPU: {cpu_txt} | Alg: {alg}")
 
     def mostrar_tabla_eficiencia(self):
-        """Abre una ventana con la tabla de métricas."""
+        """Abre una ventana con la tabla de métricas (filas paginadas, promedios O(1))."""
+        try:
+            prom = self.planificador.promedios_metricas()
+        except Exception:
+            prom = ("", "PROMEDIO", "", "", 0, 0, 0, 0, 0)
+        try:
+            # p. ej. MLFQ: promedios por nivel final
+            grupos = self.planificador.promedios_por_grupo()
+        except Exception:
+            grupos = []
         try:
-            filas, prom = self.planificador.obtener_metricas()
+            plazos = self.planificador.resumen_plazos()
         except Exception:
-            filas, prom = ([], ("", "PROMEDIO", "", "", 0, 0, 0, 0, 0))
+            plazos = {"con_plazo": 0}
 
         win = ctk.CTkToplevel(self)
         win.title("Tabla de Eficiencia")
@@ -93,21 +110,42 @@ class PanelEstado(ctk.CTkFrame):
         txt = ctk.CTkTextbox(win, font=MONO)
         txt.pack(fill="both", expand=True, padx=12, pady=(0, 12))
 
+        # Promedios arriba: así no se mueven al cargar más filas
         header = "PID  Nombre      Llegada  CPU  T. Fin  Retorno  Espera  Respuesta  Eficiencia\n" + "-" * 90 + "\n"
         txt.insert("end", header)
-        for (pid, nombre, llegada, cpu, tfin, ret, esp, resp, eff) in filas:
-            eff_str = f"{eff:.2f}" if isinstance(eff, (int, float)) and eff is not None else ""
-            txt.insert("end", f"{pid:>3}  {str(nombre)[:10]:<10}  {str(llegada):>7}  {str(cpu):>3}  {str(tfin):>5}  {str(ret):>7}  {str(esp):>6}  {str(resp):>9}  {eff_str:>10}\n")
-
-        # Promedios
-        _, pnom, _, _, ptfin, pret, pesp, presp, peff = prom
-        peff_str = f"{peff:.2f}" if isinstance(peff, (int, float)) else peff
-        txt.insert("end", "\n" + "-" * 90 + "\n")
-        txt.insert("end", f"     {pnom:<10}              {str(ptfin):>5}  {str(pret):>7}  {str(pesp):>6}  {str(presp):>9}  {peff_str:>10}\n")
-        txt.configure(state="disabled")
-
-        btn = ctk.CTkButton(win, text="Cerrar", command=win.destroy)
-        btn.pack(pady=(0, 10))
+        for _, pnom, _, _, ptfin, pret, pesp, presp, peff in [prom] + grupos:
+            peff_str = f"{peff:.2f}" if isinstance(peff, (int, float)) else peff
+            txt.insert("end", f"     {str(pnom)[:10]:<10}              {str(ptfin):>5}  {str(pret):>7}  {str(pesp):>6}  {str(presp):>9}  {peff_str:>10}\n")
+        if plazos["con_plazo"]:
+            txt.insert("end", f"     Plazos: {plazos['vencidos']}/{plazos['con_plazo']} vencidos | "
+                              f"retraso prom. {plazos['retraso']} | tardanza prom. {plazos['tardanza']} "
+                              f"(máx. {plazos['max_tardanza']})\n")
+        txt.insert("end", "-" * 90 + "\n")
+
+        pagina = {"inicio": 0}
+
+        def _cargar_pagina():
+            try:
+                filas = list(self.planificador.filas_metricas(pagina["inicio"], FILAS_POR_PAGINA))
+            except Exception:
+                filas = []
+            pagina["inicio"] += len(filas)
+            txt.configure(state="normal")
+            for (pid, nombre, llegada, cpu, tfin, ret, esp, resp, eff) in filas:
+                eff_str = f"{eff:.2f}" if isinstance(eff, (int, float)) and eff is not None else ""
+                txt.insert("end", f"{pid:>3}  {str(nombre)[:10]:<10}  {str(llegada):>7}  {str(cpu):>3}  {str(tfin):>5}  {str(ret):>7}  {str(esp):>6}  {str(resp):>9}  {eff_str:>10}\n")
+            txt.configure(state="disabled")
+            if len(filas) < FILAS_POR_PAGINA:
+                btn_mas.configure(state="disabled")
+
+        botones = ctk.CTkFrame(win, fg_color="transparent")
+        botones.pack(pady=(0, 10))
+        btn_mas = ctk.CTkButton(botones, text="Cargar más", command=_cargar_pagina)
+        btn_mas.pack(side="left", padx=6)
+        btn = ctk.CTkButton(botones, text="Cerrar", command=win.destroy)
+        btn.pack(side="left", padx=6)
+
+        _cargar_pagina()
 
     # ========== NUEVO: orden de finalización ==========
 
@@ -4,10 +4,15 @@ import customtkinter as ctk
 from tkinter import ttk
 
 
-def _ga(obj, key, default=None):
-    if isinstance(obj, dict):
-        return obj.get(key, default)
-    return getattr(obj, key, default)
+def _fila_vista(fila):
+    """Fila de métricas para el Treeview: None se muestra vacío."""
+    return tuple("" if v is None else v for v in fila)
+
+
+def _texto_plazos(plazos) -> str:
+    return (f"Plazos: {plazos['vencidos']}/{plazos['con_plazo']} vencidos | "
+            f"retraso prom. {plazos['retraso']} | tardanza prom. {plazos['tardanza']} "
+            f"(máx. {plazos['max_tardanza']})")
 
 
 class TablaEficiencia(ctk.CTkToplevel):
@@ -18,6 +23,7 @@ class TablaEficiencia(ctk.CTkToplevel):
     """
 
     COLS = ("PID", "Nombre", "Llegada", "CPU", "T. Fin", "Retorno", "Espera", "Respuesta", "Eficiencia")
+    FILAS_POR_PAGINA = 500
 
     def __init__(self, parent, planificador):
         super().__init__(parent)
@@ -46,60 +52,48 @@ class TablaEficiencia(ctk.CTkToplevel):
         self.tree.grid(row=0, column=0, sticky="nsew")
         yscroll.grid(row=0, column=1, sticky="ns")
 
-        btn = ctk.CTkButton(self, text="Cerrar", command=self.destroy)
-        btn.grid(row=1, column=0, pady=10)
+        botones = ctk.CTkFrame(self, fg_color="transparent")
+        botones.grid(row=1, column=0, pady=10)
+        self.btn_mas = ctk.CTkButton(botones, text="Cargar más", command=self._cargar_pagina)
+        self.btn_mas.pack(side="left", padx=6)
+        btn = ctk.CTkButton(botones, text="Cerrar", command=self.destroy)
+        btn.pack(side="left", padx=6)
 
         # ---- Poblar datos ----
+        # Filas y promedios salen del planificador (mismo cálculo que obtener_metricas):
+        # promedios en O(1) y filas por páginas para no congelar la UI con muchos procesos.
+        self.planificador = planificador
+        self._inicio = 0
+        try:
+            prom = planificador.promedios_metricas()
+        except Exception:
+            prom = ("", "PROMEDIO", "", "", "", "", "", "", "")
+        self.tree.insert("", "end", iid="promedio", values=_fila_vista(prom))
+        try:
+            # p. ej. MLFQ (por nivel final) o PRIORIDAD (por prioridad), debajo del general
+            grupos = planificador.promedios_por_grupo()
+        except Exception:
+            grupos = []
+        for fila in grupos:
+            self.tree.insert("", "end", values=_fila_vista(fila))
+        self._cargar_pagina()
+
+        # EDF: resumen de plazos (solo si algún proceso tiene deadline)
+        try:
+            plazos = planificador.resumen_plazos()
+        except Exception:
+            plazos = {"con_plazo": 0}
+        if plazos["con_plazo"]:
+            ctk.CTkLabel(self, text=_texto_plazos(plazos)).grid(row=2, column=0, sticky="w", padx=12, pady=(0, 8))
+
+    def _cargar_pagina(self):
         try:
-            procesos = list(planificador.obtener_procesos())
+            filas = list(self.planificador.filas_metricas(self._inicio, self.FILAS_POR_PAGINA))
         except Exception:
-            procesos = getattr(planificador, "_procesos", [])
-
-        filas = []
-        for p in procesos:
-            pid = _ga(p, "pid")
-            nombre = _ga(p, "nombre", f"P{pid}")
-            ti = int(_ga(p, "instante_llegada", 0) or 0)
-            t = int(_ga(p, "cpu_total", _ga(p, "cpu_restante", 0)) or 0)
-            tf = _ga(p, "t_fin", None)
-            ti_inicio = _ga(p, "t_inicio", None)
-
-            r = None
-            w = None
-            resp = None
-            eff = None
-
-            if tf is not None:
-                r = int(tf) - ti
-                w = r - t
-                resp = None if ti_inicio is None else (int(ti_inicio) - ti)
-                try:
-                    eff = round(t / r, 2) if r and r > 0 else None
-                except Exception:
-                    eff = None
-
-            filas.append((pid, nombre, ti, t,
-                          ("" if tf is None else int(tf)),
-                          ("" if r is None else r),
-                          ("" if w is None else w),
-                          ("" if resp is None else resp),
-                          ("" if eff is None else eff)))
-
-        # Insertar filas
+            filas = []
+        self._inicio += len(filas)
+        # las filas van antes de la de promedios, que queda siempre al final
         for row in filas:
-            self.tree.insert("", "end", values=row)
-
-        # Promedios
-        def _avg(ii):
-            vals = [v[ii] for v in filas if isinstance(v[ii], (int, float))]
-            return round(sum(vals) / len(vals), 2) if vals else ""
-
-        avg_tfin = _avg(4)
-        avg_r = _avg(5)
-        avg_w = _avg(6)
-        avg_resp = _avg(7)
-        # Promedio de eficiencias individuales (t/r)
-        eff_vals = [v[8] for v in filas if isinstance(v[8], (int, float))]
-        avg_eff = round(sum(eff_vals) / len(eff_vals), 2) if eff_vals else ""
-
-        self.tree.insert("", "end", values=("", "PROMEDIO", "", "", avg_tfin, avg_r, avg_w, avg_resp, avg_eff))
+            self.tree.insert("", self.tree.index("promedio"), values=_fila_vista(row))
+        if len(filas) < self.FILAS_POR_PAGINA:
+            self.btn_mas.configure(state="disabled")
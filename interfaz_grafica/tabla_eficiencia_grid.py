@@ -2,13 +2,16 @@
 from __future__ import annotations
 import customtkinter as ctk
 from tkinter import ttk
-from typing import Any, List
 
 
-def _ga(obj, k, d=None):
-    if isinstance(obj, dict):
-        return obj.get(k, d)
-    return getattr(obj, k, d)
+def _fila_vista(fila):
+    return tuple("" if v is None else v for v in fila)
+
+
+def _texto_plazos(plazos) -> str:
+    return (f"Plazos: {plazos['vencidos']}/{plazos['con_plazo']} vencidos | "
+            f"retraso prom. {plazos['retraso']} | tardanza prom. {plazos['tardanza']} "
+            f"(máx. {plazos['max_tardanza']})")
 
 
 class TablaEficienciaGrid(ctk.CTkToplevel):
@@ -18,6 +21,7 @@ class TablaEficienciaGrid(ctk.CTkToplevel):
     + fila de promedios.
     """
     COLS = ("PID","Nombre","Llegada","CPU","T. Fin","Retorno","Espera","Respuesta","Eficiencia")
+    FILAS_POR_PAGINA = 500
 
     def __init__(self, parent, planificador):
         super().__init__(parent)
@@ -41,43 +45,44 @@ class TablaEficienciaGrid(ctk.CTkToplevel):
         self.tree.grid(row=0, column=0, sticky="nsew")
         yscroll.grid(row=0, column=1, sticky="ns")
 
-        ctk.CTkButton(self, text="Cerrar", command=self.destroy).grid(row=1, column=0, pady=10)
+        botones = ctk.CTkFrame(self, fg_color="transparent")
+        botones.grid(row=1, column=0, pady=10)
+        self.btn_mas = ctk.CTkButton(botones, text="Cargar más", command=self._cargar_pagina)
+        self.btn_mas.pack(side="left", padx=6)
+        ctk.CTkButton(botones, text="Cerrar", command=self.destroy).pack(side="left", padx=6)
 
-        # Poblar
+        # Poblar (filas paginadas + promedios O(1) del planificador)
+        self.planificador = planificador
+        self._inicio = 0
         try:
-            procesos = list(planificador.obtener_procesos())
+            prom = planificador.promedios_metricas()
         except Exception:
-            procesos = getattr(planificador, "_procesos", [])
+            prom = ("", "PROMEDIO", "", "", "", "", "", "", "")
+        self.tree.insert("", "end", iid="promedio", values=_fila_vista(prom))
+        try:
+            # p. ej. MLFQ (por nivel final) o PRIORIDAD (por prioridad), debajo del general
+            grupos = planificador.promedios_por_grupo()
+        except Exception:
+            grupos = []
+        for fila in grupos:
+            self.tree.insert("", "end", values=_fila_vista(fila))
+        self._cargar_pagina()
 
-        filas = []
-        for p in procesos:
-            pid = _ga(p,"pid")
-            nombre = _ga(p,"nombre", f"P{pid}")
-            ti = int(_ga(p,"instante_llegada",0) or 0)
-            t = int(_ga(p,"cpu_total", _ga(p,"cpu_restante",0)) or 0)
-            tf = _ga(p,"t_fin", None)
-            ti_ini = _ga(p,"t_inicio", None)
-            r = w = resp = eff = None
-            if tf is not None:
-                r = int(tf) - ti
-                w = r - t
-                resp = None if ti_ini is None else int(ti_ini) - ti
-                eff = round(t / r, 2) if r and r>0 else None
-            filas.append((pid, nombre, ti, t,
-                          "" if tf is None else int(tf),
-                          "" if r is None else r,
-                          "" if w is None else w,
-                          "" if resp is None else resp,
-                          "" if eff is None else eff))
+        # EDF: resumen de plazos (solo si algún proceso tiene deadline)
+        try:
+            plazos = planificador.resumen_plazos()
+        except Exception:
+            plazos = {"con_plazo": 0}
+        if plazos["con_plazo"]:
+            ctk.CTkLabel(self, text=_texto_plazos(plazos)).grid(row=2, column=0, sticky="w", padx=12, pady=(0, 8))
 
+    def _cargar_pagina(self):
+        try:
+            filas = list(self.planificador.filas_metricas(self._inicio, self.FILAS_POR_PAGINA))
+        except Exception:
+            filas = []
+        self._inicio += len(filas)
         for row in filas:
-            self.tree.insert("", "end", values=row)
-
-        # Promedios (solo en columnas numéricas relevantes)
-        def _avg(idx):
-            vals = [v[idx] for v in filas if isinstance(v[idx], (int,float))]
-            return round(sum(vals)/len(vals),2) if vals else ""
-        avg_tf = _avg(4); avg_r = _avg(5); avg_w = _avg(6); avg_resp = _avg(7)
-        eff_vals = [v[8] for v in filas if isinstance(v[8], (int,float))]
-        avg_eff = round(sum(eff_vals)/len(eff_vals),2) if eff_vals else ""
-        self.tree.insert("", "end", values=("", "PROMEDIO", "", "", avg_tf, avg_r, avg_w, avg_resp, avg_eff))
+            self.tree.insert("", self.tree.index("promedio"), values=_fila_vista(row))
+        if len(filas) < self.FILAS_POR_PAGINA:
+            self.btn_mas.configure(state="disabled")
@@ -0,0 +1,203 @@
+# logica/almacen.py
+from __future__ import annotations
+import heapq
+import math
+from array import array
+from dataclasses import MISSING, fields
+from typing import Any, Dict, Iterator, List, Optional
+
+from logica.colas import ColaLlegadas
+from logica.planificador import PCB
+
+# Centinelas para representar None dentro de columnas tipadas
+_NULO_INT = -(2 ** 63)
+_NULO_FLOAT = math.nan
+
+
+def _tipo_columna(anotacion: str) -> str:
+    """'q' (int), 'd' (float) u 'o' (objeto en lista) según la anotación del campo de PCB."""
+    a = anotacion.replace("Optional[", "").rstrip("]").strip()
+    if a == "int":
+        return "q"
+    if a == "float":
+        return "d"
+    return "o"
+
+
+# Columnas derivadas de los campos de PCB: si PCB crece, el almacén también
+_COLUMNAS: Dict[str, str] = {f.name: _tipo_columna(str(f.type)) for f in fields(PCB)}
+_DEFECTOS: Dict[str, Any] = {f.name: (None if f.default is MISSING else f.default) for f in fields(PCB)}
+
+
+class AlmacenPCB:
+    """
+    Almacén columnar (struct-of-arrays) de PCBs para cargas muy grandes.
+    Los campos enteros/reales viven en array('q')/array('d') sin objetos por
+    proceso; el resto (nombre, estado) en listas que comparten las cadenas.
+    Se recorre y se indexa como la lista de PCBs a la que sustituye, pero
+    entrega vistas ligeras (VistaPCB) en lugar de objetos completos.
+    """
+
+    def __init__(self):
+        self._cols: Dict[str, Any] = {}
+        for nombre, tipo in _COLUMNAS.items():
+            self._cols[nombre] = [] if tipo == "o" else array(tipo)
+
+    def agregar(self, **valores) -> "VistaPCB":
+        """Agrega un proceso (mismos campos que PCB) y devuelve su vista."""
+        i = len(self)
+        for nombre, tipo in _COLUMNAS.items():
+            v = valores.get(nombre, _DEFECTOS[nombre])
+            if v is None and tipo != "o":
+                v = _NULO_INT if tipo == "q" else _NULO_FLOAT
+            self._cols[nombre].append(v)
+        return VistaPCB(self, i)
+
+    def agregar_bloque(self, pid0: int, nombres, llegadas, cpus,
+                       extras: Optional[Dict[str, Any]] = None) -> List["VistaPCB"]:
+        """
+        Alta masiva columna por columna (pid correlativos desde pid0).
+        'extras' trae columnas opcionales de PCB (p. ej. {"peso": [...]}).
+        nombres=None no guarda ninguna cadena: la vista dice P<pid>.
+        """
+        i0, n = len(self), len(cpus)
+        extras = extras or {}
+        for nombre, tipo in _COLUMNAS.items():
+            col = self._cols[nombre]
+            if nombre == "pid":
+                col.extend(range(pid0, pid0 + n))
+            elif nombre == "nombre":
+                col.extend([None] * n if nombres is None else nombres)
+            elif nombre == "instante_llegada":
+                col.extend(llegadas)
+            elif nombre in ("cpu_total", "cpu_restante"):
+                col.extend(cpus)
+            elif nombre in extras:
+                vals = extras[nombre]
+                if tipo == "q" and None in vals:
+                    vals = [_NULO_INT if v is None else v for v in vals]
+                col.extend(vals)
+            else:
+                v = _DEFECTOS[nombre]
+                if v is None and tipo != "o":
+                    v = _NULO_INT if tipo == "q" else _NULO_FLOAT
+                col.extend([v] * n)
+        return [VistaPCB(self, i) for i in range(i0, i0 + n)]
+
+    def __len__(self) -> int:
+        return len(self._cols["pid"])
+
+    def __getitem__(self, i: int) -> "VistaPCB":
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return VistaPCB(self, i)
+
+    def __iter__(self) -> Iterator["VistaPCB"]:
+        return (VistaPCB(self, i) for i in range(len(self)))
+
+    def columna(self, nombre: str):
+        """Acceso directo (sin copia) a una columna, p. ej. para exportar."""
+        return self._cols[nombre]
+
+
+class ColaLlegadasCompacta(ColaLlegadas):
+    """
+    Índice de llegadas para un AlmacenPCB: cada entrada es un único entero
+    (llegada << 40 | índice en el almacén) en lugar de una tupla con el
+    objeto, y la vista se crea recién al desapilar. El índice sigue el orden
+    de pid, así que el desempate es el mismo que en ColaLlegadas.
+    """
+    _BITS = 40
+
+    def __init__(self, almacen: AlmacenPCB):
+        super().__init__()
+        self._alm = almacen
+
+    def push(self, p: "VistaPCB"):
+        heapq.heappush(self._h, (p.instante_llegada << self._BITS) | p._i)
+
+    def proxima(self) -> Optional[int]:
+        return self._h[0] >> self._BITS if self._h else None
+
+    def pop(self) -> "VistaPCB":
+        return VistaPCB(self._alm, heapq.heappop(self._h) & ((1 << self._BITS) - 1))
+
+    def extend(self, ps):
+        b, llegada = self._BITS, self._alm._cols["instante_llegada"]
+        self._h.extend((llegada[p._i] << b) | p._i for p in ps)
+        heapq.heapify(self._h)
+
+    def __iter__(self) -> Iterator["VistaPCB"]:
+        mascara = (1 << self._BITS) - 1
+        return (VistaPCB(self._alm, k & mascara) for k in self._h)
+
+
+def _propiedad(nombre: str, tipo: str) -> property:
+    if tipo == "q":
+        def _get(self):
+            v = self._alm._cols[nombre][self._i]
+            return None if v == _NULO_INT else v
+
+        def _set(self, v):
+            self._alm._cols[nombre][self._i] = _NULO_INT if v is None else v
+    elif tipo == "d":
+        def _get(self):
+            v = self._alm._cols[nombre][self._i]
+            return None if v != v else v  # NaN => None
+
+        def _set(self, v):
+            self._alm._cols[nombre][self._i] = _NULO_FLOAT if v is None else v
+    else:
+        def _get(self):
+            return self._alm._cols[nombre][self._i]
+
+        def _set(self, v):
+            self._alm._cols[nombre][self._i] = v
+    return property(_get, _set)
+
+
+class VistaPCB:
+    """
+    Vista de un proceso dentro de un AlmacenPCB. Expone los mismos atributos
+    que PCB (incluidos los alias llegada/cpu) leyendo y escribiendo en las
+    columnas; no guarda datos propios.
+    """
+    __slots__ = ("_alm", "_i")
+
+    def __init__(self, almacen: AlmacenPCB, i: int):
+        self._alm = almacen
+        self._i = i
+
+    # --- ALIAS de compatibilidad para la UI ---
+    @property
+    def llegada(self) -> int:
+        return self.instante_llegada
+
+    @property
+    def cpu(self) -> int:
+        return self.cpu_total
+
+    def __eq__(self, otro) -> bool:
+        return isinstance(otro, VistaPCB) and otro._alm is self._alm and otro._i == self._i
+
+    def __hash__(self) -> int:
+        return hash((id(self._alm), self._i))
+
+    def __repr__(self) -> str:
+        campos = ", ".join(f"{n}={getattr(self, n)!r}" for n in _COLUMNAS)
+        return f"VistaPCB({campos})"
+
+
+for _nombre, _tipo in _COLUMNAS.items():
+    setattr(VistaPCB, _nombre, _propiedad(_nombre, _tipo))
+
+
+def _get_nombre(self):
+    # alta masiva sin nombres: P<pid> se arma al leer
+    v = self._alm._cols["nombre"][self._i]
+    return f"P{self.pid}" if v is None else v
+
+
+VistaPCB.nombre = property(_get_nombre, VistaPCB.nombre.fset)
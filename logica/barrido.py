@@ -0,0 +1,158 @@
+# logica/barrido.py
+"""
+Barrido de parámetros sin interfaz: corre la misma carga con cada
+combinación de algoritmo / quantum (RR) / capacidad de memoria en un pool
+de procesos y devuelve una tabla con los promedios de obtener_metricas().
+
+Uso por consola (carga .csv o .jsonl, ver logica/carga.py):
+    python -m logica.barrido carga.csv --alg FCFS SJF SRTF RR --quantum 1-50
+"""
+from __future__ import annotations
+import argparse
+import csv
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from algoritmos.estrategias import ESTRATEGIAS, nombres_estrategias
+from logica.carga import carga_con_extras
+from logica.gestor_memoria import GestorMemoria
+from logica.planificador import Planificador
+
+COLUMNAS = ("algoritmo", "quantum", "capacidad", "t_fin", "retorno", "espera", "respuesta", "eficiencia", "t_total")
+
+
+def configuraciones(algoritmos: Iterable[str], quantums: Iterable[int],
+                    capacidades: Iterable[int]) -> List[Tuple[str, Optional[int], int]]:
+    """
+    Grilla (algoritmo, quantum, capacidad) en orden estable.
+    El quantum solo se barre para estrategias cuyo turno depende de él (RR,
+    MLFQ, LOTERIA, STRIDE); el resto, CFS incluido, lleva None.
+    Un algoritmo que no está registrado levanta ValueError (no se cambia por FCFS).
+    """
+    algoritmos = [alg.strip().upper() for alg in algoritmos]
+    desconocidos = [alg for alg in algoritmos if alg not in ESTRATEGIAS]
+    if desconocidos:
+        raise ValueError(f"Estrategias desconocidas: {', '.join(desconocidos)} "
+                         f"(registradas: {', '.join(nombres_estrategias())})")
+    quantums = list(quantums)
+    capacidades = list(capacidades)
+    confs = []
+    for alg in algoritmos:
+        estrategia = ESTRATEGIAS[alg]
+        qs = quantums if estrategia.usa_quantum and not estrategia.quantum_propio else [None]
+        for q, cap in itertools.product(qs, capacidades):
+            confs.append((alg, q, int(cap)))
+    return confs
+
+
+def correr_configuracion(carga, algoritmo: str, quantum: Optional[int], capacidad: int) -> Dict[str, Any]:
+    """
+    Simula una configuración completa y devuelve su fila de promedios.
+    'carga': cualquier formato de Planificador.agregar_procesos_bulk().
+    """
+    plan = Planificador(GestorMemoria(capacidad_total=capacidad))
+    plan.set_algoritmo(algoritmo)
+    if quantum is not None:
+        plan.set_quantum(quantum)
+    plan.agregar_procesos_bulk(carga)
+    t_total = plan.ejecutar_hasta_fin()
+
+    _, prom = plan.obtener_metricas()
+    _, _, _, _, p_tfin, p_ret, p_esp, p_resp, p_eff = prom
+    return {
+        "algoritmo": algoritmo,
+        "quantum": quantum,
+        "capacidad": capacidad,
+        "t_fin": p_tfin,
+        "retorno": p_ret,
+        "espera": p_esp,
+        "respuesta": p_resp,
+        "eficiencia": p_eff,
+        "t_total": t_total,
+    }
+
+
+def _correr(args):
+    return correr_configuracion(*args)
+
+
+def barrer(carga,
+           algoritmos: Optional[Iterable[str]] = None,
+           quantums: Iterable[int] = (2,),
+           capacidades: Iterable[int] = (1024,),
+           workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Corre todas las combinaciones y devuelve una fila por configuración,
+    en el orden de configuraciones(). Cada simulación es determinista y el
+    pool devuelve los resultados en orden, así que la tabla no depende de
+    cuántos workers se usen. workers=1 corre todo en este proceso.
+    algoritmos=None barre todas las estrategias registradas.
+    'carga' se valida una sola vez aquí (formatos de logica/carga.py); sus
+    columnas opcionales (peso, nice, prioridad, deadline, memoria) se conservan.
+    """
+    nombres, cpu, llegada, extras = carga_con_extras(carga)
+    carga = {"cpu": list(cpu), "llegada": list(llegada), **extras}
+    if nombres is not None:
+        carga["nombre"] = list(nombres)
+    if algoritmos is None:
+        algoritmos = nombres_estrategias()
+    tareas = [(carga, alg, q, cap) for alg, q, cap in configuraciones(algoritmos, quantums, capacidades)]
+    if not tareas:
+        return []
+
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(tareas) == 1:
+        return [_correr(t) for t in tareas]
+
+    workers = min(workers, len(tareas))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_correr, tareas, chunksize=max(1, len(tareas) // (workers * 4))))
+
+
+# ---------------- CLI ----------------
+def _rango(texto: str) -> List[int]:
+    """'5' -> [5], '1-50' -> [1..50]"""
+    if "-" in texto:
+        a, b = texto.split("-", 1)
+        return list(range(int(a), int(b) + 1))
+    return [int(texto)]
+
+
+def formatear_tabla(filas: List[Dict[str, Any]]) -> str:
+    # la columna de algoritmo se ajusta al nombre más largo (PRIORIDAD_EXP...)
+    ancho = max([len("ALG")] + [len(str(f["algoritmo"])) for f in filas])
+    header = f"{'ALG':<{ancho}} {'Q':>3} {'RAM':>6}  {'T. Fin':>8}  {'Retorno':>8}  {'Espera':>8}  {'Respuesta':>9}  {'Eficiencia':>10}  {'T. total':>8}\n"
+    lineas = [header, "-" * len(header) + "\n"]
+    for f in filas:
+        q = "-" if f["quantum"] is None else f["quantum"]
+        lineas.append(f"{f['algoritmo']:<{ancho}} {q:>3} {f['capacidad']:>6}  {f['t_fin']:>8}  {f['retorno']:>8}  "
+                      f"{f['espera']:>8}  {f['respuesta']:>9}  {f['eficiencia']:>10}  {f['t_total']:>8}\n")
+    return "".join(lineas)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Barrido de algoritmos/quantum/memoria sobre una carga.")
+    ap.add_argument("carga", help=".csv o .jsonl con columnas nombre,cpu,llegada (y opcionales peso,nice,...)")
+    ap.add_argument("--alg", nargs="+", default=None, type=lambda s: s.strip().upper(),
+                    choices=nombres_estrategias(), help="por defecto, todas las estrategias registradas")
+    ap.add_argument("--quantum", nargs="+", default=["2"], help="valores o rangos, p. ej. 1-50")
+    ap.add_argument("--capacidad", nargs="+", type=int, default=[1024], help="MB de GestorMemoria")
+    ap.add_argument("--workers", type=int, default=None)
+    ap.add_argument("--salida", help="guardar la tabla como CSV")
+    args = ap.parse_args(argv)
+
+    quantums = sorted({q for txt in args.quantum for q in _rango(txt)})
+    filas = barrer(args.carga, args.alg, quantums, args.capacidad, args.workers)
+
+    if args.salida:
+        with open(args.salida, "w", newline="", encoding="utf-8") as f:
+            w = csv.DictWriter(f, fieldnames=COLUMNAS)
+            w.writeheader()
+            w.writerows(filas)
+    print(formatear_tabla(filas), end="")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+# logica/carga.py
+"""
+Lectura y validación de cargas de trabajo en bloque para
+Planificador.agregar_procesos_bulk().
+
+Una carga se normaliza a tres columnas: nombres (o None), cpu y llegada,
+más las columnas opcionales de PCB que traiga (CAMPOS_OPCIONALES: peso,
+nice, prioridad, deadline relativo a la llegada y memoria), que devuelve
+carga_con_extras(). Una celda vacía en una columna opcional deja el valor
+por defecto del PCB.
+Formatos aceptados:
+  - ruta a .csv (encabezado con columnas cpu, llegada y opcional nombre)
+  - ruta a .jsonl (un objeto por línea con las mismas claves)
+  - dict de columnas {"cpu": [...], "llegada": [...], "nombre": [...]}
+  - arreglo NumPy estructurado (campos cpu/llegada/nombre) o 2-D (cpu, llegada)
+  - iterable de filas (nombre, cpu, llegada) o dicts con esas claves
+"""
+from __future__ import annotations
+import csv
+import json
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# alias aceptados para cada columna (mismos nombres que agregar_proceso)
+_ALIAS = {
+    "nombre": ("nombre",),
+    "cpu": ("cpu", "tiempo_cpu", "duracion", "cpu_total"),
+    "llegada": ("llegada", "instante_llegada"),
+}
+# campos enteros opcionales de PCB que se pueden dar en un alta (masiva o no)
+CAMPOS_OPCIONALES = ("peso", "nice", "prioridad", "deadline", "memoria")
+_MAX_ERRORES = 5
+
+Columnas = Tuple[Optional[Sequence[str]], Sequence[int], Sequence[int]]
+Extras = Dict[str, List[Optional[int]]]
+ColumnasConExtras = Tuple[Optional[Sequence[str]], Sequence[int], Sequence[int], Extras]
+
+
+def leer_carga(ruta: str) -> Columnas:
+    """Lee un .csv o .jsonl y devuelve (nombres, cpu, llegada) ya validados."""
+    return _leer(ruta)[:3]
+
+
+def columnas_carga(datos: Any) -> Columnas:
+    """Normaliza cualquier formato aceptado a (nombres, cpu, llegada) y valida en bloque."""
+    return carga_con_extras(datos)[:3]
+
+
+def carga_con_extras(datos: Any) -> ColumnasConExtras:
+    """
+    Como columnas_carga() y además {campo: [valor o None, ...]} con las
+    columnas de CAMPOS_OPCIONALES presentes en la carga.
+    """
+    if isinstance(datos, (str, os.PathLike)):
+        return _leer(os.fspath(datos))
+    if hasattr(datos, "dtype"):
+        return _desde_numpy(datos)
+    if isinstance(datos, dict):
+        cols = {k: datos[c] for k, alias in _ALIAS.items() for c in alias if c in datos}
+        cols.update((k, datos[k]) for k in CAMPOS_OPCIONALES if k in datos)
+        return _desde_columnas(cols)
+    filas = list(datos)
+    if filas and isinstance(filas[0], dict):
+        return _desde_dicts(filas)
+    nombres, cpu, llegada = [], [], []
+    for i, fila in enumerate(filas):
+        if len(fila) != 3:
+            raise ValueError(f"fila {i}: se esperaban (nombre, cpu, llegada), no {fila!r}")
+        nombres.append(fila[0])
+        cpu.append(fila[1])
+        llegada.append(fila[2])
+    return _desde_columnas({"nombre": nombres, "cpu": cpu, "llegada": llegada})
+
+
+# ---------------- internos ----------------
+def _leer(ruta: str) -> ColumnasConExtras:
+    ext = os.path.splitext(str(ruta))[1].lower()
+    if ext == ".csv":
+        with open(ruta, newline="", encoding="utf-8") as f:
+            filas = list(csv.DictReader(f))
+    elif ext in (".jsonl", ".ndjson"):
+        with open(ruta, encoding="utf-8") as f:
+            filas = [json.loads(linea) for linea in f if linea.strip()]
+    else:
+        raise ValueError(f"Formato de carga no soportado: {ext or ruta!r} (use .csv o .jsonl)")
+    return _desde_dicts(filas)
+
+
+def _columna(d: dict, clave: str):
+    for c in _ALIAS[clave]:
+        if c in d:
+            return d[c]
+    return None
+
+
+def _desde_dicts(filas: List[dict]) -> ColumnasConExtras:
+    cols = {clave: [_columna(f, clave) for f in filas] for clave in _ALIAS}
+    if all(v is None for v in cols["nombre"]):
+        del cols["nombre"]
+    for clave in CAMPOS_OPCIONALES:
+        valores = [f.get(clave) for f in filas]
+        if any(v not in (None, "") for v in valores):
+            cols[clave] = valores
+    return _desde_columnas(cols)
+
+
+def _desde_columnas(cols: dict) -> ColumnasConExtras:
+    if "cpu" not in cols or "llegada" not in cols:
+        raise ValueError("La carga debe tener columnas 'cpu' y 'llegada'")
+    cpu = _enteros(cols["cpu"], "cpu")
+    llegada = _enteros(cols["llegada"], "llegada")
+    if len(cpu) != len(llegada):
+        raise ValueError("Las columnas 'cpu' y 'llegada' tienen distinta longitud")
+    nombres = cols.get("nombre")
+    if nombres is not None:
+        nombres = ["" if n is None else str(n) for n in nombres]
+        if len(nombres) != len(cpu):
+            raise ValueError("La columna 'nombre' tiene distinta longitud")
+    extras = {}
+    for clave in CAMPOS_OPCIONALES:
+        if clave in cols:
+            extras[clave] = _opcionales(cols[clave], clave)
+            if len(extras[clave]) != len(cpu):
+                raise ValueError(f"La columna '{clave}' tiene distinta longitud")
+    return nombres, cpu, llegada, extras
+
+
+def _enteros(valores, clave: str) -> List[int]:
+    """Convierte toda la columna y junta los errores en un solo ValueError."""
+    if hasattr(valores, "dtype"):
+        return _enteros_numpy(valores, clave)
+    res, errores = [], []
+    for i, v in enumerate(valores):
+        try:
+            x = int(v) if not isinstance(v, float) else (int(v) if v.is_integer() else None)
+        except (TypeError, ValueError):
+            x = None
+        if x is None or x < 0:
+            errores.append(f"fila {i}: {clave}={v!r}")
+            x = 0
+        res.append(x)
+    if errores:
+        _fallar(clave, errores)
+    return res
+
+
+def _opcionales(valores, clave: str) -> List[Optional[int]]:
+    """Enteros con signo; None o "" quedan en None (valor por defecto del PCB)."""
+    if hasattr(valores, "tolist"):
+        valores = valores.tolist()
+    res, errores = [], []
+    for i, v in enumerate(valores):
+        if v is None or v == "":
+            res.append(None)
+            continue
+        try:
+            x = int(v) if not isinstance(v, float) else (int(v) if v.is_integer() else None)
+        except (TypeError, ValueError):
+            x = None
+        if x is None:
+            errores.append(f"fila {i}: {clave}={v!r}")
+        res.append(x)
+    if errores:
+        _fallar(clave, errores, esperado="enteros")
+    return res
+
+
+def _desde_numpy(arr) -> ColumnasConExtras:
+    if arr.dtype.names:
+        cols = {k: arr[c] for k, alias in _ALIAS.items() for c in alias if c in arr.dtype.names}
+        cols.update((k, arr[k]) for k in CAMPOS_OPCIONALES if k in arr.dtype.names)
+        return _desde_columnas(cols)
+    if arr.ndim != 2 or arr.shape[1] != 2:
+        raise ValueError("Un arreglo NumPy sin campos debe tener forma (n, 2): columnas cpu, llegada")
+    return _desde_columnas({"cpu": arr[:, 0], "llegada": arr[:, 1]})
+
+
+def _enteros_numpy(col, clave: str):
+    import numpy as np
+
+    col = np.asarray(col).ravel()
+    if col.dtype.kind in "iu":
+        malos = np.flatnonzero(col < 0)
+    elif col.dtype.kind == "f":
+        malos = np.flatnonzero(~np.isfinite(col) | (col != np.floor(col)) | (col < 0))
+    else:
+        raise ValueError(f"La columna '{clave}' debe ser numérica (dtype {col.dtype})")
+    if malos.size:
+        _fallar(clave, [f"fila {i}: {clave}={col[i]!r}" for i in malos[:_MAX_ERRORES]], total=int(malos.size))
+    return col.astype(np.int64, copy=False)
+
+
+def _fallar(clave: str, errores: List[str], total: Optional[int] = None, esperado: str = "enteros >= 0"):
+    total = len(errores) if total is None else total
+    detalle = "; ".join(errores[:_MAX_ERRORES])
+    extra = f" (y {total - _MAX_ERRORES} más)" if total > _MAX_ERRORES else ""
+    raise ValueError(f"{total} valor(es) inválido(s) en '{clave}' (se esperan {esperado}): {detalle}{extra}")
@@ -0,0 +1,143 @@
+# logica/colas.py
+"""Colas de listos y de llegadas que usan Planificador y las estrategias."""
+from __future__ import annotations
+import heapq
+import itertools
+from collections import deque
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from logica.planificador import PCB
+
+
+# ---------------- Colas de listos ----------------
+class ColaListos:
+    """
+    Interfaz común de las colas de listos: push/pop/peek, len e iteración.
+    Cada entrada guarda un nº de secuencia de encolado para poder listarla
+    (estado_cpu) y reconstruirla en el mismo orden si se cambia de algoritmo.
+    """
+    def __init__(self):
+        self._seq = itertools.count()
+
+    def push(self, p: PCB, seq: Optional[int] = None):
+        raise NotImplementedError
+
+    def pop(self) -> PCB:
+        raise NotImplementedError
+
+    def peek(self) -> PCB:
+        raise NotImplementedError
+
+    def pares(self) -> List[Tuple[int, PCB]]:
+        """Entradas (seq, pcb) en orden de encolado."""
+        raise NotImplementedError
+
+    def extend(self, ps: Iterable[PCB]):
+        for p in ps:
+            self.push(p)
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def __iter__(self) -> Iterator[PCB]:
+        return (p for _, p in self.pares())
+
+
+class ColaFIFO(ColaListos):
+    """Cola de listos en orden de encolado (RR)."""
+    def __init__(self):
+        super().__init__()
+        self._q: deque = deque()
+
+    def push(self, p: PCB, seq: Optional[int] = None):
+        self._q.append((next(self._seq) if seq is None else seq, p))
+
+    def pop(self) -> PCB:
+        return self._q.popleft()[1]
+
+    def peek(self) -> PCB:
+        return self._q[0][1]
+
+    def pares(self) -> List[Tuple[int, PCB]]:
+        return list(self._q)
+
+    def __len__(self) -> int:
+        return len(self._q)
+
+    def __iter__(self) -> Iterator[PCB]:
+        return (p for _, p in self._q)
+
+
+class ColaHeap(ColaListos):
+    """
+    Cola de listos indexada por clave (heap): push/pop O(log n), peek O(1).
+    La clave debe terminar en pid para que el desempate sea total.
+    El listado en orden de encolado (pares/iteración) se ordena una vez y
+    se reusa hasta el próximo push/extend/pop: estado_cpu en cada tick no
+    reordena una cola que no cambió.
+    """
+    def __init__(self, clave: Callable[[PCB], tuple]):
+        super().__init__()
+        self._clave = clave
+        self._h: List[tuple] = []
+        self._vista: Optional[List[Tuple[int, PCB]]] = None
+
+    def push(self, p: PCB, seq: Optional[int] = None):
+        heapq.heappush(self._h, (self._clave(p), next(self._seq) if seq is None else seq, p))
+        self._vista = None
+
+    def extend(self, ps: Iterable[PCB]):
+        # alta masiva: agregar todo y reordenar una sola vez (O(n))
+        clave, seq = self._clave, self._seq
+        self._h.extend((clave(p), next(seq), p) for p in ps)
+        heapq.heapify(self._h)
+        self._vista = None
+
+    def pop(self) -> PCB:
+        self._vista = None
+        return heapq.heappop(self._h)[2]
+
+    def peek(self) -> PCB:
+        return self._h[0][2]
+
+    def _en_orden(self) -> List[Tuple[int, PCB]]:
+        if self._vista is None:
+            self._vista = sorted(((seq, p) for _, seq, p in self._h), key=lambda e: e[0])
+        return self._vista
+
+    def pares(self) -> List[Tuple[int, PCB]]:
+        return list(self._en_orden())
+
+    def __len__(self) -> int:
+        return len(self._h)
+
+    def __iter__(self) -> Iterator[PCB]:
+        return (p for _, p in self._en_orden())
+
+
+class ColaLlegadas:
+    """Procesos que aún no llegaron, en heap por (instante_llegada, pid)."""
+    def __init__(self):
+        self._h: List[Tuple[int, int, PCB]] = []
+
+    def push(self, p: PCB):
+        heapq.heappush(self._h, (p.instante_llegada, p.pid, p))
+
+    def extend(self, ps: Iterable[PCB]):
+        self._h.extend((p.instante_llegada, p.pid, p) for p in ps)
+        heapq.heapify(self._h)
+
+    def proxima(self) -> Optional[int]:
+        """Instante de la próxima llegada (None si no queda ninguna)."""
+        return self._h[0][0] if self._h else None
+
+    def pop(self) -> PCB:
+        return heapq.heappop(self._h)[2]
+
+    def __len__(self) -> int:
+        return len(self._h)
+
+    def __iter__(self) -> Iterator[PCB]:
+        """Procesos pendientes, sin orden garantizado."""
+        return (p for _, _, p in self._h)
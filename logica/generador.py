@@ -0,0 +1,114 @@
+# logica/generador.py
+"""
+Cargas sintéticas reproducibles para Planificador, generadas con NumPy por
+bloques: ningún paso arma los procesos como objetos de Python, así que se
+pueden alimentar 10^7 procesos sin tenerlos todos en memoria a la vez.
+
+  llegadas: "poisson" (entre llegadas exponenciales de media 1/tasa) o
+            "rafagas" (ráfagas de ~'rafaga' procesos muy seguidos separadas
+            por huecos largos; a la larga, la misma tasa)
+  cpu:      "exponencial", "lognormal" o "bimodal" (cortos de media cpu_media
+            y una fracción prop_largos de largos de media cpu_media_larga)
+  memoria:  lognormal de media ram_media MB, recortada a la capacidad del
+            GestorMemoria (ningún proceso pide más RAM que la total)
+
+Cada columna sale de su propio flujo aleatorio (SeedSequence(semilla)), así
+que la misma semilla da exactamente los mismos bytes, sea cual sea el tamaño
+de bloque.
+
+Uso:
+    plan = Planificador(GestorMemoria(), compacto=True)
+    alimentar(plan, generar(10_000_000, semilla=7, llegadas="rafagas", cpu="bimodal",
+                            capacidad=plan.gestor.capacidad_total))
+"""
+from __future__ import annotations
+from typing import Dict, Iterator, Optional
+
+import numpy as np
+
+LLEGADAS = ("poisson", "rafagas")
+DISTRIBUCIONES_CPU = ("exponencial", "lognormal", "bimodal")
+BLOQUE = 1 << 20
+
+
+def generar(n: int, *, semilla: int = 0,
+            llegadas: str = "poisson", tasa: float = 0.1, rafaga: float = 20.0, intensidad: float = 10.0,
+            cpu: str = "exponencial", cpu_media: float = 8.0, cpu_sigma: float = 1.0,
+            cpu_media_larga: float = 100.0, prop_largos: float = 0.1,
+            ram_media: float = 128.0, ram_sigma: float = 0.5, capacidad: Optional[int] = None,
+            bloque: int = BLOQUE) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Genera 'n' procesos en bloques de hasta 'bloque' filas. Cada bloque es un
+    dict de arreglos int64 {"cpu", "llegada", "memoria"} en orden de llegada
+    (lo acepta agregar_procesos_bulk; ver alimentar()). cpu >= 1, memoria >= 1.
+    """
+    if llegadas not in LLEGADAS:
+        raise ValueError(f"llegadas debe ser uno de {LLEGADAS} (no {llegadas!r})")
+    if cpu not in DISTRIBUCIONES_CPU:
+        raise ValueError(f"cpu debe ser uno de {DISTRIBUCIONES_CPU} (no {cpu!r})")
+    if tasa <= 0 or bloque < 1:
+        raise ValueError("'tasa' y 'bloque' deben ser positivos")
+
+    # un flujo por columna: lo que se saca de uno no corre a los demás
+    # (las marcas y los valores de ráfagas/largos van aparte: cada flujo se
+    # consume siempre en el mismo orden, con bloques grandes o chicos)
+    r_llegada, r_rafaga, r_hueco, r_cpu, r_largo, r_cpu_largo, r_ram = (
+        np.random.Generator(np.random.PCG64(s)) for s in np.random.SeedSequence(semilla).spawn(7))
+
+    # ráfagas: dentro de una, llegadas 'intensidad' veces más seguidas; el
+    # hueco entre ráfagas compensa para que la tasa media siga siendo 'tasa'
+    media_dentro = 1.0 / (tasa * intensidad)
+    media_hueco = rafaga * (1.0 / tasa - media_dentro)
+    mu_cpu = np.log(cpu_media) - cpu_sigma ** 2 / 2
+    mu_ram = np.log(ram_media) - ram_sigma ** 2 / 2
+    tope_ram = None if capacidad is None else max(1, int(capacidad))
+
+    reloj = 0.0   # instante (real) de la última llegada generada
+    hechos = 0
+    while hechos < n:
+        m = min(bloque, n - hechos)
+
+        if llegadas == "poisson":
+            entre = r_llegada.exponential(1.0 / tasa, m)
+        else:
+            entre = r_llegada.exponential(media_dentro, m)
+            nuevas = r_rafaga.random(m) < 1.0 / rafaga
+            entre[nuevas] += r_hueco.exponential(media_hueco, int(nuevas.sum()))
+        # el reloj anterior va al frente: misma suma, en el mismo orden, que de una sola vez
+        t = np.cumsum(np.concatenate(([reloj], entre)))[1:]
+        reloj = float(t[-1])
+
+        if cpu == "exponencial":
+            rafagas = r_cpu.exponential(cpu_media, m)
+        elif cpu == "lognormal":
+            rafagas = r_cpu.lognormal(mu_cpu, cpu_sigma, m)
+        else:
+            rafagas = r_cpu.exponential(cpu_media, m)
+            largos = r_largo.random(m) < prop_largos
+            rafagas[largos] = r_cpu_largo.exponential(cpu_media_larga, int(largos.sum()))
+
+        ram = np.maximum(1, np.rint(r_ram.lognormal(mu_ram, ram_sigma, m))).astype(np.int64)
+        if tope_ram is not None:
+            np.minimum(ram, tope_ram, out=ram)
+
+        yield {
+            "cpu": np.maximum(1, np.ceil(rafagas)).astype(np.int64),
+            "llegada": np.floor(t).astype(np.int64),
+            "memoria": ram,
+        }
+        hechos += m
+
+
+def alimentar(planificador, bloques) -> int:
+    """
+    Da de alta los bloques de generar() a medida que la simulación los
+    alcanza y la corre hasta el final. Antes de cada bloque se avanza hasta
+    justo antes de su primera llegada, así la cola de llegadas nunca tiene
+    más de un bloque; el resultado es el mismo que dar de alta todo al
+    principio. Devuelve el instante final (como ejecutar_hasta_fin()).
+    """
+    for b in bloques:
+        if len(b["llegada"]):
+            planificador.avanzar_hasta(int(b["llegada"][0]) - 1)
+        planificador.agregar_procesos_bulk(b)
+    return planificador.ejecutar_hasta_fin()
@@ -0,0 +1,100 @@
+# logica/linea_tiempo.py
+"""
+Historial de ejecución comprimido por tramos (RLE): (pid, inicio, fin) con
+fin exclusivo, uno por corrida continua de un proceso en la CPU. Los ticks
+ociosos no se guardan (son los huecos entre tramos).
+
+Planificador registra cada tick (o cada salto del modo por eventos) y los
+consecutivos del mismo pid se funden en el último tramo, así que la memoria
+crece con los cambios de contexto y no con los ticks. Los tramos quedan
+ordenados por inicio y sin solaparse: quien_en(t) y el recorte por ventana
+de segmentos() son búsquedas binarias.
+"""
+from __future__ import annotations
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+Segmento = Tuple[int, int, int]   # (pid, inicio, fin)
+
+
+class LineaTiempo:
+    """Tres columnas array('q') paralelas: pid, inicio y fin de cada tramo."""
+
+    def __init__(self):
+        self._pid = array("q")
+        self._ini = array("q")
+        self._fin = array("q")
+
+    def registrar(self, pid: int, t: int, n: int = 1):
+        """pid ejecutó los ticks [t, t + n); se funde con el último tramo si lo continúa."""
+        if n <= 0:
+            return
+        if self._fin and self._fin[-1] == t and self._pid[-1] == pid:
+            self._fin[-1] = t + n
+        else:
+            self._pid.append(pid)
+            self._ini.append(t)
+            self._fin.append(t + n)
+
+    def __len__(self) -> int:
+        return len(self._pid)
+
+    def __iter__(self) -> Iterator[Segmento]:
+        return zip(self._pid, self._ini, self._fin)
+
+    def fin(self) -> int:
+        """Instante en que termina el último tramo (0 si no hay ninguno)."""
+        return self._fin[-1] if self._fin else 0
+
+    def segmentos(self, desde: Optional[int] = None, hasta: Optional[int] = None) -> Iterator[Segmento]:
+        """
+        Tramos que tocan la ventana [desde, hasta), recortados a ella; sin
+        argumentos, todos. Costo O(log n + tramos entregados).
+        """
+        i = 0 if desde is None else bisect_right(self._fin, desde)
+        j = len(self._pid) if hasta is None else bisect_left(self._ini, hasta)
+        pid, ini, fin = self._pid, self._ini, self._fin
+        for k in range(i, j):
+            a, b = ini[k], fin[k]
+            if desde is not None and a < desde:
+                a = desde
+            if hasta is not None and b > hasta:
+                b = hasta
+            yield pid[k], a, b
+
+    def quien_en(self, t: int) -> Optional[int]:
+        """pid que estaba en CPU durante el tick t (None si la CPU estaba ociosa)."""
+        k = bisect_right(self._ini, t) - 1
+        if k >= 0 and t < self._fin[k]:
+            return self._pid[k]
+        return None
+
+    def tramos_de(self, pid: int) -> List[Tuple[int, int]]:
+        """[(inicio, fin), ...] de un proceso (recorre todo el historial)."""
+        return [(a, b) for p, a, b in self if p == pid]
+
+    def columnas(self) -> Tuple[array, array, array]:
+        """(pid, inicio, fin) como array('q') sin copia, p. ej. para exportar."""
+        return self._pid, self._ini, self._fin
+
+    def a_numpy(self) -> Dict[str, Any]:
+        """{"pid", "inicio", "fin"} como arreglos int64 (copias)."""
+        import numpy as np
+        return {"pid": np.array(self._pid, dtype=np.int64),
+                "inicio": np.array(self._ini, dtype=np.int64),
+                "fin": np.array(self._fin, dtype=np.int64)}
+
+    def estado(self) -> List[List[int]]:
+        """Forma serializable para snapshot(): [pids, inicios, fines]."""
+        return [self._pid.tolist(), self._ini.tolist(), self._fin.tolist()]
+
+    @classmethod
+    def desde_estado(cls, estado: Optional[List[List[int]]]) -> "LineaTiempo":
+        linea = cls()
+        if estado:
+            pids, inis, fines = estado
+            linea._pid.extend(pids)
+            linea._ini.extend(inis)
+            linea._fin.extend(fines)
+        return linea
@@ -0,0 +1,82 @@
+# logica/motor_batch.py
+from __future__ import annotations
+import heapq
+from typing import Dict
+
+import numpy as np
+
+
+def planificar_batch(llegadas, rafagas, algoritmo: str = "FCFS") -> Dict[str, np.ndarray]:
+    """
+    Calcula de una vez el plan no expropiativo (FCFS o SJF) de una carga dada
+    como arreglos, sin simular tick a tick. El proceso i equivale al que
+    Planificador.agregar_proceso crearía con pid i+1, mismo algoritmo.
+
+    Devuelve un dict de arreglos int64 en el orden de entrada:
+      t_inicio, t_fin, retorno (t_fin - llegada), espera (retorno - cpu),
+      respuesta (t_inicio - llegada)
+    con los mismos valores que deja Planificador en cada PCB / obtener_metricas().
+
+    FCFS es cerrado y vectorizado: con los trabajos ordenados por (llegada, pid),
+    t_fin_i = S_i + max_{j<=i}(llegada_j - S_{j-1}), con S la suma acumulada
+    de ráfagas. SJF necesita un heap por (cpu, llegada, pid): O(n log n).
+    """
+    alg = (algoritmo or "FCFS").strip().upper()
+    if alg not in ("FCFS", "SJF"):
+        raise ValueError(f"planificar_batch solo admite FCFS o SJF (no {algoritmo!r})")
+
+    llegada = np.asarray(llegadas, dtype=np.int64).ravel()
+    cpu = np.asarray(rafagas, dtype=np.int64).ravel()
+    if llegada.shape != cpu.shape:
+        raise ValueError("llegadas y rafagas deben tener la misma longitud")
+
+    # Igual que el planificador: el reloj arranca en 0 y cada tick descuenta
+    # 1 de CPU, así que una ráfaga <= 0 igual ocupa un tick.
+    disponible = np.maximum(llegada, 0)
+    duracion = np.maximum(cpu, 1)
+
+    # orden estable por llegada => desempate por pid (índice de entrada)
+    orden = np.argsort(llegada, kind="stable")
+
+    if alg == "FCFS":
+        d = duracion[orden]
+        s = np.cumsum(d)
+        s_prev = s - d
+        t_fin_ord = s + np.maximum.accumulate(disponible[orden] - s_prev)
+        t_fin = np.empty_like(t_fin_ord)
+        t_fin[orden] = t_fin_ord
+        t_inicio = t_fin - duracion
+    else:
+        t_inicio = _sjf(orden.tolist(), disponible.tolist(), llegada.tolist(),
+                        cpu.tolist(), duracion.tolist())
+        t_fin = t_inicio + duracion
+
+    retorno = t_fin - llegada
+    return {
+        "t_inicio": t_inicio,
+        "t_fin": t_fin,
+        "retorno": retorno,
+        "espera": retorno - cpu,
+        "respuesta": t_inicio - llegada,
+    }
+
+
+def _sjf(orden, disponible, llegada, cpu, duracion) -> np.ndarray:
+    """SJF no expropiativo por eventos; devuelve t_inicio en orden de entrada."""
+    n = len(orden)
+    t_inicio = [0] * n
+    listos = []
+    t = 0
+    k = 0
+    for _ in range(n):
+        if not listos:
+            # CPU ociosa: saltar a la próxima llegada
+            t = max(t, disponible[orden[k]])
+        while k < n and disponible[orden[k]] <= t:
+            i = orden[k]
+            heapq.heappush(listos, (cpu[i], llegada[i], i))
+            k += 1
+        i = heapq.heappop(listos)[2]
+        t_inicio[i] = t
+        t += duracion[i]
+    return np.asarray(t_inicio, dtype=np.int64)
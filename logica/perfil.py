@@ -0,0 +1,131 @@
+# logica/perfil.py
+"""
+Perfil por fases del camino caliente de Planificador (ver Planificador.set_perfil).
+
+Con un PerfilTick conectado, los métodos de cada fase de _tick se envuelven
+(cronometrar()) y se suma tiempo de pared y llamadas por fase:
+  llegadas     mover los que llegaron a la cola de listos
+  degradar     reencolar el que agotó su quantum (RR, MLFQ...)
+  reloj        on_tick de estrategias con reloj (boost de MLFQ...)
+  expropiar    chequeo (y cambio) de expropiación (SRTF, EDF...)
+  seleccionar  elegir el próximo running
+  ejecutar     descontar el tick, fin o agotamiento de quantum
+  resumen      armar el resumen del tick y la traza
+más 'salto' (tramos sin eventos del modo por eventos) y 'estado_cpu' (la
+foto que pide la UI), e histogramas de largo de la cola de listos y de la
+de llegadas al comenzar cada tick (cubetas por potencia de 2). Los ticks de
+un salto cuentan todos, con las colas como estaban: en un salto no cambian.
+Una fase solo suma llamadas en los ticks en que corre (p. ej. 'degradar'
+solo si hay un reencolado pendiente).
+
+PlanificadorMultinucleo no tiene esas fases: mide 'abrir' (llegadas,
+reencolados, balanceo y selección en un instante), 'cerrar' (fines de tramo
+agendados) y 'estado_cpu'; la cola de listos del histograma es la suma de
+las de todos los núcleos.
+
+Sin perfil conectado Planificador usa sus métodos de siempre: no se mide nada.
+"""
+from __future__ import annotations
+import json
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, List, Optional, Union
+
+FASES = ("llegadas", "degradar", "reloj", "expropiar", "seleccionar", "ejecutar", "resumen",
+         "salto", "estado_cpu", "abrir", "cerrar")
+
+
+class PerfilTick:
+    """
+    Acumulados por fase. 'volcado' (ruta de un .jsonl o función que recibe
+    resumen()) recibe una foto cada 'cada' ticks; None, sin volcado periódico.
+    """
+    reloj = staticmethod(perf_counter_ns)
+
+    def __init__(self, volcado: Union[str, Callable[[Dict[str, Any]], Any], None] = None,
+                 cada: int = 100_000):
+        self.ns = dict.fromkeys(FASES, 0)
+        self.llamadas = dict.fromkeys(FASES, 0)
+        self.ticks = 0
+        # cubeta k = int.bit_length(largo): 0, 1, 2-3, 4-7, ...
+        self.hist_listos: List[int] = []
+        self.hist_llegadas: List[int] = []
+        self._volcado = volcado
+        self._cada = max(1, int(cada))
+        self._proximo_volcado = self._cada
+
+    def sumar(self, fase: str, ns: int):
+        self.ns[fase] += ns
+        self.llamadas[fase] += 1
+
+    def cronometrar(self, fase: str, fn: Callable) -> Callable:
+        """fn envuelta: cada llamada suma su tiempo y una llamada a 'fase'."""
+        reloj, sumar = self.reloj, self.sumar
+
+        def medido(*args):
+            t0 = reloj()
+            try:
+                return fn(*args)
+            finally:
+                sumar(fase, reloj() - t0)
+        return medido
+
+    def contar_tick(self, listos: int, llegadas: int, n: int = 1):
+        """n ticks (más de uno en un salto) que empezaron con esos largos de cola."""
+        self.ticks += n
+        for hist, largo in ((self.hist_listos, listos), (self.hist_llegadas, llegadas)):
+            k = largo.bit_length()
+            if k >= len(hist):
+                hist.extend([0] * (k + 1 - len(hist)))
+            hist[k] += n
+        if self._volcado is not None and self.ticks >= self._proximo_volcado:
+            self._proximo_volcado += self._cada
+            self.volcar()
+
+    def volcar(self):
+        foto = self.resumen()
+        if callable(self._volcado):
+            self._volcado(foto)
+        elif self._volcado is not None:
+            with open(self._volcado, "a", encoding="utf-8") as f:
+                f.write(json.dumps(foto, separators=(",", ":")) + "\n")
+
+    def resumen(self) -> Dict[str, Any]:
+        """Foto serializable: por fase llamadas, segundos y µs por llamada; histogramas."""
+        fases = {}
+        for fase in FASES:
+            n, ns = self.llamadas[fase], self.ns[fase]
+            fases[fase] = {
+                "llamadas": n,
+                "segundos": round(ns / 1e9, 6),
+                "us_por_llamada": round(ns / n / 1e3, 3) if n else 0.0,
+            }
+        return {
+            "ticks": self.ticks,
+            "fases": fases,
+            "hist_listos": _cubetas(self.hist_listos),
+            "hist_llegadas": _cubetas(self.hist_llegadas),
+        }
+
+    def reiniciar(self):
+        self.__init__(self._volcado, self._cada)
+
+
+def _cubetas(hist: List[int]) -> Dict[str, int]:
+    """{"0": n, "1": n, "2-3": n, "4-7": n, ...} sin las cubetas vacías."""
+    res = {}
+    for k, n in enumerate(hist):
+        if n:
+            res[str(k) if k < 2 else f"{1 << (k - 1)}-{(1 << k) - 1}"] = n
+    return res
+
+
+def formatear_perfil(resumen: Optional[Dict[str, Any]]) -> str:
+    if not resumen:
+        return "Perfil desactivado.\n"
+    total = sum(f["segundos"] for f in resumen["fases"].values()) or 1.0
+    lineas = [f"{'fase':<12} {'llamadas':>12} {'segundos':>10} {'µs/llamada':>11} {'%':>6}\n"]
+    for fase, f in resumen["fases"].items():
+        lineas.append(f"{fase:<12} {f['llamadas']:>12} {f['segundos']:>10.4f} {f['us_por_llamada']:>11.3f} "
+                      f"{100 * f['segundos'] / total:>6.1f}\n")
+    lineas.append(f"ticks: {resumen['ticks']}  listos: {resumen['hist_listos']}  llegadas: {resumen['hist_llegadas']}\n")
+    return "".join(lineas)
@@ -1,10 +1,20 @@
 # logica/planificador.py
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import List, Optional, Dict, Any
+import copy
+import gc
+import json
+import operator
+from dataclasses import dataclass, fields
+from fractions import Fraction
+from typing import Iterable, Iterator, List, Optional, Dict, Any, Tuple
 
+from algoritmos.estrategias import ESTRATEGIAS, crear_estrategia
+from logica.carga import CAMPOS_OPCIONALES, carga_con_extras
+from logica.colas import ColaListos, ColaLlegadas
+from logica.linea_tiempo import LineaTiempo
 
-@dataclass
+
+@dataclass(slots=True)
 class PCB:
     pid: int
     nombre: str
@@ -19,6 +29,19 @@ class PCB:
     retorno: Optional[int] = None      # t_fin - llegada
     espera: Optional[int] = None       # retorno - cpu_total
     eficiencia: Optional[float] = None # cpu_total / retorno
+    # MLFQ: nivel actual (al terminar, el nivel final)
+    nivel: Optional[int] = None
+    # boletos / peso para el reparto proporcional (LOTERIA, STRIDE)
+    peso: int = 1
+    # CFS: nice (-20..19) y tiempo virtual acumulado (en 1/1024 de tick a nice 0)
+    nice: int = 0
+    vruntime: int = 0
+    # PRIORIDAD: menor número = más prioridad (envejece mientras espera)
+    prioridad: int = 0
+    # EDF: instante absoluto en que el proceso debería haber terminado
+    deadline: Optional[int] = None
+    # RAM requerida en MB (p. ej. de logica/generador.py)
+    memoria: int = 0
 
     # --- ALIAS de compatibilidad para la UI ---
     @property
@@ -30,17 +53,103 @@ class PCB:
         return self.cpu_total
 
 
+# Campos de PCB que guarda un snapshot (se siguen de la dataclass si crece)
+CAMPOS_PCB: Tuple[str, ...] = tuple(f.name for f in fields(PCB))
+# (método, fase de PerfilTick) que set_perfil() cronometra
+_FASES_PERFIL = (("_llegadas", "llegadas"), ("_degradar", "degradar"), ("_reloj", "reloj"),
+                 ("_expropiar", "expropiar"), ("_seleccionar", "seleccionar"), ("_ejecutar", "ejecutar"),
+                 ("_resumen_tick", "resumen"), ("_saltar", "salto"), ("estado_cpu", "estado_cpu"))
+# valor por defecto de cada campo opcional (celda vacía en una carga)
+_DEFECTOS_EXTRA = {f.name: f.default for f in fields(PCB) if f.name in CAMPOS_OPCIONALES}
+_leer_campos = operator.attrgetter(*CAMPOS_PCB)
+
+
+class MetricasAcumuladas:
+    """
+    Sumas y conteos de las columnas promediadas en la tabla de eficiencia.
+    Se actualizan al iniciar (respuesta) y al terminar (resto) cada proceso,
+    así los promedios salen en O(1) y están disponibles durante la corrida.
+    """
+    def __init__(self):
+        self.n_iniciados = 0
+        self.suma_respuesta = 0
+        self.n_terminados = 0
+        self.suma_t_fin = 0
+        self.suma_retorno = 0
+        self.suma_espera = 0
+        self.suma_eficiencia_c = 0   # en centésimas: suma exacta, sin depender del orden
+        # plazos (solo procesos con deadline)
+        self.n_con_plazo = 0
+        self.n_vencidos = 0
+        self.suma_retraso = 0        # lateness: t_fin - deadline (negativo si sobró tiempo)
+        self.suma_tardanza = 0       # tardiness: max(0, retraso)
+        self.max_tardanza = 0
+
+    def registrar_inicio(self, p: PCB):
+        self.n_iniciados += 1
+        self.suma_respuesta += p.respuesta
+
+    def registrar_fin(self, p: PCB):
+        self.n_terminados += 1
+        self.suma_t_fin += p.t_fin
+        self.suma_retorno += p.retorno
+        self.suma_espera += p.espera
+        # igual que la fila de obtener_metricas(): redondeada a 2 y 0.0 si retorno <= 0
+        if p.retorno > 0:
+            self.suma_eficiencia_c += round(round(p.cpu_total / p.retorno, 2) * 100)
+        if p.deadline is not None:
+            retraso = p.t_fin - p.deadline
+            self.n_con_plazo += 1
+            self.suma_retraso += retraso
+            if retraso > 0:
+                self.n_vencidos += 1
+                self.suma_tardanza += retraso
+                self.max_tardanza = max(self.max_tardanza, retraso)
+
+    def fila_promedios(self) -> tuple:
+        def _avg(suma, n):
+            return round(suma / n, 2) if n else 0
+        n = self.n_terminados
+        return (
+            "", "PROMEDIO", "", "",
+            _avg(self.suma_t_fin, n),
+            _avg(self.suma_retorno, n),
+            _avg(self.suma_espera, n),
+            _avg(self.suma_respuesta, self.n_iniciados),
+            round(Fraction(self.suma_eficiencia_c, n)) / 100 if n else 0,
+        )
+
+    def resumen_plazos(self) -> Dict[str, Any]:
+        n = self.n_con_plazo
+        return {
+            "con_plazo": n,
+            "vencidos": self.n_vencidos,
+            "retraso": round(self.suma_retraso / n, 2) if n else 0,
+            "tardanza": round(self.suma_tardanza / n, 2) if n else 0,
+            "max_tardanza": self.max_tardanza,
+        }
+
+
 class Planificador:
-    def __init__(self, gestor_memoria):
+    def __init__(self, gestor_memoria, compacto: bool = False):
+        """
+        compacto=True guarda los procesos en un AlmacenPCB columnar (menos
+        memoria para cargas de millones de procesos); obtener_procesos()
+        entrega entonces vistas ligeras con la misma interfaz que PCB.
+        """
         self.gestor = gestor_memoria
+        self._compacto = bool(compacto)
         self._t: int = 0
         self._pid_counter: int = 1
         self._alg: str = "FCFS"
         self._quantum_cfg: int = 2
+        # parámetros por estrategia (p. ej. niveles de MLFQ), ver configurar_estrategia()
+        self._params_estrategia: Dict[str, Dict[str, Any]] = {}
 
-        self._procesos: List[PCB] = []
-        self._nuevos: List[PCB] = []
-        self._ready: List[PCB] = []
+        self._procesos = self._nuevo_almacen()
+        # por orden de llegada: solo se desapilan los que ya llegaron
+        self._nuevos: ColaLlegadas = self._nueva_cola_llegadas()
+        self._ready: ColaListos = self._nueva_cola()
         self._finalizados_tick: List[PCB] = []
         self._running: Optional[PCB] = None
 
@@ -50,13 +159,26 @@ class Planificador:
 
         # NUEVO: orden global de finalización (para el panel de la izquierda)
         self._orden_finalizacion: List[PCB] = []
+        self._metricas = MetricasAcumuladas()
+        # historial de ejecución por tramos (pid, inicio, fin), ver segmentos()
+        self._linea = LineaTiempo()
+
+        # Sumidero opcional de traza por tick (logica/traza.py)
+        self._traza = None
+        # Perfil por fases opcional (logica/perfil.py)
+        self._perfil = None
 
     # ---------------- Config ----------------
     def set_algoritmo(self, nombre: str):
         nombre = (nombre or "FCFS").strip().upper()
-        if nombre not in ("FCFS", "SJF", "SRTF", "RR"):
+        if nombre not in ESTRATEGIAS:
             nombre = "FCFS"
-        self._alg = nombre
+        if nombre != self._alg:
+            # cada estrategia tiene su propia estructura; se conserva el orden de encolado.
+            # La cola nueva se arma antes de tocar nada: si falla, queda todo como estaba
+            cola = crear_estrategia(nombre, self._ready.pares(), **self._params_estrategia.get(nombre, {}))
+            self._alg = nombre
+            self._ready = cola
 
     # Compatibilidad con otros nombres usados por la UI
     seleccionar_algoritmo = set_algoritmo
@@ -69,6 +191,65 @@ class Planificador:
             q = 2
         self._quantum_cfg = max(1, q)
 
+    def configurar_estrategia(self, nombre: str, **parametros):
+        """
+        Parámetros propios de una estrategia registrada, p. ej.
+        configurar_estrategia("MLFQ", niveles=4, quantums=[2, 4, 8, 16], periodo_boost=200).
+        Si es la estrategia en uso, se rearma su cola conservando los procesos.
+        """
+        nombre = (nombre or "").strip().upper()
+        if nombre not in ESTRATEGIAS:
+            raise ValueError(f"Estrategia desconocida: {nombre!r}")
+        parametros = copy.deepcopy(parametros)
+        # se valida armando la estrategia: parámetros inválidos levantan aquí y no se guardan
+        pares = self._ready.pares() if nombre == self._alg else None
+        cola = crear_estrategia(nombre, pares, **parametros)
+        self._params_estrategia[nombre] = parametros
+        if nombre == self._alg:
+            self._ready = cola
+
+    def set_traza(self, traza):
+        """
+        Conecta un sumidero (TrazaJSONL / TrazaBinaria o cualquier objeto con
+        escribir(resumen) y escribir_tramo(t, n, pid, alg)) que recibe el
+        resumen de cada tick, también de los que salta el modo por eventos.
+        None lo desconecta. Cerrar el sumidero queda a cargo de quien lo creó.
+        """
+        self._traza = traza
+
+    def set_perfil(self, perfil):
+        """
+        Conecta un PerfilTick (logica/perfil.py): las fases de _tick (y el
+        salto del modo por eventos y estado_cpu) se reemplazan en esta
+        instancia por versiones cronometradas; el cuerpo de _tick es el mismo.
+        None lo desconecta y quedan los métodos de siempre, sin medición.
+        """
+        for metodo in ("_tick",) + tuple(m for m, _ in _FASES_PERFIL):
+            self.__dict__.pop(metodo, None)
+        self._perfil = perfil
+        if perfil is None:
+            return
+        for metodo, fase in _FASES_PERFIL:
+            setattr(self, metodo, perfil.cronometrar(fase, getattr(self, metodo)))
+        saltar, tick = self._saltar, self._tick
+
+        # los histogramas cuentan todos los ticks: los saltados con las colas
+        # como estaban (en un salto no cambian)
+        def _tick_perfilado():
+            perfil.contar_tick(len(self._ready), len(self._nuevos))
+            return tick()
+
+        def _saltar_perfilado(k: int):
+            perfil.contar_tick(len(self._ready), len(self._nuevos), k)
+            saltar(k)
+
+        self._tick = _tick_perfilado
+        self._saltar = _saltar_perfilado
+
+    def perfil(self) -> Optional[Dict[str, Any]]:
+        """PerfilTick.resumen() del perfil conectado (None si no hay)."""
+        return None if self._perfil is None else self._perfil.resumen()
+
     # --------------- Altas ------------------
     def agregar_proceso(
         self,
@@ -78,7 +259,21 @@ class Planificador:
         *,
         cpu: Optional[int] = None,
         llegada: Optional[int] = None,
+        peso: Optional[int] = None,
+        nice: Optional[int] = None,
+        prioridad: Optional[int] = None,
+        memoria: Optional[int] = None,
+        deadline: Optional[int] = None,
+        periodo: Optional[int] = None,
+        repeticiones: int = 1,
     ):
+        """
+        'prioridad': menor número = más prioridad (PRIORIDAD, PRIORIDAD_EXP).
+        'deadline' es el plazo relativo a la llegada (PCB.deadline guarda el
+        instante absoluto). Con 'periodo' se da de alta una tarea periódica:
+        'repeticiones' trabajos nombre#0, nombre#1... que llegan cada 'periodo'
+        ticks, cada uno con su plazo (por defecto, el propio período).
+        """
         # Firma flexible
         if cpu is not None and tiempo_cpu is None:
             tiempo_cpu = cpu
@@ -89,24 +284,119 @@ class Planificador:
         if instante_llegada is None:
             instante_llegada = 0
 
-        pcb = PCB(
+        extras = {}
+        if peso is not None:
+            extras["peso"] = int(peso)
+        if nice is not None:
+            extras["nice"] = max(-20, min(19, int(nice)))
+        if prioridad is not None:
+            extras["prioridad"] = int(prioridad)
+        if memoria is not None:
+            extras["memoria"] = max(0, int(memoria))
+        if periodo is not None:
+            self._agregar_periodica(str(nombre), int(tiempo_cpu), int(instante_llegada),
+                                    int(periodo), int(repeticiones), deadline, extras)
+            return
+
+        campos = dict(
             pid=self._pid_counter,
             nombre=str(nombre),
             instante_llegada=int(instante_llegada),
             cpu_total=int(tiempo_cpu),
             cpu_restante=int(tiempo_cpu),
+            **extras,
         )
+        if deadline is not None:
+            campos["deadline"] = int(instante_llegada) + int(deadline)
         self._pid_counter += 1
-
-        self._procesos.append(pcb)
-        if pcb.instante_llegada <= self._t:
-            self._ready.append(pcb)
-        else:
-            self._nuevos.append(pcb)
+        self._encolar_alta(self._alta_pcb(campos))
+
+    def _agregar_periodica(self, nombre: str, cpu: int, llegada: int, periodo: int,
+                           repeticiones: int, deadline: Optional[int], extras: Dict[str, int]):
+        # todos los trabajos de una vez por el alta masiva: llegan por el heap
+        # de llegadas, así que no hay que revisar nada en cada tick
+        if periodo < 1 or repeticiones < 1:
+            raise ValueError("'periodo' y 'repeticiones' deben ser >= 1")
+        plazo = periodo if deadline is None else int(deadline)
+        llegadas = range(llegada, llegada + periodo * repeticiones, periodo)
+        columnas = {campo: [v] * repeticiones for campo, v in extras.items()}
+        columnas["deadline"] = [plazo] * repeticiones
+        self.agregar_procesos_bulk(
+            {"nombre": [f"{nombre}#{k}" for k in range(repeticiones)],
+             "cpu": [cpu] * repeticiones, "llegada": list(llegadas)},
+            **columnas)
+
+    def agregar_procesos_bulk(self, datos, nombres: Optional[Iterable[str]] = None,
+                              pesos: Optional[Iterable[int]] = None, **columnas: Iterable[int]) -> int:
+        """
+        Alta masiva. 'datos' puede ser una ruta .csv/.jsonl, un dict de columnas,
+        un arreglo NumPy o un iterable de filas (nombre, cpu, llegada); ver
+        logica/carga.py. Valida todo antes de dar de alta (ValueError con las
+        filas inválidas), asigna los pid en una pasada y arma las colas de una
+        vez. Sin nombre, cada proceso se llama P<pid>. 'pesos' (boletos) y
+        cualquier otro campo entero de PCB (p. ej. nice=[...]) son opcionales,
+        un valor por proceso; 'deadline', como en agregar_proceso(), es el
+        plazo relativo a la llegada de cada uno. Las mismas columnas pueden
+        venir en la carga (ver logica/carga.py); las dadas aquí tienen
+        prioridad. Devuelve cuántos agregó.
+        """
+        noms, cpu, llegada, opcionales = carga_con_extras(datos)
+        if nombres is not None:
+            noms = [str(x) for x in nombres]
+            if len(noms) != len(cpu):
+                raise ValueError("'nombres' no tiene la misma longitud que la carga")
+        cpu = cpu.tolist() if hasattr(cpu, "tolist") else cpu
+        llegada = llegada.tolist() if hasattr(llegada, "tolist") else llegada
+        n = len(cpu)
+        if pesos is not None:
+            columnas["peso"] = pesos
+        columnas = {**opcionales, **columnas}
+        extras = {}
+        for campo, valores in columnas.items():
+            if campo not in _DEFECTOS_EXTRA:
+                raise ValueError(f"'{campo}' no es un campo opcional de PCB")
+            defecto = _DEFECTOS_EXTRA[campo]
+            extras[campo] = [defecto if v is None else int(v) for v in valores]
+            if len(extras[campo]) != n:
+                raise ValueError(f"'{campo}' no tiene la misma longitud que la carga")
+        if "deadline" in extras:
+            extras["deadline"] = [None if d is None else ll + d for ll, d in zip(llegada, extras["deadline"])]
+        pid0 = self._pid_counter
+        self._pid_counter += n
+        if noms is None and not self._compacto:
+            noms = [f"P{pid}" for pid in range(pid0, pid0 + n)]
+
+        # millones de objetos nuevos sin ciclos: pausar el GC evita recorridos inútiles
+        gc_activo = gc.isenabled()
+        gc.disable()
+        try:
+            if self._compacto:
+                pcbs = self._procesos.agregar_bloque(pid0, noms, llegada, cpu, extras)
+            else:
+                pcbs = list(map(PCB, range(pid0, pid0 + n), noms, llegada, cpu, cpu))
+                for campo, valores in extras.items():
+                    for p, v in zip(pcbs, valores):
+                        setattr(p, campo, v)
+                self._procesos.extend(pcbs)
+
+            self._encolar_bloque(pcbs, llegada)
+        finally:
+            if gc_activo:
+                gc.enable()
+        return n
 
     def obtener_procesos(self) -> List[PCB]:
         return list(self._procesos)
 
+    def iter_procesos(self, inicio: int = 0, cantidad: Optional[int] = None) -> Iterator[PCB]:
+        """PCBs desde 'inicio' sin armar la lista entera (paginable, como filas_metricas)."""
+        fin = len(self._procesos) if cantidad is None else min(len(self._procesos), inicio + cantidad)
+        for i in range(max(0, inicio), fin):
+            yield self._procesos[i]
+
+    def cantidad_procesos(self) -> int:
+        return len(self._procesos)
+
     def esta_terminado(self) -> bool:
         """True si ya no queda nada por ejecutar ni por llegar."""
         return not (self._running or self._ready or self._nuevos or self._rr_demote_pending)
@@ -127,6 +417,24 @@ class Planificador:
             "orden_finalizacion": orden,
         }
 
+    # ------------- Historial de ejecución -----------
+    def linea_tiempo(self) -> LineaTiempo:
+        """Historial por tramos (logica/linea_tiempo.py): columnas, a_numpy(), tramos_de()..."""
+        return self._linea
+
+    def segmentos(self, desde: Optional[int] = None, hasta: Optional[int] = None) -> Iterator[Tuple[int, int, int]]:
+        """(pid, inicio, fin) de cada corrida continua en CPU, opcionalmente recortados a [desde, hasta)."""
+        return self.linea_tiempo().segmentos(desde, hasta)
+
+    def quien_en(self, t: int) -> Optional[int]:
+        """pid que ejecutó el tick t (None: CPU ociosa o t todavía no simulado)."""
+        return self.linea_tiempo().quien_en(int(t))
+
+    def segmentos_gantt(self, desde: Optional[int] = None, hasta: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Tramos en el formato de los Gantt: [{"t": inicio, "nombre": ..., "duracion": ...}, ...]."""
+        nombre = lambda pid: self._pcb_por_pid(pid).nombre  # noqa: E731
+        return [{"t": a, "nombre": nombre(pid), "duracion": b - a} for pid, a, b in self.segmentos(desde, hasta)]
+
     # ------------- API pública --------------
     def tick(self):
         """Avanza exactamente 1 tick y devuelve un resumen para el UI."""
@@ -139,20 +447,127 @@ class Planificador:
         for _ in range(max(1, int(n))):
             self._tick()
 
+    def avanzar_hasta(self, t: int) -> int:
+        """
+        Avanza la simulación hasta el instante 't' (equivale a llamar tick()
+        t - tiempo_actual veces) pero saltando de evento en evento:
+        llegadas, finalizaciones y vencimientos de quantum en RR.
+        Devuelve el instante alcanzado.
+        """
+        t = int(t)
+        while self._t < t:
+            k = self._ticks_sin_eventos(t)
+            if k > 0:
+                self._saltar(k)
+            else:
+                self._tick()
+        return self._t
+
+    def ejecutar_hasta_fin(self) -> int:
+        """Modo por eventos: ejecuta hasta que no quede nada. Devuelve t final."""
+        while not self.esta_terminado():
+            k = self._ticks_sin_eventos(None)
+            if k > 0:
+                self._saltar(k)
+            else:
+                self._tick()
+        return self._t
+
     def reiniciar(self):
+        """Vuelve a t=0 reutilizando los mismos PCBs (sin volver a darlos de alta)."""
         self._t = 0
-        self._pid_counter = 1
-        antiguos = self._procesos
-        self._procesos = []
-        self._nuevos = []
-        self._ready = []
+        self._nuevos = self._nueva_cola_llegadas()
+        self._ready = self._nueva_cola()
         self._finalizados_tick = []
         self._running = None
         self._rr_q_left = 0
         self._rr_demote_pending = None
         self._orden_finalizacion = []
-        for p in antiguos:
-            self.agregar_proceso(p.nombre, tiempo_cpu=p.cpu_total, instante_llegada=p.instante_llegada)
+        self._metricas = MetricasAcumuladas()
+        self._linea = LineaTiempo()
+        for p in self._procesos:
+            p.cpu_restante = p.cpu_total
+            p.estado = "En espera"
+            p.t_inicio = p.t_fin = None
+            p.respuesta = p.retorno = p.espera = p.eficiencia = None
+            p.nivel = None
+            p.vruntime = 0
+            self._encolar_alta(p)
+
+    # ------------- Snapshot / restore -------------
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Estado completo en forma compacta y serializable (solo listas, tuplas,
+        números y cadenas): reloj, colas (por pid), running, estado de RR,
+        acumulados de métricas, historial de ejecución y el progreso de cada
+        PCB (tupla por CAMPOS_PCB).
+        """
+        pid = lambda p: None if p is None else p.pid  # noqa: E731
+        return {
+            "t": self._t,
+            "alg": self._alg,
+            "quantum": self._quantum_cfg,
+            "params_estrategia": copy.deepcopy(self._params_estrategia),
+            "pid_counter": self._pid_counter,
+            "campos": CAMPOS_PCB,
+            "procesos": [_leer_campos(p) for p in self._procesos],
+            "nuevos": [p.pid for p in self._nuevos],
+            "ready": [(seq, p.pid) for seq, p in self._ready.pares()],
+            "estrategia": self._ready.estado(),
+            "running": pid(self._running),
+            "rr_q_left": self._rr_q_left,
+            "rr_demote_pending": pid(self._rr_demote_pending),
+            "finalizados_tick": [p.pid for p in self._finalizados_tick],
+            "orden_finalizacion": [p.pid for p in self._orden_finalizacion],
+            "metricas": dict(vars(self._metricas)),
+            "linea_tiempo": self._linea.estado(),
+        }
+
+    def restore(self, snap: Dict[str, Any]):
+        """
+        Vuelve al estado de un snapshot(). Si la cantidad de procesos coincide
+        se actualizan los PCBs existentes en el lugar (las referencias de la UI
+        siguen siendo válidas); si no, se recrean.
+        """
+        campos = tuple(snap["campos"])
+        datos = snap["procesos"]
+        if len(datos) != len(self._procesos):
+            self._procesos = self._nuevo_almacen()
+            for valores in datos:
+                self._alta_pcb(dict(zip(campos, valores)))
+        else:
+            for p, valores in zip(self._procesos, datos):
+                for c, v in zip(campos, valores):
+                    setattr(p, c, v)
+
+        por_pid = self._pcb_por_pid
+        self._t = snap["t"]
+        self._alg = snap["alg"]
+        self._quantum_cfg = snap["quantum"]
+        self._params_estrategia = copy.deepcopy(snap.get("params_estrategia", {}))
+        self._pid_counter = snap["pid_counter"]
+        self._nuevos = self._nueva_cola_llegadas()
+        for pid in snap["nuevos"]:
+            self._nuevos.push(por_pid(pid))
+        self._ready = self._nueva_cola([(seq, por_pid(pid)) for seq, pid in snap["ready"]],
+                                       snap.get("estrategia"))
+        self._running = None if snap["running"] is None else por_pid(snap["running"])
+        self._rr_q_left = snap["rr_q_left"]
+        pend = snap["rr_demote_pending"]
+        self._rr_demote_pending = None if pend is None else por_pid(pend)
+        self._finalizados_tick = [por_pid(pid) for pid in snap["finalizados_tick"]]
+        self._orden_finalizacion = [por_pid(pid) for pid in snap["orden_finalizacion"]]
+        self._metricas = MetricasAcumuladas()
+        vars(self._metricas).update(snap["metricas"])
+        self._linea = LineaTiempo.desde_estado(snap.get("linea_tiempo"))
+
+    def guardar_snapshot(self, ruta: str):
+        with open(ruta, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, separators=(",", ":"))
+
+    def cargar_snapshot(self, ruta: str):
+        with open(ruta, encoding="utf-8") as f:
+            self.restore(json.load(f))
 
     # ------------- Métricas / Tabla de eficiencia -------------
     def obtener_metricas(self):
@@ -160,132 +575,287 @@ class Planificador:
         Devuelve una lista de filas con:
         (pid, nombre, llegada, cpu_total, t_fin, retorno, espera, respuesta, eficiencia)
         y una fila de promedios al final (con 'PROMEDIO' en la columna nombre).
+        Para muchos procesos conviene filas_metricas() paginado + promedios_metricas().
         """
+        return list(self.filas_metricas()), self.promedios_metricas()
+
+    def filas_metricas(self, inicio: int = 0, cantidad: Optional[int] = None) -> Iterator[tuple]:
+        """Filas de obtener_metricas() generadas bajo demanda, desde 'inicio' (paginable)."""
+        fin = len(self._procesos) if cantidad is None else min(len(self._procesos), inicio + cantidad)
+        for i in range(max(0, inicio), fin):
+            yield self._fila_metricas(self._procesos[i])
+
+    def promedios_metricas(self) -> tuple:
+        """Fila de promedios en O(1) (acumulados durante la simulación)."""
+        return self._metricas.fila_promedios()
+
+    @staticmethod
+    def _fila_metricas(p) -> tuple:
+        llegada = p.instante_llegada
+        cpu = p.cpu_total
+        t_fin = p.t_fin
+        if t_fin is not None:
+            retorno = t_fin - llegada
+            espera = retorno - cpu
+            eficiencia = round(cpu / retorno, 2) if retorno and retorno > 0 else 0.0
+        else:
+            retorno = None
+            espera = None
+            eficiencia = None
+        return (p.pid, p.nombre, llegada, cpu, t_fin, retorno, espera, p.respuesta, eficiencia)
+
+    def promedios_por_grupo(self, campo: Optional[str] = None) -> List[tuple]:
+        """
+        Filas de promedios (como promedios_metricas()) de los procesos ya
+        terminados, agrupados por el valor final de un campo del PCB. Sin
+        'campo' se usa el de la estrategia en uso (p. ej. "nivel" en MLFQ);
+        si no agrupa por nada, lista vacía. La columna nombre dice "campo=valor".
+        """
+        campo = campo or self._ready.campo_grupo
+        if not campo:
+            return []
+        grupos: Dict[Any, MetricasAcumuladas] = {}
+        for p in self._orden_finalizacion:
+            m = grupos.setdefault(getattr(p, campo), MetricasAcumuladas())
+            m.registrar_inicio(p)
+            m.registrar_fin(p)
         filas = []
-        for p in self._procesos:
-            pid = p.pid
-            nombre = p.nombre
-            llegada = p.instante_llegada
-            cpu = p.cpu_total
+        for valor in sorted(grupos, key=lambda v: (v is None, v)):
+            fila = grupos[valor].fila_promedios()
+            filas.append(fila[:1] + (f"{campo}={valor}",) + fila[2:])
+        return filas
 
+    def obtener_metricas_plazos(self):
+        """
+        Como obtener_metricas() pero de plazos (EDF), solo de los procesos con
+        deadline: filas (pid, nombre, deadline, t_fin, retraso, tardanza, vencido)
+        y el resumen de resumen_plazos(). retraso = t_fin - deadline (lateness),
+        tardanza = max(0, retraso) (tardiness); None mientras no termine.
+        """
+        return list(self.filas_plazos()), self.resumen_plazos()
+
+    def filas_plazos(self) -> Iterator[tuple]:
+        for p in self._procesos:
+            deadline = p.deadline
+            if deadline is None:
+                continue
             t_fin = p.t_fin
-            if t_fin is not None:
-                retorno = t_fin - llegada
-                espera = retorno - cpu
-                respuesta = p.respuesta if p.respuesta is not None else None
-                eficiencia = round(cpu / retorno, 2) if retorno and retorno > 0 else 0.0
+            if t_fin is None:
+                yield (p.pid, p.nombre, deadline, None, None, None, None)
             else:
-                retorno = None
-                espera = None
-                respuesta = p.respuesta if p.respuesta is not None else None
-                eficiencia = None
-
-            filas.append((pid, nombre, llegada, cpu, t_fin, retorno, espera, respuesta, eficiencia))
-
-        # Promedios (solo de columnas numéricas presentes)
-        def _avg(idx: int):
-            vals = [v[idx] for v in filas if isinstance(v[idx], (int, float))]
-            return round(sum(vals) / len(vals), 2) if vals else 0
+                retraso = t_fin - deadline
+                yield (p.pid, p.nombre, deadline, t_fin, retraso, max(0, retraso), retraso > 0)
 
-        fila_prom = (
-            "", "PROMEDIO", "", "",
-            _avg(4),  # t_fin
-            _avg(5),  # retorno
-            _avg(6),  # espera
-            _avg(7),  # respuesta
-            _avg(8),  # eficiencia
-        )
-
-        return filas, fila_prom
+    def resumen_plazos(self) -> Dict[str, Any]:
+        """
+        En O(1): procesos terminados con deadline, cuántos vencieron, retraso y
+        tardanza promedio y tardanza máxima.
+        """
+        return self._metricas.resumen_plazos()
 
     def obtener_orden_finalizacion(self) -> List[Dict[str, Any]]:
         """Conveniencia para la UI."""
         return [{"pid": p.pid, "nombre": p.nombre, "t_fin": p.t_fin} for p in self._orden_finalizacion]
 
     # ------------- Interno ------------------
+    def _nueva_cola(self, pares: Optional[List[Tuple[int, PCB]]] = None, estado: Optional[dict] = None) -> ColaListos:
+        """Cola (estrategia) del algoritmo actual con sus parámetros configurados."""
+        return crear_estrategia(self._alg, pares, estado, **self._params_estrategia.get(self._alg, {}))
+
+    def _nuevo_almacen(self):
+        if self._compacto:
+            from logica.almacen import AlmacenPCB  # import diferido: almacen importa PCB
+            return AlmacenPCB()
+        return []
+
+    def _alta_pcb(self, campos: Dict[str, Any]):
+        """Crea el PCB (o su vista en modo compacto) y lo agrega a _procesos."""
+        if self._compacto:
+            return self._procesos.agregar(**campos)
+        pcb = PCB(**campos)
+        self._procesos.append(pcb)
+        return pcb
+
+    def _encolar_alta(self, pcb):
+        if pcb.instante_llegada <= self._t:
+            self._ready.on_arrival(pcb)
+        else:
+            self._nuevos.push(pcb)
+
+    def _encolar_bloque(self, pcbs, llegada):
+        t = self._t
+        self._ready.extend(p for p, ll in zip(pcbs, llegada) if ll <= t)
+        self._nuevos.extend(p for p, ll in zip(pcbs, llegada) if ll > t)
+
+    def _pcb_por_pid(self, pid: int):
+        # los pid se asignan correlativos desde 1 en orden de alta
+        return self._procesos[pid - 1]
+
+    def _nueva_cola_llegadas(self) -> ColaLlegadas:
+        if self._compacto:
+            from logica.almacen import ColaLlegadasCompacta
+            return ColaLlegadasCompacta(self._procesos)
+        return ColaLlegadas()
+
+    def _ticks_sin_eventos(self, limite: Optional[int]) -> int:
+        """
+        Cuántos ticks, a partir de self._t, se pueden saltar de golpe porque
+        ninguno cambia colas ni running (sin llegadas, sin selección, sin
+        expropiación, sin fin ni agotamiento de quantum).
+        0 => el próximo tick tiene un evento y debe ejecutarse con _tick().
+        """
+        if self._rr_demote_pending is not None:
+            return 0
+
+        prox_llegada = self._nuevos.proxima()
+        if prox_llegada is not None and prox_llegada <= self._t:
+            return 0
+
+        if self._running is None:
+            if self._ready:
+                return 0
+            if prox_llegada is None:
+                # CPU ociosa para siempre: solo tiene sentido avanzar hasta el límite
+                return 0 if limite is None else limite - self._t
+            k = prox_llegada - self._t
+        else:
+            if self._ready and self._ready.debe_expropiar(self._running):
+                return 0
+            # el último tick (fin o quantum agotado) lo ejecuta _tick()
+            k = self._running.cpu_restante - 1
+            if self._ready.usa_quantum:
+                k = min(k, self._rr_q_left - 1)
+            if prox_llegada is not None:
+                k = min(k, prox_llegada - self._t)
+
+        if self._ready.usa_reloj:
+            prox = self._ready.proximo_evento(self._t)
+            if prox is not None:
+                k = min(k, prox - self._t)
+
+        if limite is not None:
+            k = min(k, limite - self._t)
+        return max(0, k)
+
+    def _saltar(self, k: int):
+        """Aplica k ticks sin eventos (ver _ticks_sin_eventos)."""
+        self._finalizados_tick = []
+        if self._traza is not None:
+            pid = self._running.pid if self._running is not None else None
+            self._traza.escribir_tramo(self._t, k, pid, self._alg)
+        if self._running is not None:
+            self._linea.registrar(self._running.pid, self._t, k)
+            self._running.cpu_restante -= k
+            if self._ready.usa_quantum:
+                self._rr_q_left -= k
+        self._t += k
+
     def _tick(self):
+        # cada fase es un método: set_perfil() los reemplaza en la instancia por
+        # versiones cronometradas, así el perfil mide este mismo cuerpo
         self._finalizados_tick = []
+        cola = self._ready
 
         # 1) mover llegadas del tiempo actual
-        llegados = [p for p in self._nuevos if p.instante_llegada <= self._t]
-        for p in llegados:
-            self._nuevos.remove(p)
-            self._ready.append(p)
-
-        # 1.1) RR: reencolar el que agotó quantum, DESPUÉS de llegadas
-        if self._alg == "RR" and self._rr_demote_pending is not None:
-            self._rr_demote_pending.estado = "En espera"
-            self._ready.append(self._rr_demote_pending)
-            self._rr_demote_pending = None
-
-        # 2) SRTF: preempción por llegadas en este mismo tick
-        if self._alg == "SRTF" and self._running and self._ready:
-            mejor = min(self._ready, key=lambda p: (p.cpu_restante, p.instante_llegada, p.pid))
-            if mejor.cpu_restante < self._running.cpu_restante:
-                self._running.estado = "En espera"
-                self._ready.append(self._running)
-                self._ready.remove(mejor)
-                self._running = mejor
-                # IMPORTANTE: setear inicio/respuesta/estado aquí porque el paso 3 no corre
-                if self._running.t_inicio is None:
-                    self._running.t_inicio = self._t
-                    self._running.respuesta = self._running.t_inicio - self._running.instante_llegada
-                self._running.estado = "En ejecución"
+        if self._nuevos and self._nuevos.proxima() <= self._t:
+            self._llegadas(cola)
+
+        # 1.1) reencolar el que agotó quantum, DESPUÉS de llegadas
+        if self._rr_demote_pending is not None:
+            self._degradar(cola)
+
+        # 1.2) eventos propios de la estrategia (p. ej. boost de MLFQ)
+        if cola.usa_reloj:
+            self._reloj(cola)
+
+        # 2) expropiación (p. ej. SRTF) por llegadas en este mismo tick
+        if self._running and cola:
+            self._expropiar(cola)
 
         # 3) si no hay running, seleccionar ahora
-        if self._running is None and self._ready:
-            if self._alg == "FCFS":
-                cand = min(self._ready, key=lambda p: (p.instante_llegada, p.pid))
-            elif self._alg == "SJF":
-                cand = min(self._ready, key=lambda p: (p.cpu_total, p.instante_llegada, p.pid))
-            elif self._alg == "SRTF":
-                cand = min(self._ready, key=lambda p: (p.cpu_restante, p.instante_llegada, p.pid))
-            else:  # RR
-                cand = self._ready[0]
-            self._ready.remove(cand)
-            self._running = cand
-            if self._running.t_inicio is None:
-                self._running.t_inicio = self._t
-                self._running.respuesta = self._running.t_inicio - self._running.instante_llegada
-            self._running.estado = "En ejecución"
-            if self._alg == "RR":
-                self._rr_q_left = self._quantum_cfg
+        if self._running is None and cola:
+            self._seleccionar(cola)
 
         # 4) ejecutar en este tick
-        pid_en_cpu = None
-        if self._running:
-            pid_en_cpu = self._running.pid
-            self._running.cpu_restante -= 1
-            if self._alg == "RR":
-                self._rr_q_left -= 1
-
-            # 4.1) ¿terminó?
-            if self._running.cpu_restante <= 0:
-                self._running.estado = "Terminado"
-                self._running.t_fin = self._t + 1
-                self._running.retorno = self._running.t_fin - self._running.instante_llegada
-                self._running.espera = self._running.retorno - self._running.cpu_total
-                self._running.eficiencia = (self._running.cpu_total / self._running.retorno) if self._running.retorno else 0.0
-                self._finalizados_tick.append(self._running)
-                # NUEVO: registrar orden global
-                self._orden_finalizacion.append(self._running)
-                self._running = None
-                self._rr_demote_pending = None  # por si acaso
-
-            # 4.2) RR: agotó quantum (no terminó) → demorar reencolar al próximo tick
-            elif self._alg == "RR" and self._rr_q_left <= 0:
-                self._rr_demote_pending = self._running
-                self._running = None
-                # el quantum se repone cuando se asigne un nuevo running
-
-        # 5) resumen
+        pid_en_cpu = self._ejecutar(cola) if self._running else None
+
+        # 5) resumen y 6) siguiente tick
+        return self._resumen_tick(pid_en_cpu)
+
+    # ------------- Fases de _tick ------------------
+    def _llegadas(self, cola):
+        while self._nuevos and self._nuevos.proxima() <= self._t:
+            cola.on_arrival(self._nuevos.pop())
+
+    def _degradar(self, cola):
+        self._rr_demote_pending.estado = "En espera"
+        cola.on_quantum_expired(self._rr_demote_pending)
+        self._rr_demote_pending = None
+
+    def _reloj(self, cola):
+        cola.on_tick(self._t, self._running)
+
+    def _expropiar(self, cola):
+        if cola.debe_expropiar(self._running):
+            mejor = cola.select()
+            self._running.estado = "En espera"
+            cola.on_preempt(self._running)
+            # el paso 3 no corre: inicio/respuesta/estado se fijan aquí
+            self._poner_en_cpu(cola, mejor)
+
+    def _seleccionar(self, cola):
+        # la estrategia ya entrega el candidato correcto (ver algoritmos/estrategias.py)
+        self._poner_en_cpu(cola, cola.select())
+
+    def _poner_en_cpu(self, cola, p):
+        self._running = p
+        if p.t_inicio is None:
+            p.t_inicio = self._t
+            p.respuesta = p.t_inicio - p.instante_llegada
+            self._metricas.registrar_inicio(p)
+        p.estado = "En ejecución"
+        if cola.usa_quantum:
+            self._rr_q_left = cola.quantum(p, self._quantum_cfg)
+
+    def _ejecutar(self, cola) -> int:
+        """Descuenta el tick del running; fin o quantum agotado. Devuelve su pid."""
+        p = self._running
+        pid_en_cpu = p.pid
+        self._linea.registrar(pid_en_cpu, self._t)
+        p.cpu_restante -= 1
+        if cola.usa_quantum:
+            self._rr_q_left -= 1
+
+        # 4.1) ¿terminó?
+        if p.cpu_restante <= 0:
+            p.estado = "Terminado"
+            p.t_fin = self._t + 1
+            p.retorno = p.t_fin - p.instante_llegada
+            p.espera = p.retorno - p.cpu_total
+            p.eficiencia = (p.cpu_total / p.retorno) if p.retorno else 0.0
+            self._metricas.registrar_fin(p)
+            cola.on_exit(p)
+            self._finalizados_tick.append(p)
+            # NUEVO: registrar orden global
+            self._orden_finalizacion.append(p)
+            self._running = None
+            self._rr_demote_pending = None  # por si acaso
+
+        # 4.2) agotó quantum (no terminó) → demorar reencolar al próximo tick
+        elif cola.usa_quantum and self._rr_q_left <= 0:
+            self._rr_demote_pending = p
+            self._running = None
+            # el quantum se repone cuando se asigne un nuevo running
+        return pid_en_cpu
+
+    def _resumen_tick(self, pid_en_cpu: Optional[int]) -> Dict[str, Any]:
         resumen = {
             "t": self._t,
             "pid": pid_en_cpu,
             "finalizados": [p.pid for p in self._finalizados_tick],
             "alg": self._alg,
         }
-
-        # 6) siguiente tick
+        if self._traza is not None:
+            self._traza.escribir(resumen)
         self._t += 1
         return resumen
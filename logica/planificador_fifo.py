@@ -1,16 +1,23 @@
 # logica/planificador_fifo.py
-from typing import List, Callable
+from collections import deque
+from typing import Deque, List, Callable
 from algoritmos.fifo import AlgoritmoFIFO
 
 class PlanificadorFIFO:
+    """
+    step() avanza un tick (on_tick por unidad). run_until_idle() y run_all()
+    avanzan por tramos: un on_segment(inicio, fin, proceso) por corrida
+    continua y los huecos sin procesos se saltan de una vez.
+    """
 
     def __init__(self,
                  on_context_switch: Callable = None,
                  on_tick: Callable = None,
-                 on_finish: Callable = None):
-        self.core = AlgoritmoFIFO(on_context_switch, on_tick, on_finish)
+                 on_finish: Callable = None,
+                 on_segment: Callable = None):
+        self.core = AlgoritmoFIFO(on_context_switch, on_tick, on_finish, on_segment)
         self.t = 0
-        self._pendientes: List = []
+        self._pendientes: Deque = deque()
 
     def cargar_procesos(self, procesos: List):
         # Asegura .restante en cada proceso
@@ -18,12 +25,14 @@ class PlanificadorFIFO:
             if getattr(p, "restante", None) is None:
                 p.restante = int(p.duracion)
         # Ordena por llegada (y por id para estabilidad)
-        self._pendientes = sorted(procesos, key=lambda x: (x.llegada, x.id))
+        self._pendientes = deque(sorted(procesos, key=lambda x: (x.llegada, x.id)))
 
     def _arrivals_at(self, t: int):
+        # <= y no ==: tras un tramo (o con llegadas cargadas en el pasado)
+        # entran todos los que ya llegaron
         llegados = []
-        while self._pendientes and self._pendientes[0].llegada == t:
-            llegados.append(self._pendientes.pop(0))
+        while self._pendientes and self._pendientes[0].llegada <= t:
+            llegados.append(self._pendientes.popleft())
         return llegados
 
     def step(self):
@@ -33,5 +42,25 @@ class PlanificadorFIFO:
         self.core.tick(self.t)
         self.t += 1
 
+    def run_until_idle(self) -> int:
+        """Corre por tramos mientras haya a quién correr; devuelve self.t (CPU libre)."""
+        while True:
+            nuevos = self._arrivals_at(self.t)
+            if nuevos:
+                self.core.push_arrivals(self.t, nuevos)
+            if self.core.running() is None and not self.core.ready:
+                return self.t
+            self.t = self.core.correr_tramo(self.t)
+
+    def run_all(self) -> int:
+        """Corre por tramos hasta el último proceso, saltando los huecos; devuelve self.t."""
+        while True:
+            self.run_until_idle()
+            if not self._pendientes:
+                return self.t
+            llegada = self._pendientes[0].llegada
+            self.core.ocioso(self.t, llegada)
+            self.t = llegada
+
     def running(self):
         return self.core.running()
@@ -0,0 +1,584 @@
+# logica/planificador_multinucleo.py
+"""
+Planificador con varios núcleos (num_cpus) para preguntas de capacidad.
+
+Cada núcleo tiene su propia cola de listos del algoritmo elegido. Las
+llegadas van al núcleo menos cargado; un núcleo que se queda sin trabajo
+le roba al más cargado y, si periodo_balanceo > 0, cada ese número de
+ticks se reparte la carga hasta que ningún par difiera en más de 1.
+Cada migración suma costo_migracion ticks a la CPU restante del proceso
+(la espera de obtener_metricas() lo incluye).
+
+Simula por eventos: cada núcleo agenda el fin de su tramo actual (fin del
+proceso o quantum agotado en RR) y solo se visitan los instantes con algún
+evento, y en ellos solo los núcleos afectados. Así el costo crece con la
+cantidad de eventos y no con núcleos x largo de las colas.
+Con num_cpus=1 da exactamente el mismo resultado que Planificador.
+"""
+from __future__ import annotations
+import heapq
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from logica.linea_tiempo import LineaTiempo
+from logica.planificador import MetricasAcumuladas, Planificador
+
+# tipo de evento agendado por un núcleo
+_FIN, _QUANTUM = 0, 1
+
+
+class Nucleo:
+    """Estado de un núcleo: cola de listos, proceso en ejecución y contadores."""
+    __slots__ = ("id", "ready", "running", "t_tramo", "restante_tramo", "version", "pendiente",
+                 "ocupado", "migraciones_entrada", "migraciones_salida", "robos", "metricas",
+                 "linea", "t_linea")
+
+    def __init__(self, i: int, ready):
+        self.id = i
+        self.ready = ready
+        self.running = None
+        self.t_tramo = 0            # instante en que arrancó el tramo en curso
+        self.restante_tramo = 0     # cpu_restante del running al arrancar el tramo
+        self.version = 0            # invalida el evento agendado si el tramo se corta antes
+        self.pendiente = None       # RR: agotó quantum; se reencola en el próximo instante
+        self.ocupado = 0            # ticks con un proceso en ejecución (tramos cerrados)
+        self.migraciones_entrada = 0
+        self.migraciones_salida = 0
+        self.robos = 0
+        self.metricas = MetricasAcumuladas()
+        self.linea = LineaTiempo()    # historial de este núcleo
+        self.t_linea = 0            # hasta dónde está registrado el tramo en curso
+
+    def carga(self) -> int:
+        return len(self.ready) + (self.running is not None) + (self.pendiente is not None)
+
+
+class _IndiceCarga:
+    """
+    Heap perezoso de núcleos por carga (signo +1: menos cargado primero,
+    -1: más cargado primero). Cada cambio agrega una entrada nueva y las
+    viejas se descartan al consultar; se rehace si crece demasiado.
+    """
+    def __init__(self, nucleos: List[Nucleo], signo: int):
+        self._nucleos = nucleos
+        self._signo = signo
+        self._rehacer()
+
+    def _rehacer(self):
+        self._h = [(self._signo * c.carga(), c.id) for c in self._nucleos]
+        heapq.heapify(self._h)
+
+    def actualizar(self, c: Nucleo):
+        heapq.heappush(self._h, (self._signo * c.carga(), c.id))
+        if len(self._h) > 4 * len(self._nucleos) + 64:
+            self._rehacer()
+
+    def tope(self) -> Nucleo:
+        h = self._h
+        while True:
+            k, i = h[0]
+            c = self._nucleos[i]
+            if self._signo * c.carga() == k:
+                return c
+            heapq.heappop(h)
+
+
+class PlanificadorMultinucleo(Planificador):
+    def __init__(self, gestor_memoria, num_cpus: int = 4, *, periodo_balanceo: int = 0,
+                 robo: bool = True, costo_migracion: int = 0, compacto: bool = False):
+        """
+        num_cpus: núcleos simulados (>= 1).
+        periodo_balanceo: cada cuántos ticks se balancean las colas (0 = nunca).
+        robo: un núcleo ocioso toma trabajo de la cola más cargada.
+        costo_migracion: ticks de CPU extra por cada cambio de núcleo.
+        """
+        if int(num_cpus) < 1:
+            raise ValueError("num_cpus debe ser >= 1")
+        self.num_cpus = int(num_cpus)
+        self.periodo_balanceo = max(0, int(periodo_balanceo))
+        self.robo = bool(robo)
+        self.costo_migracion = max(0, int(costo_migracion))
+        super().__init__(gestor_memoria, compacto=compacto)
+        self._nuevo_estado()
+
+    # ---------------- Config ----------------
+    def set_algoritmo(self, nombre: str):
+        anterior = self._alg
+        super().set_algoritmo(nombre)
+        if self._alg == anterior:
+            return
+        # los tramos agendados siguen las reglas del algoritmo anterior:
+        # se cortan ahora y el mismo proceso arranca un tramo nuevo
+        t = self._t
+        for c in self._nucleos:
+            c.ready = self._nueva_cola(c.ready.pares())
+            p = c.running
+            if p is not None:
+                self._cortar(c, t)
+                self._iniciar_tramo(c, p, t)
+            self._tocados.add(c.id)
+
+    def configurar_estrategia(self, nombre: str, **parametros):
+        super().configurar_estrategia(nombre, **parametros)
+        if nombre.strip().upper() == self._alg:
+            for c in self._nucleos:
+                c.ready = self._nueva_cola(c.ready.pares())
+                self._tocados.add(c.id)
+
+    def set_traza(self, traza):
+        """
+        Una traza recibe un resumen por tick con 'pids' (uno por núcleo) y
+        'pid' = el del núcleo 0: con num_cpus=1 es la misma traza que la de
+        Planificador. Una lista de num_cpus trazas (p. ej. TrazaBinaria, que
+        guarda un solo pid por tick) da a cada una la de su núcleo, con
+        'finalizados' de ese núcleo. None la desconecta.
+        """
+        if isinstance(traza, (list, tuple)) and len(traza) != self.num_cpus:
+            raise ValueError(f"se esperaban {self.num_cpus} trazas (una por núcleo), no {len(traza)}")
+        self._traza = traza
+
+    def set_perfil(self, perfil):
+        """
+        Como Planificador.set_perfil, con las fases del modo multinúcleo:
+        'abrir', 'cerrar' y 'estado_cpu' (ver logica/perfil.py).
+        """
+        for metodo in ("_abrir", "_cerrar", "estado_cpu", "_tick", "_paso"):
+            self.__dict__.pop(metodo, None)
+        self._perfil = perfil
+        if perfil is None:
+            return
+        self._abrir = perfil.cronometrar("abrir", self._abrir)
+        self._cerrar = perfil.cronometrar("cerrar", self._cerrar)
+        self.estado_cpu = perfil.cronometrar("estado_cpu", self.estado_cpu)
+        tick, paso = self._tick, self._paso
+
+        def _contar(fn, *args):
+            t0 = self._t
+            listos = sum(len(c.ready) for c in self._nucleos)
+            llegadas = len(self._nuevos)
+            res = fn(*args)
+            if self._t > t0:
+                perfil.contar_tick(listos, llegadas, self._t - t0)
+            return res
+
+        self._tick = lambda: _contar(tick)
+        self._paso = lambda limite: _contar(paso, limite)
+
+    # ------------- Estado para UI -----------
+    def obtener_procesos(self):
+        self._sincronizar()
+        return super().obtener_procesos()
+
+    def esta_terminado(self) -> bool:
+        return len(self._orden_finalizacion) == len(self._procesos)
+
+    def estado_cpu(self) -> Dict[str, Any]:
+        self._sincronizar()
+        nucleos = [{
+            "id": c.id,
+            "running": {"nombre": c.running.nombre} if c.running else None,
+            "ready": [{"nombre": p.nombre} for p in c.ready],
+        } for c in self._nucleos]
+        return {
+            "t": self._t,
+            "alg": self._alg,
+            "nucleos": nucleos,
+            "finalizados": [{"nombre": p.nombre, "t_fin": p.t_fin} for p in self._finalizados_tick],
+            "orden_finalizacion": self.obtener_orden_finalizacion(),
+        }
+
+    # ------------- Historial de ejecución -----------
+    def linea_tiempo(self, nucleo: int = 0) -> LineaTiempo:
+        """Historial por tramos de un núcleo, al día hasta el instante actual."""
+        self._volcar_lineas()
+        return self._nucleos[nucleo].linea
+
+    def segmentos(self, desde: Optional[int] = None, hasta: Optional[int] = None,
+                  nucleo: int = 0) -> Iterator[Tuple[int, int, int]]:
+        return self.linea_tiempo(nucleo).segmentos(desde, hasta)
+
+    def quien_en(self, t: int, nucleo: int = 0) -> Optional[int]:
+        return self.linea_tiempo(nucleo).quien_en(int(t))
+
+    def segmentos_gantt(self, desde: Optional[int] = None, hasta: Optional[int] = None,
+                        nucleo: int = 0) -> List[Dict[str, Any]]:
+        nombre = lambda pid: self._pcb_por_pid(pid).nombre  # noqa: E731
+        return [{"t": a, "nombre": nombre(pid), "duracion": b - a}
+                for pid, a, b in self.segmentos(desde, hasta, nucleo)]
+
+    # ------------- API pública --------------
+    def avanzar_hasta(self, t: int) -> int:
+        t = int(t)
+        while self._t < t:
+            self._paso(t)
+        return self._t
+
+    def ejecutar_hasta_fin(self) -> int:
+        while not self.esta_terminado():
+            if not self._paso(None):
+                break
+        return self._t
+
+    def reiniciar(self):
+        self._nuevo_estado()
+        super().reiniciar()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        El de Planificador más la configuración y el estado de cada núcleo
+        (cola, tramo en curso, contadores, métricas e historial) y los
+        eventos agendados. Los índices de carga se rearman al restaurar.
+        """
+        self._sincronizar()
+        self._volcar_lineas()
+        pid = lambda p: None if p is None else p.pid  # noqa: E731
+        snap = super().snapshot()
+        snap["multinucleo"] = {
+            "num_cpus": self.num_cpus,
+            "periodo_balanceo": self.periodo_balanceo,
+            "robo": self.robo,
+            "costo_migracion": self.costo_migracion,
+            "nucleos": [{
+                "ready": [(seq, p.pid) for seq, p in c.ready.pares()],
+                "estrategia": c.ready.estado(),
+                "running": pid(c.running),
+                "t_tramo": c.t_tramo,
+                "restante_tramo": c.restante_tramo,
+                "version": c.version,
+                "pendiente": pid(c.pendiente),
+                "ocupado": c.ocupado,
+                "migraciones_entrada": c.migraciones_entrada,
+                "migraciones_salida": c.migraciones_salida,
+                "robos": c.robos,
+                "metricas": dict(vars(c.metricas)),
+                "linea_tiempo": c.linea.estado(),
+                "t_linea": c.t_linea,
+            } for c in self._nucleos],
+            "eventos": [list(e) for e in self._eventos],
+            "directos": [p.pid for p in self._directos],
+            "pendientes": [c.id for c in self._pendientes],
+            "tocados": sorted(self._tocados),
+            "ociosos": sorted(self._ociosos),
+        }
+        return snap
+
+    def restore(self, snap: Dict[str, Any]):
+        """Vuelve al estado de un snapshot() multinúcleo (con su cantidad de núcleos y configuración)."""
+        m = snap.get("multinucleo")
+        if m is None:
+            raise ValueError("el snapshot no es de un PlanificadorMultinucleo")
+        super().restore(snap)
+        self.num_cpus = m["num_cpus"]
+        self.periodo_balanceo = m["periodo_balanceo"]
+        self.robo = m["robo"]
+        self.costo_migracion = m["costo_migracion"]
+
+        por_pid = self._pcb_por_pid
+        opcional = lambda pid: None if pid is None else por_pid(pid)  # noqa: E731
+        self._nuevo_estado()
+        for c, d in zip(self._nucleos, m["nucleos"]):
+            c.ready = self._nueva_cola([(seq, por_pid(pid)) for seq, pid in d["ready"]], d["estrategia"])
+            c.running = opcional(d["running"])
+            c.t_tramo = d["t_tramo"]
+            c.restante_tramo = d["restante_tramo"]
+            c.version = d["version"]
+            c.pendiente = opcional(d["pendiente"])
+            c.ocupado = d["ocupado"]
+            c.migraciones_entrada = d["migraciones_entrada"]
+            c.migraciones_salida = d["migraciones_salida"]
+            c.robos = d["robos"]
+            vars(c.metricas).update(d["metricas"])
+            c.linea = LineaTiempo.desde_estado(d["linea_tiempo"])
+            c.t_linea = d["t_linea"]
+        self._eventos = [tuple(e) for e in m["eventos"]]
+        heapq.heapify(self._eventos)
+        self._directos = [por_pid(pid) for pid in m["directos"]]
+        self._pendientes = [self._nucleos[i] for i in m["pendientes"]]
+        self._tocados = set(m["tocados"])
+        self._ociosos = set(m["ociosos"])
+        self._menos_cargado = _IndiceCarga(self._nucleos, 1)
+        self._mas_cargado = _IndiceCarga(self._nucleos, -1)
+
+    # ------------- Métricas por núcleo -------------
+    def metricas_por_nucleo(self) -> List[Dict[str, Any]]:
+        """
+        Una fila por núcleo: ticks ocupados y utilización hasta el instante
+        actual, procesos terminados en él con sus promedios de retorno,
+        espera y respuesta, migraciones y robos. Los promedios globales son
+        los de obtener_metricas().
+        """
+        t = self._t
+        filas = []
+        for c in self._nucleos:
+            ocupado = c.ocupado + (t - c.t_tramo if c.running is not None else 0)
+            prom = c.metricas.fila_promedios()
+            filas.append({
+                "nucleo": c.id,
+                "ocupado": ocupado,
+                "utilizacion": round(ocupado / t, 4) if t else 0.0,
+                "terminados": c.metricas.n_terminados,
+                "retorno": prom[5],
+                "espera": prom[6],
+                "respuesta": prom[7],
+                "migraciones_entrada": c.migraciones_entrada,
+                "migraciones_salida": c.migraciones_salida,
+                "robos": c.robos,
+            })
+        return filas
+
+    # ------------- Interno ------------------
+    def _nuevo_estado(self):
+        self._nucleos: List[Nucleo] = [Nucleo(i, self._nueva_cola()) for i in range(self.num_cpus)]
+        self._menos_cargado = _IndiceCarga(self._nucleos, 1)
+        self._mas_cargado = _IndiceCarga(self._nucleos, -1)
+        self._eventos: List[tuple] = []       # (instante, núcleo, versión, tipo)
+        self._directos: List = []             # altas con llegada <= t, antes que las llegadas
+        self._pendientes: List[Nucleo] = []   # núcleos con un reencolado de RR pendiente
+        self._tocados = set()                 # núcleos a revisar en el próximo instante
+        self._ociosos = set(range(self.num_cpus))
+        self._fin_nucleo: List[int] = []
+
+    def _sincronizar(self):
+        """cpu_restante del running se descuenta al cerrar el tramo; aquí se pone al día."""
+        t = self._t
+        for c in self._nucleos:
+            if c.running is not None:
+                c.running.cpu_restante = c.restante_tramo - (t - c.t_tramo)
+
+    def _volcar_lineas(self):
+        """Los tramos se registran al cerrarse; aquí se agrega lo corrido de los abiertos."""
+        t = self._t
+        for c in self._nucleos:
+            if c.running is not None and t > c.t_linea:
+                c.linea.registrar(c.running.pid, c.t_linea, t - c.t_linea)
+                c.t_linea = t
+
+    def _encolar_alta(self, pcb):
+        if pcb.instante_llegada <= self._t:
+            self._directos.append(pcb)
+        else:
+            self._nuevos.push(pcb)
+
+    def _encolar_bloque(self, pcbs, llegada):
+        t = self._t
+        self._directos.extend(p for p, ll in zip(pcbs, llegada) if ll <= t)
+        self._nuevos.extend(p for p, ll in zip(pcbs, llegada) if ll > t)
+
+    def _tick(self):
+        t = self._t
+        self._abrir(t)
+        pids = [c.running.pid if c.running is not None else None for c in self._nucleos]
+        self._cerrar(t + 1)
+        if self._traza is not None:
+            self._escribir_traza(t, 1, pids)
+        self._t = t + 1
+        return {
+            "t": t,
+            "pids": pids,
+            "finalizados": [p.pid for p in self._finalizados_tick],
+            "alg": self._alg,
+        }
+
+    def _paso(self, limite: Optional[int]) -> bool:
+        """Resuelve el instante actual y salta al próximo evento (o a 'limite')."""
+        t = self._t
+        self._abrir(t)
+        prox = self._proximo_evento(t)
+        if limite is not None and (prox is None or prox > limite):
+            prox = limite
+        if prox is None:
+            return False
+        pids = None
+        if self._traza is not None:
+            pids = [c.running.pid if c.running is not None else None for c in self._nucleos]
+        self._cerrar(prox)
+        if pids is not None:
+            self._escribir_traza(t, prox - t, pids)
+        self._t = prox
+        return True
+
+    def _escribir_traza(self, t: int, k: int, pids: List[Optional[int]]):
+        """
+        Ticks [t, t + k): sin eventos salvo el último, que lleva los que
+        terminaron al cerrar en t + k (como el tick de Planificador en que
+        el proceso corre su última unidad).
+        """
+        alg = self._alg
+        ultimo = t + k - 1
+        if isinstance(self._traza, (list, tuple)):
+            for i, traza in enumerate(self._traza):
+                if k > 1:
+                    traza.escribir_tramo(t, k - 1, pids[i], alg)
+                fin = [p.pid for p, n in zip(self._finalizados_tick, self._fin_nucleo) if n == i]
+                traza.escribir({"t": ultimo, "pid": pids[i], "finalizados": fin, "alg": alg})
+            return
+        if k > 1:
+            self._traza.escribir_tramo(t, k - 1, pids[0], alg, pids=pids)
+        self._traza.escribir({"t": ultimo, "pid": pids[0], "pids": pids,
+                              "finalizados": [p.pid for p in self._finalizados_tick], "alg": alg})
+
+    def _proximo_evento(self, t: int) -> Optional[int]:
+        ev = self._eventos
+        while ev and ev[0][2] != self._nucleos[ev[0][1]].version:
+            heapq.heappop(ev)
+        candidatos = [ev[0][0]] if ev else []
+        llegada = self._nuevos.proxima()
+        if llegada is not None:
+            candidatos.append(llegada)
+        if self._nucleos[0].ready.usa_reloj:
+            candidatos += [e for e in (c.ready.proximo_evento(t + 1) for c in self._nucleos) if e is not None]
+        if self.periodo_balanceo and self._mas_cargado.tope().carga() - self._menos_cargado.tope().carga() > 1:
+            candidatos.append((t // self.periodo_balanceo + 1) * self.periodo_balanceo)
+        return min(candidatos) if candidatos else None
+
+    def _abrir(self, t: int):
+        """Llegadas, reencolados de RR, balanceo y selección en el instante t."""
+        # 1) altas directas y llegadas, al núcleo menos cargado
+        if self._directos:
+            for p in self._directos:
+                self._asignar(p)
+            self._directos = []
+        while self._nuevos and self._nuevos.proxima() <= t:
+            self._asignar(self._nuevos.pop())
+
+        # 1.1) RR: reencolar los que agotaron quantum, DESPUÉS de llegadas
+        for c in self._pendientes:
+            c.pendiente.estado = "En espera"
+            c.ready.on_quantum_expired(c.pendiente)
+            c.pendiente = None
+            self._tocados.add(c.id)
+        self._pendientes = []
+
+        # 1.2) eventos propios de la estrategia (p. ej. boost de MLFQ) en cada núcleo
+        if self._nucleos[0].ready.usa_reloj:
+            for c in self._nucleos:
+                if c.ready.proximo_evento(t) == t:
+                    c.ready.on_tick(t, c.running)
+                    self._tocados.add(c.id)
+
+        if self.periodo_balanceo and t % self.periodo_balanceo == 0:
+            self._balancear()
+
+        # 2) y 3) expropiación / selección solo en los núcleos afectados
+        for i in sorted(self._tocados):
+            self._despachar(self._nucleos[i], t)
+        self._tocados.clear()
+
+        # robo de trabajo: los núcleos ociosos toman de la cola más cargada
+        if self.robo and self._ociosos:
+            for i in sorted(self._ociosos):
+                victima = self._mas_cargado.tope()
+                if not victima.ready:
+                    break
+                c = self._nucleos[i]
+                self._migrar(victima, c)
+                c.robos += 1
+                self._despachar(c, t)
+
+    def _cerrar(self, t: int):
+        """Aplica los fines de tramo agendados hasta t (fin de proceso o quantum agotado)."""
+        self._finalizados_tick = []
+        self._fin_nucleo = []       # núcleo de cada uno de _finalizados_tick (traza por núcleo)
+        ev = self._eventos
+        while ev and ev[0][0] <= t:
+            te, i, version, tipo = heapq.heappop(ev)
+            c = self._nucleos[i]
+            if version != c.version:
+                continue
+            p = c.running
+            self._cortar(c, te)
+            if tipo == _FIN:
+                p.estado = "Terminado"
+                p.t_fin = te
+                p.retorno = p.t_fin - p.instante_llegada
+                p.espera = p.retorno - p.cpu_total
+                p.eficiencia = (p.cpu_total / p.retorno) if p.retorno else 0.0
+                self._metricas.registrar_fin(p)
+                c.metricas.registrar_fin(p)
+                c.ready.on_exit(p)
+                self._finalizados_tick.append(p)
+                self._fin_nucleo.append(i)
+                self._orden_finalizacion.append(p)
+            else:
+                p.estado = "En ejecución"   # como en Planificador, hasta que se reencola
+                c.pendiente = p
+                self._pendientes.append(c)
+            self._tocados.add(i)
+            self._actualizar(c)
+
+    def _cortar(self, c: Nucleo, t: int):
+        """Cierra el tramo en curso de c en t: descuenta CPU y libera el núcleo."""
+        p = c.running
+        corrido = t - c.t_tramo
+        c.ocupado += corrido
+        c.linea.registrar(p.pid, c.t_linea, t - c.t_linea)
+        p.cpu_restante = c.restante_tramo - corrido
+        p.estado = "En espera"
+        c.running = None
+        c.version += 1
+
+    def _iniciar_tramo(self, c: Nucleo, p, t: int):
+        c.running = p
+        c.t_tramo = t
+        c.t_linea = t
+        c.restante_tramo = p.cpu_restante
+        if p.t_inicio is None:
+            p.t_inicio = t
+            p.respuesta = p.t_inicio - p.instante_llegada
+            self._metricas.registrar_inicio(p)
+            c.metricas.registrar_inicio(p)
+        p.estado = "En ejecución"
+        # una ráfaga <= 0 igual ocupa un tick
+        dur, tipo = max(1, p.cpu_restante), _FIN
+        if c.ready.usa_quantum:
+            q = c.ready.quantum(p, self._quantum_cfg)
+            if dur > q:
+                dur, tipo = q, _QUANTUM
+        c.version += 1
+        heapq.heappush(self._eventos, (t + dur, c.id, c.version, tipo))
+        self._ociosos.discard(c.id)
+
+    def _despachar(self, c: Nucleo, t: int):
+        """Pasos 2 y 3 de Planificador._tick para un núcleo."""
+        p = c.running
+        if p is not None:
+            if c.ready:
+                p.cpu_restante = c.restante_tramo - (t - c.t_tramo)
+                if c.ready.debe_expropiar(p):
+                    self._cortar(c, t)
+                    mejor = c.ready.select()
+                    c.ready.on_preempt(p)
+                    self._iniciar_tramo(c, mejor, t)
+            return
+        if c.ready:
+            self._iniciar_tramo(c, c.ready.select(), t)
+        else:
+            self._ociosos.add(c.id)
+
+    def _asignar(self, p):
+        c = self._menos_cargado.tope()
+        c.ready.on_arrival(p)
+        self._tocados.add(c.id)
+        self._actualizar(c)
+
+    def _migrar(self, origen: Nucleo, destino: Nucleo):
+        p = origen.ready.select()
+        origen.ready.on_exit(p)
+        p.cpu_restante += self.costo_migracion
+        destino.ready.on_arrival(p)
+        origen.migraciones_salida += 1
+        destino.migraciones_entrada += 1
+        self._tocados.add(destino.id)
+        self._actualizar(origen)
+        self._actualizar(destino)
+
+    def _balancear(self):
+        """Mueve procesos listos del núcleo más cargado al menos cargado hasta emparejar."""
+        while True:
+            alto, bajo = self._mas_cargado.tope(), self._menos_cargado.tope()
+            if alto.carga() - bajo.carga() <= 1 or not alto.ready:
+                return
+            self._migrar(alto, bajo)
+
+    def _actualizar(self, c: Nucleo):
+        self._menos_cargado.actualizar(c)
+        self._mas_cargado.actualizar(c)
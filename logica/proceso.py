@@ -3,7 +3,15 @@ import itertools
 _pid_seq = itertools.count(1)
 
 class Proceso:
-    def __init__(self, nombre, memoria_requerida=0, duracion=1, llegada=0, quantum=None, pid=None):
+    # sin __dict__: ahorra memoria en cargas grandes
+    __slots__ = (
+        "pid", "nombre", "memoria_requerida", "cpu_total", "cpu_restante",
+        "instante_llegada", "quantum", "estado", "t_inicio", "t_fin",
+        "t_espera", "t_retorno", "t_respuesta", "eficiencia", "slices", "peso",
+        "nice", "prioridad",
+    )
+
+    def __init__(self, nombre, memoria_requerida=0, duracion=1, llegada=0, quantum=None, pid=None, peso=1, nice=0, prioridad=0):
         self.pid = int(pid) if pid is not None else next(_pid_seq)
         self.nombre = nombre or f"Proceso {self.pid}"
         self.memoria_requerida = int(memoria_requerida or 0)
@@ -18,6 +26,13 @@ class Proceso:
         # Quantum opcional (para RR)
         self.quantum = None if quantum in (None, "", "-") else int(quantum)
 
+        # Boletos / peso para reparto proporcional (lotería, stride)
+        self.peso = max(1, int(peso if peso is not None else 1))
+        # Nice estilo Linux (-20..19) para CFS
+        self.nice = max(-20, min(19, int(nice or 0)))
+        # Prioridad (menor número = más prioridad)
+        self.prioridad = int(prioridad or 0)
+
         # Estados / métricas
         # <-- IMPORTANTE: muchos paneles esperan "En espera" al crearlo
         self.estado = 'En espera'        # Nuevo, En espera, En ejecución, Finalizado
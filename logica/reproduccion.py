@@ -0,0 +1,134 @@
+# logica/reproduccion.py
+"""
+Reproducción de un plan ya calculado (p. ej. el 'grafico' de
+AlgoritmoRoundRobin.ejecutar): entrega cada tramo {"Proceso", "Inicio", "Fin"}
+a los observadores cuando el reloj de reproducción llega a su Inicio.
+
+Calcular y mostrar quedan separados: ejecutar() devuelve todo al instante
+y Reproduccion pone el ritmo sin bloquear a nadie, de dos formas:
+  - asyncio:  await rep.correr()
+  - timer:    rep.iniciar_con_timer(widget.after)   (mainloop de Tk)
+
+Velocidad: 1.0 es tiempo real (segundos_por_tick por unidad de tiempo),
+N es N veces más rápido e INSTANTANEA entrega todo sin esperar. Se puede
+cambiar en plena reproducción (set_velocidad) y cancelar (cancelar()).
+"""
+from __future__ import annotations
+import asyncio
+import math
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+Tramo = Dict[str, Any]
+
+INSTANTANEA = math.inf
+# en modo timer, tramos entregados por llamada cuando no hay que esperar:
+# así un plan enorme a velocidad instantánea no congela el mainloop
+_LOTE = 500
+# si la reproducción se atrasa más que esto (mainloop ocupado), sigue desde
+# ahí en vez de entregar de golpe todo lo atrasado
+_MAX_ATRASO = 1.0
+
+
+class Reproduccion:
+    def __init__(self, grafico: Iterable[Tramo], observadores: Iterable[Callable[[Tramo], Any]] = (),
+                 velocidad: float = 1.0, segundos_por_tick: float = 1.0,
+                 al_terminar: Optional[Callable[[], Any]] = None):
+        self._tramos: List[Tramo] = list(grafico)
+        self._observadores = list(observadores)
+        self._al_terminar = al_terminar
+        self.segundos_por_tick = float(segundos_por_tick)
+        self.velocidad = INSTANTANEA
+        self.set_velocidad(velocidad)
+        self._i = 0                  # próximo tramo a entregar
+        self._reloj = self._tramos[0]["Inicio"] if self._tramos else 0
+        self._ancla: Optional[float] = None   # instante real previsto del tramo en _reloj
+        self.cancelada = False
+        self.terminada = not self._tramos
+
+    # ---------------- control ----------------
+    def agregar_observador(self, fn: Callable[[Tramo], Any]):
+        self._observadores.append(fn)
+
+    def set_velocidad(self, velocidad: Optional[float]):
+        """Veces tiempo real; None, 0 o INSTANTANEA: sin esperas."""
+        self.velocidad = INSTANTANEA if not velocidad or velocidad <= 0 else float(velocidad)
+        self._ancla = None
+
+    def cancelar(self):
+        """Deja de entregar tramos (el que está en curso no se interrumpe)."""
+        self.cancelada = True
+
+    @property
+    def progreso(self) -> float:
+        return self._i / len(self._tramos) if self._tramos else 1.0
+
+    # ---------------- pasos ----------------
+    def _objetivo(self) -> float:
+        """Instante real (monotonic) en que toca el próximo tramo."""
+        ahora = time.monotonic()
+        # sin ancla (inicio, cambio de velocidad): se mide desde ahora
+        if self._ancla is None:
+            self._ancla = ahora
+        ticks = self._tramos[self._i]["Inicio"] - self._reloj
+        objetivo = self._ancla + ticks * self.segundos_por_tick / self.velocidad
+        # muy atrasados (mainloop ocupado): se sigue desde ahora
+        if objetivo < ahora - _MAX_ATRASO:
+            return ahora
+        return objetivo
+
+    def _espera(self) -> float:
+        """Segundos hasta el Inicio del próximo tramo según la velocidad actual."""
+        if self.velocidad == INSTANTANEA:
+            return 0.0
+        return max(0.0, self._objetivo() - time.monotonic())
+
+    def _entregar(self):
+        tramo = self._tramos[self._i]
+        if self.velocidad != INSTANTANEA:
+            # el ancla es el instante previsto, no el real: los retrasos de
+            # sleep/after no se acumulan tramo tras tramo
+            self._ancla = self._objetivo()
+        self._i += 1
+        self._reloj = tramo["Inicio"]
+        for fn in self._observadores:
+            fn(tramo)
+        if self._i >= len(self._tramos):
+            self._terminar()
+
+    def _terminar(self):
+        self.terminada = True
+        if self._al_terminar is not None:
+            self._al_terminar()
+
+    # ---------------- asyncio ----------------
+    async def correr(self):
+        """Reproduce hasta el final o hasta cancelar(); cede el loop entre tramos."""
+        while not self.cancelada and not self.terminada:
+            espera = self._espera()
+            if espera > 0 or self._i % _LOTE == 0:
+                await asyncio.sleep(espera)
+                if self.cancelada:
+                    break
+            self._entregar()
+
+    # ---------------- timer ----------------
+    def iniciar_con_timer(self, programar: Callable[[int, Callable[[], Any]], Any]) -> "Reproduccion":
+        """
+        Reproduce con un temporizador del estilo de Tk: programar(ms, fn)
+        (p. ej. widget.after) llama a fn dentro de ms milisegundos.
+        """
+        def _paso(ya_esperado: bool = False):
+            hechos = 0
+            while not self.cancelada and not self.terminada:
+                if not ya_esperado:
+                    espera = self._espera()
+                    if espera > 0 or hechos >= _LOTE:
+                        programar(max(0, round(espera * 1000)), lambda: _paso(True))
+                        return
+                ya_esperado = False
+                self._entregar()
+                hechos += 1
+
+        programar(0, _paso)
+        return self
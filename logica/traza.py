@@ -0,0 +1,176 @@
+# logica/traza.py
+"""
+Sumideros de traza por tick para Planificador (ver Planificador.set_traza).
+
+Cada tick produce el mismo resumen que devuelve Planificador.tick():
+    {"t": int, "pid": int | None, "finalizados": [pid, ...], "alg": str}
+(PlanificadorMultinucleo agrega "pids", uno por núcleo; TrazaBinaria solo
+guarda "pid").
+Los sumideros lo escriben con un búfer acotado (tam_flush registros), así
+que una corrida de cientos de millones de ticks usa memoria constante.
+leer_traza() reproduce cualquier archivo tick a tick.
+
+Formatos:
+  - TrazaJSONL: una línea JSON por tick (legible, grande).
+  - TrazaBinaria: registros struct little-endian; los ticks consecutivos del
+    mismo pid sin finalizaciones se guardan como un solo tramo (t, n, pid).
+"""
+from __future__ import annotations
+import json
+import struct
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional
+
+MAGIA = b"TRZ1"
+
+# registro de tramo: tipo(B) t(q) repeticiones(I) pid(q, -1 = ocioso) alg(B) n_fin(H)
+_TRAMO = struct.Struct("<BqIqBH")
+# registro de definición de algoritmo: tipo(B) código(B) largo(B) + nombre utf-8
+_ALG = struct.Struct("<BBB")
+_PID = struct.Struct("<q")
+_T_TRAMO, _T_ALG = 0, 1
+
+
+class TrazaJSONL:
+    """Escribe un JSON por línea y tick. 'destino' es una ruta o un archivo de texto abierto."""
+
+    def __init__(self, destino, tam_flush: int = 4096):
+        self._propio = isinstance(destino, str)
+        self._f = open(destino, "w", encoding="utf-8") if self._propio else destino
+        self._tam_flush = max(1, int(tam_flush))
+        self._buf: List[str] = []
+
+    def escribir(self, resumen: Dict[str, Any]):
+        self._buf.append(json.dumps(resumen, separators=(",", ":")))
+        if len(self._buf) >= self._tam_flush:
+            self.flush()
+
+    def escribir_tramo(self, t: int, n: int, pid: Optional[int], alg: str,
+                       pids: Optional[List[Optional[int]]] = None):
+        """n ticks seguidos sin eventos (los que salta el modo por eventos)."""
+        for i in range(n):
+            resumen = {"t": t + i, "pid": pid, "finalizados": [], "alg": alg}
+            if pids is not None:
+                resumen["pids"] = pids
+            self.escribir(resumen)
+
+    def flush(self):
+        if self._buf:
+            self._f.write("\n".join(self._buf) + "\n")
+            self._buf.clear()
+        self._f.flush()
+
+    def cerrar(self):
+        self.flush()
+        if self._propio:
+            self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+class TrazaBinaria:
+    """Formato binario compacto con codificación por tramos. 'destino': ruta o archivo binario."""
+
+    def __init__(self, destino, tam_flush: int = 4096):
+        self._propio = isinstance(destino, str)
+        self._f: BinaryIO = open(destino, "wb") if self._propio else destino
+        self._tam_flush = max(1, int(tam_flush))
+        self._buf = bytearray(MAGIA)
+        self._n_buf = 0
+        self._algs: Dict[str, int] = {}
+        # tramo abierto: [t, n, pid, alg] (se extiende mientras no haya eventos)
+        self._tramo: Optional[list] = None
+
+    def escribir(self, resumen: Dict[str, Any]):
+        fin = resumen.get("finalizados") or []
+        if fin:
+            self._cerrar_tramo()
+            self._registro(resumen["t"], 1, resumen.get("pid"), resumen.get("alg", ""), fin)
+        else:
+            self.escribir_tramo(resumen["t"], 1, resumen.get("pid"), resumen.get("alg", ""))
+
+    def escribir_tramo(self, t: int, n: int, pid: Optional[int], alg: str,
+                       pids: Optional[List[Optional[int]]] = None):
+        tr = self._tramo
+        if tr is not None and tr[2] == pid and tr[3] == alg and tr[0] + tr[1] == t and tr[1] + n <= 0xFFFFFFFF:
+            tr[1] += n
+            return
+        self._cerrar_tramo()
+        self._tramo = [t, n, pid, alg]
+
+    def _cerrar_tramo(self):
+        if self._tramo is not None:
+            t, n, pid, alg = self._tramo
+            self._tramo = None
+            self._registro(t, n, pid, alg, ())
+
+    def _registro(self, t, n, pid, alg, finalizados):
+        cod = self._algs.get(alg)
+        if cod is None:
+            cod = self._algs[alg] = len(self._algs)
+            nombre = alg.encode("utf-8")[:255]
+            self._buf += _ALG.pack(_T_ALG, cod, len(nombre)) + nombre
+        self._buf += _TRAMO.pack(_T_TRAMO, t, n, -1 if pid is None else pid, cod, len(finalizados))
+        for p in finalizados:
+            self._buf += _PID.pack(p)
+        self._n_buf += 1
+        if self._n_buf >= self._tam_flush:
+            self._volcar()
+
+    def _volcar(self):
+        if self._buf:
+            self._f.write(self._buf)
+            self._buf = bytearray()
+        self._n_buf = 0
+
+    def flush(self):
+        self._cerrar_tramo()
+        self._volcar()
+        self._f.flush()
+
+    def cerrar(self):
+        self.flush()
+        if self._propio:
+            self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+def leer_traza(ruta: str) -> Iterator[Dict[str, Any]]:
+    """Reproduce una traza (JSONL o binaria) como resúmenes por tick, en orden."""
+    with open(ruta, "rb") as f:
+        binaria = f.read(len(MAGIA)) == MAGIA
+    if binaria:
+        yield from _leer_binaria(ruta)
+        return
+    with open(ruta, encoding="utf-8") as f:
+        for linea in f:
+            if linea.strip():
+                yield json.loads(linea)
+
+
+def _leer_binaria(ruta: str) -> Iterator[Dict[str, Any]]:
+    algs: Dict[int, str] = {}
+    with open(ruta, "rb") as f:
+        f.read(len(MAGIA))
+        while True:
+            tipo = f.read(1)
+            if not tipo:
+                return
+            if tipo[0] == _T_ALG:
+                _, cod, largo = _ALG.unpack(tipo + f.read(_ALG.size - 1))
+                algs[cod] = f.read(largo).decode("utf-8")
+                continue
+            _, t, n, pid, cod, n_fin = _TRAMO.unpack(tipo + f.read(_TRAMO.size - 1))
+            fin = [_PID.unpack(f.read(_PID.size))[0] for _ in range(n_fin)]
+            pid = None if pid == -1 else pid
+            alg = algs.get(cod, "")
+            for i in range(n):
+                yield {"t": t + i, "pid": pid, "finalizados": fin if i == n - 1 else [], "alg": alg}
@@ -0,0 +1,60 @@
+import random
+
+from algoritmos.estrategias import nombres_estrategias
+from logica.gestor_memoria import GestorMemoria
+from logica.planificador import Planificador
+
+SEMILLAS = range(12)
+
+
+def _carga(semilla):
+    """Lista de (nombre, cpu, llegada, campos opcionales) reproducible por semilla."""
+    r = random.Random(semilla)
+    return [(f"P{i}", r.randint(1, 9), r.randint(0, 30),
+             {"peso": r.randint(1, 5), "nice": r.randint(-5, 5),
+              "prioridad": r.randint(0, 4), "deadline": r.randint(5, 40)})
+            for i in range(r.randint(1, 20))]
+
+
+def _resultado(plan):
+    return [(p.pid, p.nombre, p.t_inicio, p.t_fin, p.espera, p.respuesta, p.deadline)
+            for p in plan.obtener_procesos()]
+
+
+def test_almacen_compacto_igual_a_objetos():
+    for semilla in SEMILLAS:
+        carga = _carga(semilla)
+        for alg in nombres_estrategias():
+            planes = []
+            for compacto in (False, True):
+                plan = Planificador(GestorMemoria(1024), compacto=compacto)
+                plan.set_algoritmo(alg)
+                for nombre, cpu, llegada, extras in carga:
+                    plan.agregar_proceso(nombre, cpu, llegada, **extras)
+                plan.ejecutar_hasta_fin()
+                planes.append(plan)
+            objetos, compacto = planes
+            assert _resultado(compacto) == _resultado(objetos), (semilla, alg)
+            assert compacto.obtener_metricas() == objetos.obtener_metricas(), (semilla, alg)
+
+
+def test_almacen_compacto_alta_masiva():
+    # columnas opcionales y deadline faltante (None) en el alta masiva
+    carga = _carga(3)
+    columnas = {campo: [extras[campo] for *_, extras in carga] for campo in ("peso", "nice", "prioridad")}
+    columnas["deadline"] = [None if i % 3 == 0 else extras["deadline"] for i, (*_, extras) in enumerate(carga)]
+    planes = []
+    for compacto in (False, True):
+        plan = Planificador(GestorMemoria(1024), compacto=compacto)
+        plan.set_algoritmo("EDF")
+        plan.agregar_procesos_bulk([fila[:3] for fila in carga], **columnas)
+        plan.ejecutar_hasta_fin()
+        planes.append(plan)
+    objetos, compacto = planes
+    assert _resultado(compacto) == _resultado(objetos)
+    assert [p.deadline for p in compacto.obtener_procesos()][0] is None
+
+
+if __name__ == "__main__":
+    test_almacen_compacto_igual_a_objetos()
+    test_almacen_compacto_alta_masiva()
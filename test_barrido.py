@@ -0,0 +1,42 @@
+import random
+
+import pytest
+
+from logica.barrido import barrer, configuraciones, formatear_tabla, main
+
+
+def _carga(semilla):
+    r = random.Random(semilla)
+    return [(f"P{i}", r.randint(1, 9), r.randint(0, 30)) for i in range(30)]
+
+
+def test_configuraciones_barre_quantum_solo_si_importa():
+    confs = configuraciones(["rr", "cfs", "fcfs"], [1, 2, 3], [512])
+    assert confs == [("RR", 1, 512), ("RR", 2, 512), ("RR", 3, 512), ("CFS", None, 512), ("FCFS", None, 512)]
+
+
+def test_configuraciones_rechaza_desconocidas():
+    with pytest.raises(ValueError, match="NOEXISTE"):
+        configuraciones(["FCFS", "noexiste"], [2], [1024])
+
+
+def test_barrido_no_depende_de_workers():
+    carga = _carga(1)
+    args = (["FCFS", "SJF", "RR", "MLFQ", "CFS"], [1, 2, 4], [256, 1024])
+    secuencial = barrer(carga, *args, workers=1)
+    en_paralelo = barrer(carga, *args, workers=3)
+    assert en_paralelo == secuencial
+    assert len(secuencial) == 2 * (2 + 3 + 3 + 1)
+
+
+def test_cli(tmp_path, capsys):
+    ruta = tmp_path / "carga.csv"
+    ruta.write_text("nombre,cpu,llegada\n" + "".join(f"{n},{c},{ll}\n" for n, c, ll in _carga(2)))
+    main([str(ruta), "--alg", "rr", "prioridad_exp", "--quantum", "1-2", "--workers", "1"])
+    lineas = capsys.readouterr().out.splitlines()
+    assert len(lineas) == 2 + 3
+    # la columna ALG se ajusta al nombre más largo
+    assert lineas[-1].startswith("PRIORIDAD_EXP   -")
+    assert formatear_tabla(barrer(_carga(2), ["RR"], [2], workers=1)).splitlines()[2].startswith("RR    2")
+    with pytest.raises(SystemExit):
+        main([str(ruta), "--alg", "noexiste"])
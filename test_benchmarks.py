@@ -0,0 +1,16 @@
+import pytest
+
+from benchmarks import suite
+
+
+def test_alg_desconocido_se_rechaza(capsys):
+    with pytest.raises(SystemExit):
+        suite.main(["--n", "10", "--alg", "NOEXISTE"])
+    assert "invalid choice" in capsys.readouterr().err
+
+
+def test_alg_en_minusculas(monkeypatch):
+    pedidos = []
+    monkeypatch.setattr(suite, "correr_suite", lambda t, d, algoritmos, o, progreso: pedidos.append(algoritmos) or {})
+    assert suite.main(["--n", "10", "--alg", "rr", " cfs"]) == 0
+    assert pedidos == [["RR", "CFS"]]
@@ -0,0 +1,98 @@
+import json
+
+import numpy as np
+import pytest
+
+from logica.carga import carga_con_extras, columnas_carga
+from logica.gestor_memoria import GestorMemoria
+from logica.planificador import Planificador
+
+CSV = """nombre,cpu,llegada,peso,nice,prioridad,deadline,memoria
+A,3,0,2,-5,1,10,64
+B,2,4,,3,0,,
+C,4,1,5,,2,6,128
+"""
+
+
+def _campos(plan):
+    return [(p.nombre, p.instante_llegada, p.cpu_total, p.peso, p.nice, p.prioridad, p.deadline, p.memoria)
+            for p in plan.obtener_procesos()]
+
+
+ESPERADO = [
+    ("A", 0, 3, 2, -5, 1, 10, 64),
+    ("B", 4, 2, 1, 3, 0, None, 0),     # celdas vacías: valores por defecto del PCB
+    ("C", 1, 4, 5, 0, 2, 7, 128),      # deadline relativo a la llegada
+]
+
+
+def test_csv_y_jsonl_llevan_columnas_opcionales(tmp_path):
+    csv_ruta = tmp_path / "carga.csv"
+    csv_ruta.write_text(CSV)
+    jsonl_ruta = tmp_path / "carga.jsonl"
+    filas = [{"nombre": "A", "cpu": 3, "llegada": 0, "peso": 2, "nice": -5, "prioridad": 1, "deadline": 10, "memoria": 64},
+             {"nombre": "B", "cpu": 2, "llegada": 4, "nice": 3, "prioridad": 0},
+             {"nombre": "C", "cpu": 4, "llegada": 1, "peso": 5, "prioridad": 2, "deadline": 6, "memoria": 128}]
+    jsonl_ruta.write_text("".join(json.dumps(f) + "\n" for f in filas))
+    for ruta in (csv_ruta, jsonl_ruta):
+        for compacto in (False, True):
+            plan = Planificador(GestorMemoria(1024), compacto=compacto)
+            assert plan.agregar_procesos_bulk(str(ruta)) == 3
+            assert _campos(plan) == ESPERADO, (ruta.suffix, compacto)
+
+
+def test_columnas_explicitas_tienen_prioridad(tmp_path):
+    ruta = tmp_path / "carga.csv"
+    ruta.write_text(CSV)
+    plan = Planificador(GestorMemoria(1024))
+    plan.agregar_procesos_bulk(str(ruta), prioridad=[7, 8, 9])
+    assert [p.prioridad for p in plan.obtener_procesos()] == [7, 8, 9]
+    assert [p.peso for p in plan.obtener_procesos()] == [2, 1, 5]
+
+
+def test_formatos_en_memoria():
+    nombres, cpu, llegada, extras = carga_con_extras({"cpu": [1, 2], "llegada": [0, 3], "nice": [-1, 4]})
+    assert (nombres, cpu, llegada, extras) == (None, [1, 2], [0, 3], {"nice": [-1, 4]})
+    arr = np.zeros(2, dtype=[("cpu", "i8"), ("llegada", "i8"), ("peso", "i8")])
+    arr["cpu"], arr["peso"] = [5, 6], [3, 1]
+    assert carga_con_extras(arr)[3] == {"peso": [3, 1]}
+    assert columnas_carga([("x", 1, 2)]) == (["x"], [1], [2])
+    assert columnas_carga(np.array([[4, 0], [2, 1]]))[1].tolist() == [4, 2]
+
+
+@pytest.mark.parametrize("datos, mensaje", [
+    ({"cpu": [1, -2, "x"], "llegada": [0, 0, 0]}, "2 valor(es) inválido(s) en 'cpu'"),
+    ({"cpu": [1], "llegada": [0.5]}, "'llegada'"),
+    ({"cpu": [1, 2]}, "columnas 'cpu' y 'llegada'"),
+    ({"cpu": [1, 2], "llegada": [0]}, "distinta longitud"),
+    ({"cpu": [1], "llegada": [0], "nice": ["alto"]}, "'nice' (se esperan enteros)"),
+    ({"cpu": [1], "llegada": [0], "peso": [1, 2]}, "'peso' tiene distinta longitud"),
+    ([("x", 1)], "fila 0"),
+    (np.array([[1, -1]]), "'llegada'"),
+])
+def test_errores_de_validacion(datos, mensaje):
+    with pytest.raises(ValueError) as e:
+        columnas_carga(datos)
+    assert mensaje in str(e.value)
+
+
+def test_formato_no_soportado_y_alta_sin_cambios(tmp_path):
+    ruta = tmp_path / "carga.txt"
+    ruta.write_text("cpu,llegada\n1,0\n")
+    plan = Planificador(GestorMemoria(1024))
+    with pytest.raises(ValueError, match="no soportado"):
+        plan.agregar_procesos_bulk(str(ruta))
+    # una carga inválida no da de alta nada
+    with pytest.raises(ValueError):
+        plan.agregar_procesos_bulk({"cpu": [1, -1], "llegada": [0, 0]})
+    with pytest.raises(ValueError, match="no es un campo opcional"):
+        plan.agregar_procesos_bulk({"cpu": [1], "llegada": [0]}, vruntime=[3])
+    assert plan.cantidad_procesos() == 0
+
+
+def test_iter_procesos_pagina():
+    plan = Planificador(GestorMemoria(1024), compacto=True)
+    plan.agregar_procesos_bulk({"cpu": [1] * 1000, "llegada": list(range(1000))})
+    assert plan.cantidad_procesos() == 1000
+    assert [p.pid for p in plan.iter_procesos(0, 3)] == [1, 2, 3]
+    assert [p.pid for p in plan.iter_procesos(998, 500)] == [999, 1000]
@@ -0,0 +1,106 @@
+import random
+
+from logica.colas import ColaHeap
+from logica.gestor_memoria import GestorMemoria
+from logica.planificador import Planificador
+
+SEMILLAS = range(12)
+
+
+def _carga(semilla):
+    """Lista de (nombre, cpu, llegada) reproducible por semilla."""
+    r = random.Random(semilla)
+    return [(f"P{i}", r.randint(1, 9), r.randint(0, 30)) for i in range(r.randint(1, 20))]
+
+
+def _referencia_lineal(carga, alg, quantum=2):
+    """
+    El _tick original, con la cola de listos como lista y min() en cada
+    selección (FCFS, SJF, SRTF y RR). Devuelve {nombre: t_fin}.
+    """
+    procs = [{"pid": i + 1, "nombre": n, "cpu": c, "llegada": ll, "resta": c}
+             for i, (n, c, ll) in enumerate(carga)]
+    nuevos, ready, fin = list(procs), [], {}
+    running = pendiente = None
+    q_left, t = 0, 0
+    clave = {"FCFS": lambda p: (p["llegada"], p["pid"]),
+             "SJF": lambda p: (p["cpu"], p["llegada"], p["pid"]),
+             "SRTF": lambda p: (p["resta"], p["llegada"], p["pid"])}
+    while running or ready or nuevos or pendiente:
+        for p in [p for p in nuevos if p["llegada"] <= t]:
+            nuevos.remove(p)
+            ready.append(p)
+        if pendiente is not None:
+            ready.append(pendiente)
+            pendiente = None
+        if alg == "SRTF" and running and ready:
+            mejor = min(ready, key=clave["SRTF"])
+            if mejor["resta"] < running["resta"]:
+                ready.append(running)
+                ready.remove(mejor)
+                running = mejor
+        if running is None and ready:
+            running = ready[0] if alg == "RR" else min(ready, key=clave[alg])
+            ready.remove(running)
+            q_left = quantum
+        if running:
+            running["resta"] -= 1
+            q_left -= 1
+            if running["resta"] <= 0:
+                fin[running["nombre"]] = t + 1
+                running = None
+            elif alg == "RR" and q_left <= 0:
+                pendiente, running = running, None
+        t += 1
+    return fin
+
+
+def test_colas_indexadas_igual_a_busqueda_lineal():
+    for semilla in SEMILLAS:
+        carga = _carga(semilla)
+        for alg in ("FCFS", "SJF", "SRTF", "RR"):
+            plan = Planificador(GestorMemoria(1024))
+            plan.set_algoritmo(alg)
+            plan.set_quantum(2)
+            plan.agregar_procesos_bulk(carga)
+            plan.ejecutar_hasta_fin()
+            fin = {p.nombre: p.t_fin for p in plan.obtener_procesos()}
+            assert fin == _referencia_lineal(carga, alg), (semilla, alg)
+
+
+def test_listado_del_heap_sigue_los_cambios():
+    # el orden de encolado se cachea: cada push/extend/pop debe verse en el listado
+    r = random.Random(3)
+    cola, referencia = ColaHeap(lambda p: (p, p)), []
+    for _ in range(300):
+        op = r.random()
+        if op < 0.4 or not referencia:
+            p = r.randint(0, 50)
+            cola.push(p)
+            referencia.append(p)
+        elif op < 0.5:
+            ps = [r.randint(0, 50) for _ in range(r.randint(0, 4))]
+            cola.extend(ps)
+            referencia.extend(ps)
+        else:
+            referencia.remove(cola.pop())
+        assert list(cola) == referencia
+        assert [p for _, p in cola.pares()] == referencia
+        assert list(cola) == referencia   # segunda lectura, de la vista guardada
+
+
+def test_estado_cpu_lista_los_listos():
+    plan = Planificador(GestorMemoria(1024))
+    plan.set_algoritmo("SJF")
+    plan.agregar_procesos_bulk([("A", 5, 0), ("B", 3, 1), ("C", 1, 1), ("D", 2, 3)])
+    vistos = []
+    while not plan.esta_terminado():
+        plan.tick()
+        vistos.append([e["nombre"] for e in plan.estado_cpu()["ready"]])
+    assert vistos[:7] == [[], ["B", "C"], ["B", "C"], ["B", "C", "D"], ["B", "C", "D"], ["B", "D"], ["B"]]
+
+
+if __name__ == "__main__":
+    test_colas_indexadas_igual_a_busqueda_lineal()
+    test_listado_del_heap_sigue_los_cambios()
+    test_estado_cpu_lista_los_listos()
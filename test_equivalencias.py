@@ -0,0 +1,79 @@
+import random
+
+from algoritmos.estrategias import nombres_estrategias
+from logica.gestor_memoria import GestorMemoria
+from logica.planificador import Planificador
+
+SEMILLAS = range(12)
+
+
+def _carga(semilla):
+    """Lista de (nombre, cpu, llegada, campos opcionales) reproducible por semilla."""
+    r = random.Random(semilla)
+    return [(f"P{i}", r.randint(1, 9), r.randint(0, 30),
+             {"peso": r.randint(1, 5), "nice": r.randint(-5, 5),
+              "prioridad": r.randint(0, 4), "deadline": r.randint(5, 40)})
+            for i in range(r.randint(1, 20))]
+
+
+def _planificador(carga, alg, quantum=2):
+    plan = Planificador(GestorMemoria(1024))
+    plan.set_algoritmo(alg)
+    plan.set_quantum(quantum)
+    for nombre, cpu, llegada, extras in carga:
+        plan.agregar_proceso(nombre, cpu, llegada, **extras)
+    return plan
+
+
+def _por_tick(plan):
+    """Corre tick a tick y devuelve {t: pid} de los ticks con CPU ocupada."""
+    historial = {}
+    while not plan.esta_terminado():
+        r = plan.tick()
+        if r["pid"] is not None:
+            historial[r["t"]] = r["pid"]
+    return historial
+
+
+def _expandir(segmentos):
+    return {t: pid for pid, a, b in segmentos for t in range(a, b)}
+
+
+def _resultado(plan):
+    return [(p.pid, p.t_inicio, p.t_fin, p.espera, p.respuesta) for p in plan.obtener_procesos()]
+
+
+def test_modo_eventos_igual_a_tick():
+    for semilla in SEMILLAS:
+        carga = _carga(semilla)
+        for alg in nombres_estrategias():
+            por_tick = _planificador(carga, alg)
+            historial = _por_tick(por_tick)
+            eventos = _planificador(carga, alg)
+            t = eventos.ejecutar_hasta_fin()
+            assert t == por_tick.estado_cpu()["t"], (semilla, alg)
+            assert _expandir(eventos.segmentos()) == historial, (semilla, alg)
+            assert _resultado(eventos) == _resultado(por_tick), (semilla, alg)
+
+
+def test_avanzar_hasta_por_partes_igual_a_tick():
+    # cortar el salto por eventos en límites arbitrarios no cambia nada
+    for semilla in SEMILLAS:
+        carga = _carga(semilla)
+        r = random.Random(semilla)
+        for alg in nombres_estrategias():
+            quantum = r.randint(1, 4)
+            por_tick = _planificador(carga, alg, quantum)
+            historial = _por_tick(por_tick)
+            eventos = _planificador(carga, alg, quantum)
+            t = 0
+            while not eventos.esta_terminado():
+                t += r.randint(1, 7)
+                assert eventos.avanzar_hasta(t) == t
+            assert _expandir(eventos.segmentos()) == historial, (semilla, alg)
+            assert _resultado(eventos) == _resultado(por_tick), (semilla, alg)
+
+
+if __name__ == "__main__":
+    test_modo_eventos_igual_a_tick()
+    test_avanzar_hasta_por_partes_igual_a_tick()
@@ -0,0 +1,124 @@
+from logica.gestor_memoria import GestorMemoria
+from logica.planificador import Planificador
+
+
+def _correr(alg, procesos, quantum=2, **parametros):
+    """procesos: (nombre, cpu, llegada, {campos opcionales}). Devuelve (segmentos, {nombre: t_fin})."""
+    plan = Planificador(GestorMemoria(1024))
+    plan.set_algoritmo(alg)
+    plan.set_quantum(quantum)
+    if parametros:
+        plan.configurar_estrategia(alg, **parametros)
+    for nombre, cpu, llegada, extras in procesos:
+        plan.agregar_proceso(nombre, cpu, llegada, **extras)
+    plan.ejecutar_hasta_fin()
+    return list(plan.segmentos()), {p.nombre: p.t_fin for p in plan.obtener_procesos()}
+
+
+def test_mlfq_baja_de_nivel_y_expropia():
+    # quantums 2, 4, 8: A agota el del nivel 0 en t=2 y baja; B llega en t=3
+    # al nivel 0 y desaloja a A, que vuelve al frente del nivel 1
+    segs, fin = _correr("MLFQ", [("A", 7, 0, {}), ("B", 3, 3, {})])
+    assert segs == [(1, 0, 3), (2, 3, 5), (1, 5, 9), (2, 9, 10)]
+    assert fin == {"A": 9, "B": 10}
+
+
+def test_mlfq_boost():
+    # en t=4 A sube al nivel 0: en t=5 corre un quantum de 2 y baja detrás de B
+    segs, fin = _correr("MLFQ", [("A", 7, 0, {}), ("B", 3, 3, {})], periodo_boost=4)
+    assert segs == [(1, 0, 3), (2, 3, 5), (1, 5, 7), (2, 7, 8), (1, 8, 10)]
+    assert fin == {"A": 10, "B": 8}
+
+
+def test_stride_reparte_por_peso():
+    # paso A = 2**19 (peso 2), paso B = 2**20 (peso 1): A corre dos quantums
+    # por cada uno de B; con pases iguales desempata el pid
+    segs, fin = _correr("STRIDE", [("A", 4, 0, {"peso": 2}), ("B", 4, 0, {"peso": 1})], quantum=1)
+    assert segs == [(1, 0, 2), (2, 2, 3), (1, 3, 5), (2, 5, 8)]
+    assert fin == {"A": 5, "B": 8}
+
+
+def test_loteria_reproducible_y_proporcional():
+    carga = [("A", 400, 0, {"peso": 3}), ("B", 400, 0, {"peso": 1})]
+    segs, _ = _correr("LOTERIA", carga, quantum=1, semilla=7)
+    assert _correr("LOTERIA", carga, quantum=1, semilla=7)[0] == segs
+    assert _correr("LOTERIA", carga, quantum=1, semilla=8)[0] != segs
+    # con 3 boletos contra 1, A gana cerca de 3/4 de los primeros 200 sorteos
+    de_a = sum(min(b, 200) - a for pid, a, b in segs if pid == 1 and a < 200)
+    assert 130 <= de_a <= 170
+
+
+def test_cfs_reparte_por_nice():
+    # latencia 6: A (nice 0, peso 1024) tiene turno 6*1024//1359 = 4 y B
+    # (nice 5, peso 335) 1; B suma 3130 de vruntime por tick y A 1024
+    segs, fin = _correr("CFS", [("A", 6, 0, {}), ("B", 6, 0, {"nice": 5})], latencia=6, granularidad_min=1)
+    assert segs == [(1, 0, 4), (2, 4, 6), (1, 6, 8), (2, 8, 12)]
+    assert fin == {"A": 8, "B": 12}
+
+
+def test_cfs_alta_masiva_igual_a_alta_individual():
+    # C llega con la corrida en curso: en ambos caminos su vruntime sube a
+    # min_vruntime y no acapara la CPU
+    fines = []
+    for masiva in (False, True):
+        plan = Planificador(GestorMemoria(1024))
+        plan.set_algoritmo("CFS")
+        plan.agregar_proceso("A", 40, 0)
+        plan.agregar_proceso("B", 40, 0)
+        plan.avanzar_hasta(30)
+        if masiva:
+            plan.agregar_procesos_bulk([("C", 40, 30)])
+        else:
+            plan.agregar_proceso("C", 40, 30)
+        plan.ejecutar_hasta_fin()
+        fines.append({p.nombre: p.t_fin for p in plan.obtener_procesos()})
+    assert fines[0] == fines[1] == {"A": 100, "B": 104, "C": 120}
+
+
+def test_edf_expropia_y_cuenta_plazos():
+    # plazos absolutos: A 5, B 4, C 5, D sin plazo (va al final).
+    # B desaloja a A en t=1; en t=3 empatan A y C y gana el pid menor
+    plan = Planificador(GestorMemoria(1024))
+    plan.set_algoritmo("EDF")
+    plan.agregar_proceso("A", 4, 0, deadline=5)
+    plan.agregar_proceso("B", 2, 1, deadline=3)
+    plan.agregar_proceso("C", 1, 2, deadline=3)
+    plan.agregar_proceso("D", 1, 0)
+    plan.ejecutar_hasta_fin()
+    assert list(plan.segmentos()) == [(1, 0, 1), (2, 1, 3), (1, 3, 6), (3, 6, 7), (4, 7, 8)]
+    assert list(plan.filas_plazos()) == [(1, "A", 5, 6, 1, 1, True),
+                                         (2, "B", 4, 3, -1, 0, False),
+                                         (3, "C", 5, 7, 2, 2, True)]
+    resumen = plan.resumen_plazos()
+    assert (resumen["con_plazo"], resumen["vencidos"], resumen["max_tardanza"]) == (3, 2, 2)
+
+
+def test_edf_periodica():
+    # 3 trabajos cada 5 ticks con plazo = período; cada uno desaloja a L
+    # (plazo 20) al llegar, y L corre en los huecos 2-5 y 7-10
+    plan = Planificador(GestorMemoria(1024))
+    plan.set_algoritmo("EDF")
+    plan.agregar_proceso("T", 2, 0, periodo=5, repeticiones=3)
+    plan.agregar_proceso("L", 6, 0, deadline=20)
+    plan.ejecutar_hasta_fin()
+    assert [(p.nombre, p.deadline, p.t_fin) for p in plan.obtener_procesos()] == [
+        ("T#0", 5, 2), ("T#1", 10, 7), ("T#2", 15, 12), ("L", 20, 10)]
+
+
+def test_prioridad_no_expropiativa_y_expropiativa():
+    # envejecimiento 10: claves A 0+3*10=30, B 1+0=1, C 2+10=12
+    carga = [("A", 5, 0, {"prioridad": 3}), ("B", 2, 1, {"prioridad": 0}), ("C", 2, 2, {"prioridad": 1})]
+    segs, fin = _correr("PRIORIDAD", carga)
+    assert segs == [(1, 0, 5), (2, 5, 7), (3, 7, 9)]
+    segs, fin = _correr("PRIORIDAD_EXP", carga)
+    assert segs == [(1, 0, 1), (2, 1, 3), (3, 3, 5), (1, 5, 9)]
+    assert fin == {"A": 9, "B": 3, "C": 5}
+
+
+def test_prioridad_envejecimiento():
+    # D (prioridad 2, llega en 1) espera desde antes que E (prioridad 0,
+    # llega en 25): con envejecimiento 10 su clave 21 gana a 25; sin
+    # envejecimiento manda la prioridad
+    carga = [("F", 30, 0, {}), ("D", 1, 1, {"prioridad": 2}), ("E", 1, 25, {})]
+    assert _correr("PRIORIDAD", carga)[1] == {"F": 30, "D": 31, "E": 32}
+    assert _correr("PRIORIDAD", carga, envejecimiento=0)[1] == {"F": 30, "D": 32, "E": 31}
@@ -0,0 +1,79 @@
+import random
+from types import SimpleNamespace
+
+from algoritmos.fifo import AlgoritmoFIFO
+
+
+def _procesos(semilla):
+    r = random.Random(semilla)
+    procesos = []
+    for i in range(r.randint(1, 20)):
+        cpu = r.randint(1, 9)
+        procesos.append(SimpleNamespace(id=i + 1, nombre=f"P{i}", llegada=r.randint(0, 40), duracion=cpu, restante=cpu))
+    return procesos
+
+
+def _registro():
+    reg = {"cambios": [], "fines": [], "ticks": {}}
+    callbacks = {
+        "on_context_switch": lambda t, prev, nxt: reg["cambios"].append((t, nxt.id)),
+        "on_finish": lambda t, p: reg["fines"].append((t, p.id)),
+    }
+    return reg, callbacks
+
+
+def _por_tick(procesos):
+    reg, cb = _registro()
+    fifo = AlgoritmoFIFO(on_tick=lambda t, p: reg["ticks"].__setitem__(t, p and p.id), **cb)
+    t = 0
+    while len(fifo.finished_ids) < len(procesos):
+        fifo.push_arrivals(t, [p for p in procesos if p.llegada == t])
+        fifo.tick(t)
+        t += 1
+    return reg
+
+
+def _por_tramos(procesos):
+    reg, cb = _registro()
+    def on_segment(inicio, fin, p):
+        for t in range(inicio, fin):
+            reg["ticks"][t] = p and p.id
+    fifo = AlgoritmoFIFO(on_segment=on_segment, **cb)
+    pendientes = sorted(procesos, key=lambda p: p.llegada)
+    t = i = 0
+    while len(fifo.finished_ids) < len(procesos):
+        j = i
+        while j < len(pendientes) and pendientes[j].llegada <= t:
+            j += 1
+        fifo.push_arrivals(t, pendientes[i:j])
+        i = j
+        fin = fifo.correr_tramo(t)
+        if fin == t:
+            fifo.ocioso(t, pendientes[i].llegada)
+            fin = pendientes[i].llegada
+        t = fin
+    return reg
+
+
+def test_tramos_igual_a_expandir_por_tick():
+    for semilla in range(30):
+        tick = _por_tick(_procesos(semilla))
+        tramos = _por_tramos(_procesos(semilla))
+        assert tramos == tick, semilla
+
+
+def test_tramo_uno_por_proceso():
+    tramos = []
+    fifo = AlgoritmoFIFO(on_segment=lambda a, b, p: tramos.append((a, b, p and p.nombre)))
+    fifo.push_arrivals(0, [SimpleNamespace(id=2, nombre="B", llegada=0, duracion=2, restante=2),
+                           SimpleNamespace(id=1, nombre="A", llegada=0, duracion=3, restante=3)])
+    t = fifo.correr_tramo(0)
+    t = fifo.correr_tramo(t)
+    fifo.ocioso(t, 8)
+    assert fifo.correr_tramo(8) == 8
+    assert tramos == [(0, 3, "A"), (3, 5, "B"), (5, 8, None)]
+
+
+if __name__ == "__main__":
+    test_tramos_igual_a_expandir_por_tick()
+    test_tramo_uno_por_proceso()
@@ -0,0 +1,49 @@
+import numpy as np
+
+from logica.generador import alimentar, generar
+from logica.gestor_memoria import GestorMemoria
+from logica.planificador import Planificador
+
+PARAMETROS = [
+    {"llegadas": "poisson", "cpu": "exponencial"},
+    {"llegadas": "rafagas", "cpu": "bimodal"},
+    {"llegadas": "poisson", "cpu": "lognormal", "tasa": 0.5},
+]
+
+
+def _unir(bloques):
+    bloques = list(bloques)
+    return {k: np.concatenate([b[k] for b in bloques]) for k in ("cpu", "llegada", "memoria")}
+
+
+def _resultado(plan):
+    return [(p.pid, p.memoria, p.t_inicio, p.t_fin, p.espera) for p in plan.obtener_procesos()]
+
+
+def test_mismos_bytes_con_cualquier_bloque():
+    for parametros in PARAMETROS:
+        entero = _unir(generar(5000, semilla=3, capacidad=300, **parametros))
+        for bloque in (1, 7, 1000, 4999):
+            partido = _unir(generar(5000, semilla=3, capacidad=300, bloque=bloque, **parametros))
+            for k in entero:
+                assert entero[k].tobytes() == partido[k].tobytes(), (parametros, bloque, k)
+        assert entero["cpu"].min() >= 1 and 1 <= entero["memoria"].min() <= entero["memoria"].max() <= 300
+        assert (np.diff(entero["llegada"]) >= 0).all()
+
+
+def test_alimentar_igual_a_alta_de_una_vez():
+    for parametros in PARAMETROS:
+        for alg in ("FCFS", "RR", "SRTF"):
+            una_vez = Planificador(GestorMemoria(1024), compacto=True)
+            una_vez.set_algoritmo(alg)
+            una_vez.agregar_procesos_bulk(_unir(generar(3000, semilla=5, capacidad=1024, **parametros)))
+            t = una_vez.ejecutar_hasta_fin()
+            por_bloques = Planificador(GestorMemoria(1024), compacto=True)
+            por_bloques.set_algoritmo(alg)
+            assert alimentar(por_bloques, generar(3000, semilla=5, capacidad=1024, bloque=256, **parametros)) == t
+            assert _resultado(por_bloques) == _resultado(una_vez), (parametros, alg)
+
+
+if __name__ == "__main__":
+    test_mismos_bytes_con_cualquier_bloque()
+    test_alimentar_igual_a_alta_de_una_vez()
@@ -0,0 +1,58 @@
+import random
+
+from algoritmos.estrategias import nombres_estrategias
+from logica.gestor_memoria import GestorMemoria
+from logica.linea_tiempo import LineaTiempo
+from logica.planificador import Planificador
+
+SEMILLAS = range(12)
+
+
+def _carga(semilla):
+    """Lista de (nombre, cpu, llegada, campos opcionales) reproducible por semilla."""
+    r = random.Random(semilla)
+    return [(f"P{i}", r.randint(1, 9), r.randint(0, 30),
+             {"peso": r.randint(1, 5), "nice": r.randint(-5, 5),
+              "prioridad": r.randint(0, 4), "deadline": r.randint(5, 40)})
+            for i in range(r.randint(1, 20))]
+
+
+def _expandir(segmentos):
+    return {t: pid for pid, a, b in segmentos for t in range(a, b)}
+
+
+def test_linea_tiempo_funde_y_recorta():
+    linea = LineaTiempo()
+    for pid, t in ((1, 0), (1, 1), (2, 2), (2, 3), (1, 6)):
+        linea.registrar(pid, t)
+    linea.registrar(1, 7, 3)
+    assert list(linea) == [(1, 0, 2), (2, 2, 4), (1, 6, 10)]
+    assert list(linea.segmentos(1, 7)) == [(1, 1, 2), (2, 2, 4), (1, 6, 7)]
+    assert [linea.quien_en(t) for t in (0, 3, 4, 5, 9, 10)] == [1, 2, None, None, 1, None]
+    assert linea.tramos_de(1) == [(0, 2), (6, 10)]
+    assert list(LineaTiempo.desde_estado(linea.estado())) == list(linea)
+
+
+def test_linea_tiempo_igual_a_historial_por_tick():
+    for semilla in SEMILLAS:
+        carga = _carga(semilla)
+        for alg in nombres_estrategias():
+            plan = Planificador(GestorMemoria(1024))
+            plan.set_algoritmo(alg)
+            for nombre, cpu, llegada, extras in carga:
+                plan.agregar_proceso(nombre, cpu, llegada, **extras)
+            historial = {}
+            while not plan.esta_terminado():
+                r = plan.tick()
+                if r["pid"] is not None:
+                    historial[r["t"]] = r["pid"]
+            assert _expandir(plan.segmentos()) == historial, (semilla, alg)
+            for t in range(plan.estado_cpu()["t"] + 1):
+                assert plan.quien_en(t) == historial.get(t), (semilla, alg, t)
+            # una ventana recortada da los mismos ticks que el historial
+            assert _expandir(plan.segmentos(5, 20)) == {t: pid for t, pid in historial.items() if 5 <= t < 20}
+
+
+if __name__ == "__main__":
+    test_linea_tiempo_funde_y_recorta()
+    test_linea_tiempo_igual_a_historial_por_tick()
@@ -0,0 +1,52 @@
+import random
+
+import numpy as np
+import pytest
+
+from logica.gestor_memoria import GestorMemoria
+from logica.motor_batch import planificar_batch
+from logica.planificador import Planificador
+
+
+def _carga(semilla):
+    """(llegadas, ráfagas) con ráfagas de 0 (ocupan un tick como en el planificador)."""
+    r = random.Random(semilla)
+    n = r.randint(1, 40)
+    return [r.randint(0, 50) for _ in range(n)], [r.randint(0, 9) for _ in range(n)]
+
+
+def test_batch_igual_a_planificador():
+    for semilla in range(40):
+        llegadas, rafagas = _carga(semilla)
+        for alg in ("FCFS", "SJF"):
+            plan = Planificador(GestorMemoria(1024))
+            plan.set_algoritmo(alg)
+            for i, (ll, cpu) in enumerate(zip(llegadas, rafagas)):
+                plan.agregar_proceso(f"P{i}", cpu, ll)
+            plan.ejecutar_hasta_fin()
+            res = planificar_batch(llegadas, rafagas, alg)
+
+            filas, prom = plan.obtener_metricas()
+            for campo, col in (("t_fin", 4), ("retorno", 5), ("espera", 6), ("respuesta", 7)):
+                assert res[campo].tolist() == [f[col] for f in filas], (semilla, alg, campo)
+                assert round(float(np.mean(res[campo])), 2) == prom[col], (semilla, alg, campo)
+            assert res["t_inicio"].tolist() == [p.t_inicio for p in plan.obtener_procesos()], (semilla, alg)
+
+
+def test_batch_rafagas_cero():
+    # dos trabajos de ráfaga 0 y uno que llega tarde: cada 0 ocupa un tick
+    res = planificar_batch([0, 0, 5], [0, 3, 0], "FCFS")
+    assert res["t_inicio"].tolist() == [0, 1, 5]
+    assert res["t_fin"].tolist() == [1, 4, 6]
+    assert res["espera"].tolist() == [1, 1, 1]
+
+
+def test_batch_rechaza_expropiativos():
+    with pytest.raises(ValueError):
+        planificar_batch([0], [1], "RR")
+
+
+if __name__ == "__main__":
+    test_batch_igual_a_planificador()
+    test_batch_rafagas_cero()
+    test_batch_rechaza_expropiativos()
@@ -0,0 +1,130 @@
+import io
+import json
+import random
+
+from algoritmos.estrategias import nombres_estrategias
+from logica.gestor_memoria import GestorMemoria
+from logica.planificador import Planificador
+from logica.planificador_multinucleo import PlanificadorMultinucleo
+from logica.traza import TrazaJSONL
+
+SEMILLAS = range(12)
+
+
+class TrazaLista:
+    """Sumidero de traza en memoria (misma interfaz que logica/traza.py)."""
+
+    def __init__(self):
+        self.ticks = []
+
+    def escribir(self, resumen):
+        self.ticks.append({k: v for k, v in resumen.items() if k != "pids"})
+
+    def escribir_tramo(self, t, n, pid, alg, pids=None):
+        self.ticks.extend({"t": t + i, "pid": pid, "finalizados": [], "alg": alg} for i in range(n))
+
+
+def _carga(semilla):
+    """Lista de (nombre, cpu, llegada, campos opcionales) reproducible por semilla."""
+    r = random.Random(semilla)
+    return [(f"P{i}", r.randint(1, 9), r.randint(0, 30),
+             {"peso": r.randint(1, 5), "nice": r.randint(-5, 5),
+              "prioridad": r.randint(0, 4), "deadline": r.randint(5, 40)})
+            for i in range(r.randint(1, 20))]
+
+
+def _planificador(carga, alg, clase=Planificador, **kw):
+    plan = clase(GestorMemoria(1024), **kw)
+    plan.set_algoritmo(alg)
+    plan.set_quantum(2)
+    for nombre, cpu, llegada, extras in carga:
+        plan.agregar_proceso(nombre, cpu, llegada, **extras)
+    return plan
+
+
+def _resultado(plan):
+    return [(p.pid, p.t_inicio, p.t_fin, p.espera, p.respuesta) for p in plan.obtener_procesos()]
+
+
+def test_multinucleo_un_nucleo_igual_a_planificador():
+    for semilla in SEMILLAS:
+        carga = _carga(semilla)
+        for alg in nombres_estrategias():
+            simple = _planificador(carga, alg)
+            traza_simple = TrazaLista()
+            simple.set_traza(traza_simple)
+            simple.ejecutar_hasta_fin()
+            multi = _planificador(carga, alg, PlanificadorMultinucleo, num_cpus=1)
+            traza_multi = TrazaLista()
+            multi.set_traza(traza_multi)
+            multi.ejecutar_hasta_fin()
+            assert _resultado(multi) == _resultado(simple), (semilla, alg)
+            assert list(multi.segmentos()) == list(simple.segmentos()), (semilla, alg)
+            assert multi.obtener_metricas() == simple.obtener_metricas(), (semilla, alg)
+            assert traza_multi.ticks == traza_simple.ticks, (semilla, alg)
+
+
+def test_multinucleo_snapshot_restore_ida_y_vuelta():
+    kw = {"num_cpus": 3, "periodo_balanceo": 4, "costo_migracion": 1}
+    for semilla in SEMILLAS:
+        carga = _carga(semilla)
+        for alg in nombres_estrategias():
+            completo = _planificador(carga, alg, PlanificadorMultinucleo, **kw)
+            completo.ejecutar_hasta_fin()
+
+            plan = _planificador(carga, alg, PlanificadorMultinucleo, **kw)
+            plan.avanzar_hasta(7 + semilla)
+            snap = json.loads(json.dumps(plan.snapshot()))
+
+            otro = PlanificadorMultinucleo(GestorMemoria(1024), num_cpus=1)
+            otro.restore(snap)
+            otro.ejecutar_hasta_fin()
+            assert otro.num_cpus == 3
+            assert _resultado(otro) == _resultado(completo), (semilla, alg)
+            for i in range(3):
+                assert list(otro.segmentos(nucleo=i)) == list(completo.segmentos(nucleo=i)), (semilla, alg, i)
+
+
+def test_multinucleo_traza_por_nucleo():
+    plan = _planificador(_carga(4), "RR", PlanificadorMultinucleo, num_cpus=2)
+    trazas = [TrazaLista(), TrazaLista()]
+    plan.set_traza(trazas)
+    t = plan.ejecutar_hasta_fin()
+    for i, traza in enumerate(trazas):
+        assert [r["t"] for r in traza.ticks] == list(range(t))
+        ocupados = {r["t"]: r["pid"] for r in traza.ticks if r["pid"] is not None}
+        assert ocupados == {u: pid for pid, a, b in plan.segmentos(nucleo=i) for u in range(a, b)}
+    terminados = sorted(pid for traza in trazas for r in traza.ticks for pid in r["finalizados"])
+    assert terminados == [p.pid for p in plan.obtener_procesos()]
+
+
+def test_multinucleo_traza_salta_sin_recorrer_ticks():
+    # los ticks sin eventos van en una sola llamada a escribir_tramo
+    plan = PlanificadorMultinucleo(GestorMemoria(1024), num_cpus=2)
+    plan.agregar_proceso("A", 100000, 0)
+    plan.agregar_proceso("B", 5, 0)
+    traza = TrazaLista()
+    llamadas = []
+    traza.escribir_tramo = lambda t, n, pid, alg, pids=None: llamadas.append((t, n, pid, pids))
+    plan.set_traza(traza)
+    plan.ejecutar_hasta_fin()
+    assert llamadas == [(0, 4, 1, [1, 2]), (5, 99994, 1, [1, None])]
+    assert len(traza.ticks) == 2
+
+    # en JSONL cada tick del tramo lleva también 'pids'
+    plan.reiniciar()
+    buf = io.StringIO()
+    jsonl = TrazaJSONL(buf)
+    plan.set_traza(jsonl)
+    plan.avanzar_hasta(8)
+    jsonl.flush()
+    lineas = [json.loads(x) for x in buf.getvalue().splitlines()]
+    assert [x["t"] for x in lineas] == list(range(8))
+    assert [x["pids"] for x in lineas] == [[1, 2]] * 5 + [[1, None]] * 3
+
+
+if __name__ == "__main__":
+    test_multinucleo_un_nucleo_igual_a_planificador()
+    test_multinucleo_snapshot_restore_ida_y_vuelta()
+    test_multinucleo_traza_por_nucleo()
+    test_multinucleo_traza_salta_sin_recorrer_ticks()
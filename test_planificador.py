@@ -2,26 +2,29 @@ from logica.gestor_memoria import GestorMemoria
 from logica.planificador import Planificador
 from logica.proceso import Proceso
 
-print("=== INICIO DE PRUEBA DEL PLANIFICADOR ===")
 
-gestor = GestorMemoria(1024)
-plan = Planificador(gestor)
+def test_planificador():
+    gestor = GestorMemoria(1024)
+    plan = Planificador(gestor)
 
-# Crear procesos de prueba
-p1 = Proceso("P1", duracion=5, llegada=0)
-p2 = Proceso("P2", duracion=3, llegada=1)
+    # Crear procesos de prueba
+    p1 = Proceso("P1", duracion=5, llegada=0)
+    p2 = Proceso("P2", duracion=3, llegada=1)
 
-plan.agregar_proceso(p1)
-plan.agregar_proceso(p2)
+    for p in (p1, p2):
+        plan.agregar_proceso(p.nombre, p.cpu_total, p.instante_llegada)
 
-# Simular un paso
-plan.iniciar()
-plan.simular_tick()
-plan.detener()
+    # Simular un paso
+    plan.simular_tick()
 
-print("Procesos en cola:")
-for p in plan.obtener_procesos():
-    print("  ->", p)
+    t = plan.estado_cpu()["t"]
+    assert t == 1
+    assert [p.cpu_restante for p in plan.obtener_procesos()] == [4, 3]
 
-print("Tiempo actual:", plan.tiempo_actual)
-print("=== FIN DE PRUEBA ===")
+    # FCFS hasta el final: P1 termina en 5 y P2 en 8
+    plan.ejecutar_hasta_fin()
+    assert [p.t_fin for p in plan.obtener_procesos()] == [5, 8]
+
+
+if __name__ == "__main__":
+    test_planificador()
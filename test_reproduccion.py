@@ -0,0 +1,65 @@
+import heapq
+import itertools
+
+from logica import reproduccion
+from logica.reproduccion import Reproduccion
+
+
+class RelojFalso:
+    """time.monotonic y un programar(ms, fn) al estilo de widget.after sobre un reloj simulado."""
+
+    def __init__(self):
+        self.ahora = 0.0
+        self._pendientes = []
+        self._seq = itertools.count()
+        self.demoras = {}   # n-ésima llamada programada -> segundos extra (mainloop ocupado)
+
+    def __call__(self):
+        return self.ahora
+
+    def programar(self, ms, fn):
+        n = next(self._seq)
+        heapq.heappush(self._pendientes, (self.ahora + ms / 1000 + self.demoras.get(n, 0.0), n, fn))
+
+    def correr(self):
+        while self._pendientes:
+            self.ahora, _, fn = heapq.heappop(self._pendientes)
+            fn()
+
+
+def _tramos(inicios, largo=1):
+    return [{"Proceso": f"P{i}", "Inicio": t, "Fin": t + largo} for i, t in enumerate(inicios)]
+
+
+def _reproducir(monkeypatch, tramos, reloj, **kw):
+    monkeypatch.setattr(reproduccion.time, "monotonic", reloj)
+    entregas = []
+    Reproduccion(tramos, [lambda tr: entregas.append(reloj.ahora)], **kw).iniciar_con_timer(reloj.programar)
+    reloj.correr()
+    return entregas
+
+
+def test_entrega_en_el_instante_previsto(monkeypatch):
+    # huecos de más de _MAX_ATRASO entre tramos no deben estirarse
+    assert _reproducir(monkeypatch, _tramos([0, 2, 4, 6], 2), RelojFalso()) == [0, 2, 4, 6]
+    assert _reproducir(monkeypatch, _tramos([0, 1, 5, 6, 20]), RelojFalso()) == [0, 1, 5, 6, 20]
+
+
+def test_velocidad_escala_los_huecos(monkeypatch):
+    entregas = _reproducir(monkeypatch, _tramos([0, 2, 4, 6], 2), RelojFalso(), velocidad=2.0)
+    assert entregas == [0, 1, 2, 3]
+
+
+def test_atraso_largo_sigue_desde_ahora(monkeypatch):
+    reloj = RelojFalso()
+    reloj.demoras[1] = 3.0   # la espera del segundo tramo llega 3 s tarde
+    entregas = _reproducir(monkeypatch, _tramos([0, 2, 4, 6], 2), reloj)
+    # no se entregan de golpe los atrasados: el resto mantiene sus huecos
+    assert entregas == [0, 5, 7, 9]
+
+
+def test_atraso_corto_se_recupera(monkeypatch):
+    reloj = RelojFalso()
+    reloj.demoras[1] = 0.5
+    entregas = _reproducir(monkeypatch, _tramos([0, 2, 4, 6], 2), reloj)
+    assert entregas == [0, 2.5, 4, 6]
@@ -0,0 +1,47 @@
+import random
+
+from algoritmos.round_robin import AlgoritmoRoundRobin
+from logica.proceso import Proceso
+
+
+def _procesos(semilla):
+    r = random.Random(semilla)
+    return [Proceso(f"P{i}", duracion=r.randint(1, 9), llegada=r.randint(0, 30)) for i in range(r.randint(1, 25))]
+
+
+def _estado(procesos):
+    return [(p.pid, p.cpu_restante, p.estado, p.t_inicio, p.t_fin, p.t_retorno) for p in procesos]
+
+
+def test_sin_copia_igual_a_copia():
+    for semilla in range(20):
+        procesos = _procesos(semilla)
+        antes = _estado(procesos)
+        for quantum in (1, 2, 5):
+            rr = AlgoritmoRoundRobin(quantum)
+            ticks_copia, ticks_sin = [], []
+            copia = rr.ejecutar(procesos, on_tick=lambda t, p, cola: ticks_copia.append((t, p.nombre, cola)))
+            sin = rr.ejecutar(procesos, on_tick=lambda t, p, cola: ticks_sin.append((t, p.nombre, cola)), copiar=False)
+            assert sin["grafico"] == copia["grafico"], (semilla, quantum)
+            assert ticks_sin == ticks_copia
+            assert [p.pid for p in sin["procesos"]] == [p.pid for p in copia["procesos"]]
+            assert sin["tiempos"] == {p.pid: (p.t_inicio, p.t_fin) for p in copia["procesos"]}
+            # copiar=True devuelve copias con las métricas; copiar=False, los originales
+            assert all(p not in procesos for p in copia["procesos"])
+            assert all(any(p is q for q in procesos) for p in sin["procesos"])
+        # ningún modo toca los procesos del llamador
+        assert _estado(procesos) == antes, semilla
+
+
+def test_sin_copia_con_huecos_y_empates():
+    # nadie en t=0, hueco entre 4 y 10, B y C llegan juntos (orden de entrada)
+    a, b, c = Proceso("A", duracion=2, llegada=2), Proceso("B", duracion=3, llegada=10), Proceso("C", duracion=1, llegada=10)
+    r = AlgoritmoRoundRobin(2).ejecutar([c, b, a], copiar=False)
+    assert [(g["Proceso"], g["Inicio"], g["Fin"]) for g in r["grafico"]] == [
+        ("A", 2, 4), ("C", 10, 11), ("B", 11, 13), ("B", 13, 14)]
+    assert r["tiempos"] == {a.pid: (2, 4), c.pid: (10, 11), b.pid: (11, 14)}
+
+
+if __name__ == "__main__":
+    test_sin_copia_igual_a_copia()
+    test_sin_copia_con_huecos_y_empates()
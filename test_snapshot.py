@@ -0,0 +1,66 @@
+import json
+import random
+
+from algoritmos.estrategias import nombres_estrategias
+from logica.gestor_memoria import GestorMemoria
+from logica.planificador import Planificador
+
+SEMILLAS = range(12)
+
+
+def _carga(semilla):
+    """Lista de (nombre, cpu, llegada, campos opcionales) reproducible por semilla."""
+    r = random.Random(semilla)
+    return [(f"P{i}", r.randint(1, 9), r.randint(0, 30),
+             {"peso": r.randint(1, 5), "nice": r.randint(-5, 5),
+              "prioridad": r.randint(0, 4), "deadline": r.randint(5, 40)})
+            for i in range(r.randint(1, 20))]
+
+
+def _planificador(carga, alg, compacto=False):
+    plan = Planificador(GestorMemoria(1024), compacto=compacto)
+    plan.set_algoritmo(alg)
+    plan.set_quantum(2)
+    for nombre, cpu, llegada, extras in carga:
+        plan.agregar_proceso(nombre, cpu, llegada, **extras)
+    return plan
+
+
+def _resultado(plan):
+    return [(p.pid, p.t_inicio, p.t_fin, p.espera, p.respuesta) for p in plan.obtener_procesos()]
+
+
+def test_snapshot_restore_ida_y_vuelta():
+    for semilla in SEMILLAS:
+        carga = _carga(semilla)
+        for alg in nombres_estrategias():
+            for compacto in (False, True):
+                completo = _planificador(carga, alg, compacto)
+                completo.ejecutar_hasta_fin()
+
+                plan = _planificador(carga, alg, compacto)
+                plan.avanzar_hasta(7 + semilla)
+                snap = json.loads(json.dumps(plan.snapshot()))
+                plan.ejecutar_hasta_fin()
+
+                otro = _planificador(carga, alg, compacto)
+                otro.restore(snap)
+                otro.ejecutar_hasta_fin()
+                assert _resultado(otro) == _resultado(completo), (semilla, alg, compacto)
+                assert list(otro.segmentos()) == list(completo.segmentos()), (semilla, alg, compacto)
+                assert otro.obtener_metricas() == completo.obtener_metricas(), (semilla, alg, compacto)
+
+
+def test_snapshot_en_archivo(tmp_path):
+    carga = _carga(5)
+    plan = _planificador(carga, "MLFQ")
+    plan.avanzar_hasta(10)
+    ruta = str(tmp_path / "snap.json")
+    plan.guardar_snapshot(ruta)
+    plan.ejecutar_hasta_fin()
+
+    otro = Planificador(GestorMemoria(1024))
+    otro.cargar_snapshot(ruta)
+    assert otro.estado_cpu()["t"] == 10
+    otro.ejecutar_hasta_fin()
+    assert _resultado(otro) == _resultado(plan)
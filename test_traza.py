@@ -0,0 +1,54 @@
+import random
+
+from logica.gestor_memoria import GestorMemoria
+from logica.planificador import Planificador
+from logica.traza import TrazaBinaria, TrazaJSONL, leer_traza
+
+
+def _planificador(alg):
+    r = random.Random(4)
+    plan = Planificador(GestorMemoria(1024))
+    plan.set_algoritmo(alg)
+    for i in range(15):
+        plan.agregar_proceso(f"P{i}", r.randint(1, 9), r.randint(0, 60))
+    return plan
+
+
+def _por_tick(alg):
+    plan = _planificador(alg)
+    resumenes = []
+    while not plan.esta_terminado():
+        resumenes.append(plan.tick())
+    return resumenes
+
+
+def test_traza_ida_y_vuelta(tmp_path):
+    for alg in ("FCFS", "SRTF", "RR", "MLFQ"):
+        esperado = _por_tick(alg)
+        for clase, ext in ((TrazaJSONL, "jsonl"), (TrazaBinaria, "bin")):
+            for modo in ("tick", "eventos"):
+                ruta = str(tmp_path / f"{alg}_{modo}.{ext}")
+                plan = _planificador(alg)
+                # tam_flush chico: también se prueba el volcado por partes
+                with clase(ruta, tam_flush=3) as traza:
+                    plan.set_traza(traza)
+                    if modo == "tick":
+                        while not plan.esta_terminado():
+                            plan.tick()
+                    else:
+                        plan.ejecutar_hasta_fin()
+                assert list(leer_traza(ruta)) == esperado, (alg, clase.__name__, modo)
+
+
+def test_traza_binaria_comprime_tramos(tmp_path):
+    # un proceso largo sin eventos intermedios: un registro de tramo + el del fin
+    plan = Planificador(GestorMemoria(1024))
+    plan.agregar_proceso("A", 100000, 0)
+    ruta = str(tmp_path / "largo.bin")
+    with TrazaBinaria(ruta) as traza:
+        plan.set_traza(traza)
+        plan.ejecutar_hasta_fin()
+    assert (tmp_path / "largo.bin").stat().st_size < 100
+    resumenes = list(leer_traza(ruta))
+    assert len(resumenes) == 100000
+    assert resumenes[-1] == {"t": 99999, "pid": 1, "finalizados": [1], "alg": "FCFS"}